@@ -0,0 +1,23 @@
+"""Add POD photo thumbnail URL
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("pods", sa.Column("photo_thumbnail_url", sa.String(500), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("pods", "photo_thumbnail_url")
@@ -0,0 +1,47 @@
+"""Job status event log
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+jobstatus = postgresql.ENUM(
+    "pending", "assigned", "picked_up", "in_transit", "delivered", "failed",
+    name="jobstatus", create_type=False,
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_status_events",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("job_id", sa.Uuid(), nullable=False),
+        sa.Column("from_status", jobstatus, nullable=True),
+        sa.Column("to_status", jobstatus, nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("source", sa.String(20), nullable=False),
+        sa.Column("driver_id", sa.Uuid(), nullable=True),
+        sa.Column("idempotency_key", sa.String(100), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["driver_id"], ["drivers.id"], ondelete="SET NULL"),
+        sa.UniqueConstraint("driver_id", "idempotency_key", name="uq_job_status_events_driver_key"),
+    )
+    op.create_index("ix_job_status_events_job_id", "job_status_events", ["job_id"])
+    op.create_index("ix_job_status_events_created_at", "job_status_events", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("job_status_events")
@@ -0,0 +1,42 @@
+"""Job search indexes (pg_trgm + tsvector)
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = [
+    ("ix_jobs_tracking_id_trgm", "jobs", "tracking_id"),
+    ("ix_jobs_pickup_address_trgm", "jobs", "pickup_address"),
+    ("ix_jobs_dropoff_address_trgm", "jobs", "dropoff_address"),
+    ("ix_customers_company_name_trgm", "customers", "company_name"),
+    ("ix_customers_contact_name_trgm", "customers", "contact_name"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name, table, [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+    op.execute(
+        "CREATE INDEX ix_jobs_description_fts ON jobs "
+        "USING gin (to_tsvector('simple', coalesce(description, '')))"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_description_fts", table_name="jobs")
+    for name, table, _column in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
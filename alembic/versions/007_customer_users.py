@@ -0,0 +1,36 @@
+"""Link users to customers; composite customer/created_at job index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("customer_id", sa.Uuid(), nullable=True))
+    op.create_foreign_key(
+        "fk_users_customer_id", "users", "customers", ["customer_id"], ["id"], ondelete="SET NULL",
+    )
+    op.create_index("ix_users_customer_id", "users", ["customer_id"])
+
+    # The composite index covers every query the single-column one served.
+    op.create_index("ix_jobs_customer_id_created_at", "jobs", ["customer_id", "created_at"])
+    op.drop_index("ix_jobs_customer_id", table_name="jobs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_jobs_customer_id", "jobs", ["customer_id"])
+    op.drop_index("ix_jobs_customer_id_created_at", table_name="jobs")
+
+    op.drop_index("ix_users_customer_id", table_name="users")
+    op.drop_constraint("fk_users_customer_id", "users", type_="foreignkey")
+    op.drop_column("users", "customer_id")
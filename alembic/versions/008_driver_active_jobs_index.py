@@ -0,0 +1,26 @@
+"""Partial index on jobs.driver_id for active jobs
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_jobs_driver_id_active", "jobs", ["driver_id"],
+        postgresql_where=sa.text("status IN ('assigned', 'picked_up', 'in_transit')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_driver_id_active", table_name="jobs")
@@ -0,0 +1,57 @@
+"""Archive table for terminal jobs, range-partitioned by created_at
+
+Partitioning ``jobs`` itself is not practical: PostgreSQL requires every
+unique constraint on a partitioned table to include the partition key, which
+rules out the unique ``tracking_id`` and the ``jobs.id`` foreign keys from
+pods, status events and the outbox. Instead terminal jobs are moved into this
+partitioned archive; ``src.jobs.archive`` creates a partition per month on
+demand.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+jobstatus = postgresql.ENUM(
+    "pending", "assigned", "picked_up", "in_transit", "delivered", "failed",
+    name="jobstatus", create_type=False,
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobs_archive",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("tracking_id", sa.String(20), nullable=False),
+        sa.Column("status", jobstatus, nullable=False),
+        sa.Column("customer_id", sa.Uuid(), nullable=False),
+        sa.Column("driver_id", sa.Uuid(), nullable=True),
+        sa.Column("pickup_address", sa.String(500), nullable=False),
+        sa.Column("dropoff_address", sa.String(500), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("special_instructions", sa.Text(), nullable=True),
+        sa.Column("pod", sa.JSON(), nullable=True),
+        sa.Column("history", sa.JSON(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("created_at", "id"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index("ix_jobs_archive_tracking_id", "jobs_archive", ["tracking_id"])
+    op.create_index("ix_jobs_archive_customer_id_created_at", "jobs_archive", ["customer_id", "created_at"])
+
+
+def downgrade() -> None:
+    # Dropping the parent drops every partition with it.
+    op.drop_table("jobs_archive")
@@ -0,0 +1,27 @@
+"""Pickup and dropoff coordinates on jobs
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("pickup_lat", "pickup_lng", "dropoff_lat", "dropoff_lng")
+
+
+def upgrade() -> None:
+    for name in _COLUMNS:
+        op.add_column("jobs", sa.Column(name, sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    for name in reversed(_COLUMNS):
+        op.drop_column("jobs", name)
@@ -0,0 +1,42 @@
+"""Driver last position and learned travel speeds for ETAs
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("drivers", sa.Column("last_lat", sa.Float(), nullable=True))
+    op.add_column("drivers", sa.Column("last_lng", sa.Float(), nullable=True))
+    op.add_column("drivers", sa.Column("last_position_at", sa.DateTime(timezone=True), nullable=True))
+
+    op.create_table(
+        "travel_speeds",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("vehicle_type", sa.String(100), nullable=False),
+        sa.Column("hour", sa.SmallInteger(), nullable=False),
+        sa.Column("distance_m", sa.Float(), nullable=False),
+        sa.Column("duration_s", sa.Float(), nullable=False),
+        sa.Column("samples", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("vehicle_type", "hour", name="uq_travel_speeds_vehicle_type_hour"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("travel_speeds")
+    op.drop_column("drivers", "last_position_at")
+    op.drop_column("drivers", "last_lng")
+    op.drop_column("drivers", "last_lat")
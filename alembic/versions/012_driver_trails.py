@@ -0,0 +1,56 @@
+"""Raw driver position fixes and hourly encoded trail chunks
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "driver_positions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("driver_id", sa.Uuid(), nullable=False),
+        sa.Column("lat", sa.Float(), nullable=False),
+        sa.Column("lng", sa.Float(), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("accuracy_m", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["driver_id"], ["drivers.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_driver_positions_driver_id_recorded_at", "driver_positions", ["driver_id", "recorded_at"],
+    )
+    op.create_index("ix_driver_positions_recorded_at", "driver_positions", ["recorded_at"])
+
+    op.create_table(
+        "driver_trail_chunks",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("driver_id", sa.Uuid(), nullable=False),
+        sa.Column("hour_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("point_count", sa.Integer(), nullable=False),
+        sa.Column("encoded", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["driver_id"], ["drivers.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("driver_id", "hour_start", name="uq_driver_trail_chunks_driver_hour"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("driver_trail_chunks")
+    op.drop_index("ix_driver_positions_recorded_at", table_name="driver_positions")
+    op.drop_index("ix_driver_positions_driver_id_recorded_at", table_name="driver_positions")
+    op.drop_table("driver_positions")
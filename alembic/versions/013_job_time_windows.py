@@ -0,0 +1,27 @@
+"""Pickup and delivery time windows on jobs
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("pickup_window_start", "pickup_window_end", "delivery_window_start", "delivery_window_end")
+
+
+def upgrade() -> None:
+    for name in _COLUMNS:
+        op.add_column("jobs", sa.Column(name, sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    for name in reversed(_COLUMNS):
+        op.drop_column("jobs", name)
@@ -0,0 +1,60 @@
+"""SLA thresholds per customer and recorded breaches
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+jobstatus = postgresql.ENUM(
+    "pending", "assigned", "picked_up", "in_transit", "delivered", "failed",
+    name="jobstatus", create_type=False,
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sla_thresholds",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("customer_id", sa.Uuid(), nullable=False),
+        sa.Column("status", jobstatus, nullable=False),
+        sa.Column("seconds", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["customer_id"], ["customers.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("customer_id", "status", name="uq_sla_thresholds_customer_status"),
+    )
+
+    op.create_table(
+        "sla_breaches",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("job_id", sa.Uuid(), nullable=False),
+        sa.Column("customer_id", sa.Uuid(), nullable=False),
+        sa.Column("tracking_id", sa.String(20), nullable=False),
+        sa.Column("status", jobstatus, nullable=False),
+        sa.Column("entered_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("threshold_seconds", sa.Integer(), nullable=False),
+        sa.Column("breached_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("job_id", "status", "entered_at", name="uq_sla_breaches_job_status_entered"),
+    )
+    op.create_index("ix_sla_breaches_breached_at", "sla_breaches", ["breached_at"])
+    op.create_index("ix_sla_breaches_customer_id_breached_at", "sla_breaches", ["customer_id", "breached_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("sla_breaches")
+    op.drop_table("sla_thresholds")
@@ -0,0 +1,36 @@
+"""Analytics export watermarks and updated_at indexes
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "export_watermarks",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index("ix_jobs_updated_at", "jobs", ["updated_at"])
+    op.create_index("ix_pods_updated_at", "pods", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pods_updated_at", table_name="pods")
+    op.drop_index("ix_jobs_updated_at", table_name="jobs")
+    op.drop_table("export_watermarks")
@@ -0,0 +1,26 @@
+"""Keep SLA breaches when their job is archived
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The cascade deleted a job's breach history when src.jobs.archive moved
+    # it to jobs_archive; breaches carry customer_id and tracking_id anyway.
+    op.drop_constraint("sla_breaches_job_id_fkey", "sla_breaches", type_="foreignkey")
+
+
+def downgrade() -> None:
+    op.create_foreign_key(
+        "sla_breaches_job_id_fkey", "sla_breaches", "jobs", ["job_id"], ["id"], ondelete="CASCADE",
+    )
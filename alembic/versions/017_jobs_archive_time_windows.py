@@ -0,0 +1,28 @@
+"""Carry job time windows into jobs_archive
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("pickup_window_start", "pickup_window_end", "delivery_window_start", "delivery_window_end")
+
+
+def upgrade() -> None:
+    # Added to the partitioned parent, so every monthly partition gets them.
+    for name in _COLUMNS:
+        op.add_column("jobs_archive", sa.Column(name, sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    for name in reversed(_COLUMNS):
+        op.drop_column("jobs_archive", name)
@@ -0,0 +1,28 @@
+"""Carry job coordinates into jobs_archive
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("pickup_lat", "pickup_lng", "dropoff_lat", "dropoff_lng")
+
+
+def upgrade() -> None:
+    # Added to the partitioned parent, so every monthly partition gets them.
+    for name in _COLUMNS:
+        op.add_column("jobs_archive", sa.Column(name, sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    for name in reversed(_COLUMNS):
+        op.drop_column("jobs_archive", name)
@@ -0,0 +1,66 @@
+"""Micro-benchmark: evaluating driver position fixes against geofences.
+
+Measures the in-memory part of POST /api/driver/positions (request parsing
+aside): each fix checked against the pickup and dropoff fences of a driver's
+active jobs, none of them firing, which is the steady state.
+
+    python -m benchmarks.bench_geofence --jobs 10 --fixes 1000 --iterations 50
+"""
+
+import argparse
+import json
+import random
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from src.drivers.geofence import Fence, JobFences, firing, radius_sq
+from src.models.job import JobStatus
+
+
+def _fences(count: int, rng: random.Random) -> tuple[JobFences, ...]:
+    since = datetime.now(timezone.utc) - timedelta(hours=1)
+    return tuple(
+        JobFences(
+            job_id=uuid.uuid4(),
+            status=rng.choice([JobStatus.ASSIGNED, JobStatus.IN_TRANSIT]),
+            updated_at=since,
+            pickup=Fence.around(51.5 + rng.uniform(-0.1, 0.1), -0.12 + rng.uniform(-0.1, 0.1)),
+            dropoff=Fence.around(51.5 + rng.uniform(-0.1, 0.1), -0.12 + rng.uniform(-0.1, 0.1)),
+        )
+        for _ in range(count)
+    )
+
+
+def main(jobs: int, fixes: int, iterations: int) -> dict:
+    rng = random.Random(7)
+    fences = _fences(jobs, rng)
+    statuses = {job.job_id: job.status for job in fences}
+    now = datetime.now(timezone.utc)
+    # A driver trace well away from every fence.
+    points = [(51.7 + i * 1e-5, 0.2) for i in range(fixes)]
+    enter_sq, exit_sq = radius_sq(75.0), radius_sq(150.0)
+
+    def evaluate() -> int:
+        fired = 0
+        for lat, lng in points:
+            for _ in firing(fences, statuses, lat, lng, now, enter_sq, exit_sq):
+                fired += 1
+        return fired
+
+    assert evaluate() == 0
+    seconds = min(timeit.repeat(evaluate, number=iterations, repeat=3)) / iterations
+    return {
+        "active_jobs": jobs,
+        "ms_per_batch": round(seconds * 1e3, 3),
+        "fixes_per_second": int(fixes / seconds),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=10)
+    parser.add_argument("--fixes", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(main(args.jobs, args.fixes, args.iterations), indent=2))
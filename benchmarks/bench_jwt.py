@@ -0,0 +1,47 @@
+"""Micro-benchmark: per-request JWT verification, before and after the verifier cache.
+
+    python -m benchmarks.bench_jwt --iterations 20000
+"""
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from jose import jwt
+
+from src.auth.tokens import TokenPayload, TokenVerifier
+
+
+def main(iterations: int) -> dict:
+    secret = "bench-secret"
+    verifier = TokenVerifier({"bench": secret}, "bench", "HS256")
+    claims = {"sub": "5f0c3f8e-4b39-4c7e-9d6a-2f3b5f0a1c2d", "role": "dispatcher",
+              "exp": datetime.now(timezone.utc) + timedelta(hours=1)}
+    token = verifier.sign(claims)
+
+    def baseline() -> TokenPayload:
+        return TokenPayload(**jwt.decode(token, secret, algorithms=["HS256"]))
+
+    def cold() -> TokenPayload:
+        verifier.clear_cache()
+        return verifier.verify(token)
+
+    def warm() -> TokenPayload:
+        return verifier.verify(token)
+
+    verifier.verify(token)
+    results = {}
+    for name, fn in (("jose_decode_plus_model", baseline), ("verifier_miss", cold), ("verifier_hit", warm)):
+        seconds = min(timeit.repeat(fn, number=iterations, repeat=3))
+        results[name] = {"us_per_call": round(seconds / iterations * 1e6, 3)}
+    results["speedup_hit_vs_baseline"] = round(
+        results["jose_decode_plus_model"]["us_per_call"] / results["verifier_hit"]["us_per_call"], 1,
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    print(json.dumps(main(parser.parse_args().iterations), indent=2))
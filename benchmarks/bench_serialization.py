@@ -0,0 +1,92 @@
+"""Micro-benchmark: encoding a page of jobs for GET /api/jobs.
+
+Compares FastAPI's default path (ORM objects -> ``JobRead`` per row ->
+``jsonable_encoder`` -> ``json.dumps``) with the one the route now uses
+(``Row`` tuples -> ``TypeAdapter(list[JobRead])`` -> ``dump_json``), plus
+orjson over ``model_dump`` output for reference.
+
+    python -m benchmarks.bench_serialization --rows 200 --iterations 500
+"""
+
+import argparse
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import Row, select
+from sqlalchemy.engine.cursor import SimpleResultMetaData
+from sqlalchemy.engine.result import IteratorResult
+
+from src.jobs.service import JOB_READ_COLUMNS
+from src.models.job import Job, JobStatus
+from src.schemas.job import JobRead
+
+
+def _jobs(count: int) -> list[Job]:
+    now = datetime.now(timezone.utc)
+    return [
+        Job(
+            id=uuid.uuid4(),
+            tracking_id=f"BENCH{i:07d}",
+            status=JobStatus.IN_TRANSIT,
+            customer_id=uuid.uuid4(),
+            driver_id=uuid.uuid4() if i % 3 else None,
+            pickup_address=f"{i} Pickup Street, London",
+            dropoff_address=f"{i} Dropoff Road, London",
+            description="Two boxes of documents" if i % 2 else None,
+            special_instructions=None,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def _rows(jobs: list[Job]) -> list[Row]:
+    """Real ``Row`` objects shaped like ``list_jobs`` results, without a database."""
+    names = [column.key for column in select(*JOB_READ_COLUMNS).selected_columns]
+    data = [tuple(getattr(job, name) for name in names) for job in jobs]
+    return list(IteratorResult(SimpleResultMetaData(names), iter(data)).all())
+
+
+def main(rows: int, iterations: int) -> dict:
+    jobs = _jobs(rows)
+    row_tuples = _rows(jobs)
+    adapter = TypeAdapter(list[JobRead])
+
+    def baseline() -> bytes:
+        models = [JobRead.model_validate(job) for job in jobs]
+        return json.dumps(jsonable_encoder(models)).encode()
+
+    def orjson_model_dump() -> bytes:
+        return orjson.dumps([JobRead.model_validate(row).model_dump() for row in row_tuples])
+
+    def type_adapter() -> bytes:
+        return adapter.dump_json(adapter.validate_python(row_tuples, from_attributes=True))
+
+    assert json.loads(baseline()) == json.loads(type_adapter())
+    results = {}
+    for name, fn in (
+        ("orm_jsonable_encoder_json", baseline),
+        ("rows_model_dump_orjson", orjson_model_dump),
+        ("rows_type_adapter_dump_json", type_adapter),
+    ):
+        seconds = min(timeit.repeat(fn, number=iterations, repeat=3))
+        results[name] = {"ms_per_page": round(seconds / iterations * 1e3, 3)}
+    results["speedup_vs_baseline"] = round(
+        results["orm_jsonable_encoder_json"]["ms_per_page"]
+        / results["rows_type_adapter_dump_json"]["ms_per_page"], 1,
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    print(json.dumps(main(args.rows, args.iterations), indent=2))
@@ -0,0 +1,155 @@
+"""Fast bulk seeder for benchmark databases.
+
+Rows are generated in batches and written with Core ``insert()`` executemany
+(multi-row VALUES); on PostgreSQL the jobs table is loaded with asyncpg's
+binary ``COPY``. The seeder returns samples of the generated IDs that the
+workload needs, without keeping millions of rows in memory.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.models import Base
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.job import Job, JobStatus
+from src.models.user import User, UserRole
+from src.tracking.ids import check_character
+
+BATCH_SIZE = 10_000
+SAMPLE_SIZE = 50_000
+
+STATUS_WEIGHTS = {
+    JobStatus.DELIVERED: 70,
+    JobStatus.FAILED: 5,
+    JobStatus.PENDING: 10,
+    JobStatus.ASSIGNED: 5,
+    JobStatus.PICKED_UP: 5,
+    JobStatus.IN_TRANSIT: 5,
+}
+
+STREETS = ["High St", "Station Rd", "Church Ln", "Mill Rd", "Park Ave", "Victoria Rd", "Green Ln", "Kings Rd"]
+TOWNS = ["Bristol", "Leeds", "Brighton", "York", "Bath", "Oxford", "Cambridge", "Norwich"]
+VEHICLES = ["bicycle", "cargo_bike", "e_bike", "van"]
+
+
+@dataclass
+class SeedResult:
+    admin_user_id: uuid.UUID
+    customer_ids: list[uuid.UUID]
+    driver_ids: list[uuid.UUID]
+    jobs_by_status: dict[JobStatus, list[uuid.UUID]] = field(default_factory=dict)
+    tracking_ids: list[str] = field(default_factory=list)
+
+
+def _address(rng: random.Random) -> str:
+    return f"{rng.randint(1, 400)} {rng.choice(STREETS)}, {rng.choice(TOWNS)}"
+
+
+async def _insert_batches(engine: AsyncEngine, model: type[Base], rows: list[dict]) -> None:
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), BATCH_SIZE):
+            await conn.execute(insert(model), rows[start:start + BATCH_SIZE])
+
+
+async def _copy_jobs(conn, rows: list[dict]) -> None:
+    raw = await conn.get_raw_connection()
+    columns = list(rows[0])
+    records = [
+        tuple(row[c].value if isinstance(row[c], JobStatus) else row[c] for c in columns) for row in rows
+    ]
+    await raw.driver_connection.copy_records_to_table("jobs", records=records, columns=columns)
+
+
+async def seed(
+    engine: AsyncEngine,
+    *,
+    jobs: int,
+    customers: int,
+    drivers: int,
+    seed_value: int = 42,
+) -> SeedResult:
+    rng = random.Random(seed_value)
+    now = datetime.now(timezone.utc)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    admin_id = uuid.uuid4()
+    user_rows = [{
+        "id": admin_id, "email": f"bench-admin-{admin_id.hex[:8]}@example.com", "hashed_password": "!",
+        "full_name": "Benchmark Admin", "role": UserRole.ADMIN, "is_active": True,
+        "created_at": now, "updated_at": now,
+    }]
+    driver_rows = []
+    for _ in range(drivers):
+        user_id = uuid.uuid4()
+        user_rows.append({
+            "id": user_id, "email": f"driver-{user_id.hex}@example.com", "hashed_password": "!",
+            "full_name": "Bench Driver", "role": UserRole.DRIVER, "is_active": True,
+            "created_at": now, "updated_at": now,
+        })
+        driver_rows.append({
+            "id": uuid.uuid4(), "user_id": user_id, "vehicle_type": rng.choice(VEHICLES),
+            "license_plate": None, "is_available": True, "created_at": now, "updated_at": now,
+        })
+    customer_rows = [
+        {
+            "id": uuid.uuid4(), "company_name": f"Customer {i} Ltd", "contact_name": f"Contact {i}",
+            "contact_email": f"customer-{uuid.uuid4().hex}@example.com", "contact_phone": None,
+            "created_at": now, "updated_at": now,
+        }
+        for i in range(customers)
+    ]
+    await _insert_batches(engine, User, user_rows)
+    await _insert_batches(engine, Driver, driver_rows)
+    await _insert_batches(engine, Customer, customer_rows)
+
+    result = SeedResult(
+        admin_user_id=admin_id,
+        customer_ids=[row["id"] for row in customer_rows],
+        driver_ids=[row["id"] for row in driver_rows],
+        jobs_by_status={status: [] for status in JobStatus},
+    )
+    statuses = list(STATUS_WEIGHTS)
+    weights = list(STATUS_WEIGHTS.values())
+    counter = rng.randrange(36 ** 8)
+
+    async with engine.begin() as conn:
+        use_copy = conn.dialect.name == "postgresql"
+        for start in range(0, jobs, BATCH_SIZE):
+            rows = []
+            for _ in range(min(BATCH_SIZE, jobs - start)):
+                status = rng.choices(statuses, weights)[0]
+                created = now - timedelta(seconds=rng.randint(0, 180 * 24 * 3600))
+                counter += 1
+                payload = f"B{counter:011X}"
+                row = {
+                    "id": uuid.uuid4(),
+                    "tracking_id": payload + check_character(payload),
+                    "status": status,
+                    "customer_id": rng.choice(result.customer_ids),
+                    "driver_id": None if status == JobStatus.PENDING else rng.choice(result.driver_ids),
+                    "pickup_address": _address(rng),
+                    "dropoff_address": _address(rng),
+                    "description": "Parcel" if rng.random() < 0.5 else None,
+                    "special_instructions": None,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+                rows.append(row)
+                pool = result.jobs_by_status[status]
+                if len(pool) < SAMPLE_SIZE:
+                    pool.append(row["id"])
+                if len(result.tracking_ids) < SAMPLE_SIZE:
+                    result.tracking_ids.append(row["tracking_id"])
+            if use_copy:
+                await _copy_jobs(conn, rows)
+            else:
+                await conn.execute(insert(Job), rows)
+    return result
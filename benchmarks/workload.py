@@ -0,0 +1,171 @@
+"""Mixed job-lifecycle workload and latency bookkeeping."""
+
+import asyncio
+import random
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import httpx
+
+from benchmarks.seed import SeedResult
+from src.models.job import JobStatus
+
+# Share of each operation in the mix; weights need not sum to 100.
+DEFAULT_MIX = {
+    "create_job": 10,
+    "list_jobs": 20,
+    "get_job": 10,
+    "assign_job": 8,
+    "transition_job": 12,
+    "tracking": 40,
+}
+
+NEXT_STATUS = {
+    JobStatus.ASSIGNED: JobStatus.PICKED_UP,
+    JobStatus.PICKED_UP: JobStatus.IN_TRANSIT,
+    JobStatus.IN_TRANSIT: JobStatus.DELIVERED,
+}
+
+# Populated by an engine event listener in in-process runs; one list per request.
+query_counter: ContextVar[list[int] | None] = ContextVar("query_counter", default=None)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed_s: float) -> dict:
+        ordered = sorted(self.latencies_ms)
+        return {
+            "requests": len(ordered),
+            "errors": self.errors,
+            "rps": round(len(ordered) / elapsed_s, 2) if elapsed_s else None,
+            "p50_ms": round(percentile(ordered, 50), 3),
+            "p95_ms": round(percentile(ordered, 95), 3),
+            "p99_ms": round(percentile(ordered, 99), 3),
+            "mean_ms": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+            "queries_per_request": round(sum(self.queries) / len(self.queries), 2) if self.queries else None,
+        }
+
+
+class Workload:
+    # Set by the runner when the app's SQL query counter is installed.
+    track_queries = False
+
+    def __init__(self, seeded: SeedResult, *, mix: dict[str, int] | None = None, seed_value: int = 7) -> None:
+        self.seeded = seeded
+        self.rng = random.Random(seed_value)
+        self.mix = mix or DEFAULT_MIX
+        self.pools: dict[JobStatus, list[uuid.UUID]] = {s: list(ids) for s, ids in seeded.jobs_by_status.items()}
+        self.stats: dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self._ops: dict[str, Callable] = {
+            "create_job": self._create_job,
+            "list_jobs": self._list_jobs,
+            "get_job": self._get_job,
+            "assign_job": self._assign_job,
+            "transition_job": self._transition_job,
+            "tracking": self._tracking,
+        }
+
+    def _take(self, status: JobStatus) -> uuid.UUID | None:
+        pool = self.pools[status]
+        if not pool:
+            return None
+        index = self.rng.randrange(len(pool))
+        pool[index], pool[-1] = pool[-1], pool[index]
+        return pool.pop()
+
+    async def _timed(self, name: str, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+        counter = [0]
+        token = query_counter.set(counter)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            query_counter.reset(token)
+        stats = self.stats[name]
+        stats.latencies_ms.append(elapsed)
+        if self.track_queries:
+            stats.queries.append(counter[0])
+        if response.status_code >= 400:
+            stats.errors += 1
+        return response
+
+    async def _create_job(self, client: httpx.AsyncClient) -> None:
+        response = await self._timed("create_job", client, "POST", "/api/jobs", json={
+            "customer_id": str(self.rng.choice(self.seeded.customer_ids)),
+            "pickup_address": f"{self.rng.randint(1, 400)} Bench St",
+            "dropoff_address": f"{self.rng.randint(1, 400)} Load Ave",
+            "description": "Benchmark parcel",
+        })
+        if response.status_code == 201:
+            body = response.json()
+            self.pools[JobStatus.PENDING].append(uuid.UUID(body["id"]))
+            self.seeded.tracking_ids.append(body["tracking_id"])
+
+    async def _list_jobs(self, client: httpx.AsyncClient) -> None:
+        params = {"limit": 50}
+        if self.rng.random() < 0.5:
+            params["status"] = self.rng.choice([s.value for s in JobStatus])
+        await self._timed("list_jobs", client, "GET", "/api/jobs", params=params)
+
+    async def _get_job(self, client: httpx.AsyncClient) -> None:
+        pool = self.pools[self.rng.choice(list(NEXT_STATUS))] or self.pools[JobStatus.PENDING]
+        if pool:
+            await self._timed("get_job", client, "GET", f"/api/jobs/{self.rng.choice(pool)}")
+
+    async def _assign_job(self, client: httpx.AsyncClient) -> None:
+        job_id = self._take(JobStatus.PENDING)
+        if job_id is None:
+            return
+        response = await self._timed("assign_job", client, "POST", f"/api/jobs/{job_id}/assign", json={
+            "driver_id": str(self.rng.choice(self.seeded.driver_ids)),
+        })
+        if response.status_code == 200:
+            self.pools[JobStatus.ASSIGNED].append(job_id)
+
+    async def _transition_job(self, client: httpx.AsyncClient) -> None:
+        current = self.rng.choice(list(NEXT_STATUS))
+        job_id = self._take(current)
+        if job_id is None:
+            return
+        target = NEXT_STATUS[current]
+        response = await self._timed(
+            "transition_job", client, "PATCH", f"/api/jobs/{job_id}", json={"status": target.value},
+        )
+        if response.status_code == 200 and target in NEXT_STATUS:
+            self.pools[target].append(job_id)
+
+    async def _tracking(self, client: httpx.AsyncClient) -> None:
+        tracking_id = self.rng.choice(self.seeded.tracking_ids)
+        await self._timed("tracking", client, "GET", f"/api/tracking/{tracking_id}")
+
+    async def run(self, client: httpx.AsyncClient, *, requests: int, concurrency: int) -> float:
+        names = list(self.mix)
+        weights = list(self.mix.values())
+        plan = self.rng.choices(names, weights, k=requests)
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for name in plan:
+            queue.put_nowait(name)
+
+        async def worker() -> None:
+            while not queue.empty():
+                await self._ops[queue.get_nowait()](client)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start
@@ -0,0 +1,243 @@
+"""Incremental Parquet export of jobs, status events and POD metadata.
+
+Each run exports, per table, the rows changed between the table's watermark
+in ``export_watermarks`` and the start of the run (less
+``export_lag_seconds``), then advances the watermark. Rows are streamed with
+a server-side cursor in ``export_batch_size`` batches, converted to Arrow
+record batches and written as Parquet, one file per table, creation date and
+run:
+
+    jobs/date=2026-10-19/20261020T020000000000Z.parquet
+
+Files go to a :class:`~src.storage.blob.BlobStore` (a local directory under
+``export_root`` by default). A changed row is exported again in full, so the
+warehouse keeps the latest version per ``id`` by ``updated_at``; a run that
+fails before advancing a watermark is simply repeated by the next. Run it
+nightly from cron:
+
+    python -m src.analytics.export            # changes since the last run
+    python -m src.analytics.export --full     # everything, ignoring watermarks
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import uuid
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, DateTime, Enum, Float, Integer, Numeric, SmallInteger, Uuid, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.models.base import Base
+from src.models.export_watermark import ExportWatermark
+from src.models.job import Job
+from src.models.job_status_event import JobStatusEvent
+from src.models.pod import POD
+from src.storage.blob import BlobStore, LocalBlobStore
+from src.timeutils import as_utc
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    name: str
+    model: type[Base]
+    # Rows are selected by this column; status events are append-only, so
+    # their server-side creation time is enough.
+    changed_column: str = "updated_at"
+
+
+TABLES = (
+    ExportTable("jobs", Job),
+    ExportTable("job_status_events", JobStatusEvent, changed_column="created_at"),
+    ExportTable("pods", POD),
+)
+
+
+def _arrow_column(column) -> tuple[pa.DataType, Callable | None]:
+    """The Arrow type for a SQLAlchemy column and how to convert its values."""
+    column_type = column.type
+    if isinstance(column_type, Uuid):
+        return pa.string(), str
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC"), as_utc
+    if isinstance(column_type, Enum):
+        return pa.string(), lambda value: value.value
+    if isinstance(column_type, Boolean):
+        return pa.bool_(), None
+    if isinstance(column_type, (Integer, SmallInteger)):
+        return pa.int64(), None
+    if isinstance(column_type, Float):
+        return pa.float64(), None
+    if isinstance(column_type, Numeric):
+        return pa.decimal128(column_type.precision or 18, column_type.scale or 0), None
+    return pa.string(), None
+
+
+class _Converter:
+    """Turns batches of rows of one table into Arrow record batches."""
+
+    def __init__(self, model: type[Base]) -> None:
+        self.columns = list(model.__table__.columns)
+        fields, self._converters = [], []
+        for column in self.columns:
+            arrow_type, convert = _arrow_column(column)
+            fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+            self._converters.append(convert)
+        self.schema = pa.schema(fields)
+
+    def record_batch(self, rows: list) -> pa.RecordBatch:
+        arrays = []
+        for index, (field, convert) in enumerate(zip(self.schema, self._converters)):
+            values = [row[index] for row in rows]
+            if convert is not None:
+                values = [None if value is None else convert(value) for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+async def _file_chunks(path: Path) -> AsyncIterator[bytes]:
+    fh = await asyncio.to_thread(open, path, "rb")
+    try:
+        while chunk := await asyncio.to_thread(fh.read, _CHUNK_SIZE):
+            yield chunk
+    finally:
+        fh.close()
+
+
+async def get_watermark(db: AsyncSession, name: str) -> datetime | None:
+    result = await db.execute(select(ExportWatermark.watermark).where(ExportWatermark.name == name))
+    watermark = result.scalar_one_or_none()
+    return as_utc(watermark) if watermark is not None else None
+
+
+async def set_watermark(db: AsyncSession, name: str, watermark: datetime) -> None:
+    result = await db.execute(select(ExportWatermark).where(ExportWatermark.name == name))
+    row = result.scalar_one_or_none()
+    if row is None:
+        db.add(ExportWatermark(name=name, watermark=watermark))
+    else:
+        row.watermark = watermark
+    await db.flush()
+
+
+async def export_table(
+    db: AsyncSession,
+    store: BlobStore,
+    table: ExportTable,
+    *,
+    since: datetime | None,
+    until: datetime,
+    run_id: str,
+    batch_size: int,
+) -> tuple[int, list[str]]:
+    """Write the rows of ``table`` changed in ``[since, until)``; return the row count and keys written."""
+    converter = _Converter(table.model)
+    changed = table.model.__table__.c[table.changed_column]
+    created = table.model.__table__.c.created_at
+    query = select(*converter.columns).where(changed < until).order_by(created, table.model.__table__.c.id)
+    if since is not None:
+        query = query.where(changed >= since)
+    # yield_per streams through a server-side cursor on PostgreSQL.
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+
+    created_index = converter.columns.index(created)
+    rows_written = 0
+    keys: list[str] = []
+    with tempfile.TemporaryDirectory(prefix="export-") as tmp:
+        writer: pq.ParquetWriter | None = None
+        path: Path | None = None
+        partition: date | None = None
+
+        async def close_partition() -> None:
+            if writer is None:
+                return
+            await asyncio.to_thread(writer.close)
+            key = f"{table.name}/date={partition.isoformat()}/{run_id}.parquet"
+            await store.put(key, _file_chunks(path), content_type="application/vnd.apache.parquet")
+            await asyncio.to_thread(os.unlink, path)
+            keys.append(key)
+
+        async for batch in result.partitions():
+            # Split the batch by creation date; rows arrive in creation order,
+            # so each date's file is finished before the next one starts.
+            start = 0
+            while start < len(batch):
+                day = as_utc(batch[start][created_index]).date()
+                end = start
+                while end < len(batch) and as_utc(batch[end][created_index]).date() == day:
+                    end += 1
+                if day != partition:
+                    await close_partition()
+                    partition = day
+                    path = Path(tmp) / f"{uuid.uuid4().hex}.parquet"
+                    writer = await asyncio.to_thread(
+                        pq.ParquetWriter, path, converter.schema, compression=settings.export_compression,
+                    )
+                record_batch = converter.record_batch(batch[start:end])
+                await asyncio.to_thread(writer.write_batch, record_batch)
+                rows_written += end - start
+                start = end
+        await close_partition()
+    return rows_written, keys
+
+
+async def run_export(
+    session_factory: async_sessionmaker[AsyncSession],
+    store: BlobStore,
+    *,
+    full: bool = False,
+    batch_size: int | None = None,
+    now: datetime | None = None,
+) -> dict[str, int]:
+    """Export every table's changes since its watermark; return rows exported per table."""
+    until = (now or datetime.now(timezone.utc)) - timedelta(seconds=settings.export_lag_seconds)
+    run_id = until.strftime("%Y%m%dT%H%M%S%fZ")
+    exported: dict[str, int] = {}
+    for table in TABLES:
+        async with session_factory() as db:
+            since = None if full else await get_watermark(db, table.name)
+            if since is not None and since >= until:
+                exported[table.name] = 0
+                continue
+            rows, keys = await export_table(
+                db, store, table,
+                since=since, until=until, run_id=run_id,
+                batch_size=batch_size or settings.export_batch_size,
+            )
+            await set_watermark(db, table.name, until)
+            await db.commit()
+        exported[table.name] = rows
+        logger.info("Exported %d %s rows to %d files", rows, table.name, len(keys))
+    return exported
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from src.database import async_session_factory, engine
+
+    store = LocalBlobStore(args.dest or settings.export_root, base_url="")
+    try:
+        exported = await run_export(async_session_factory, store, full=args.full, batch_size=args.batch_size)
+        print(", ".join(f"{rows} {name}" for name, rows in exported.items()) + " exported")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Export changed jobs, status events and PODs as Parquet.")
+    parser.add_argument("--dest", default=None, help="default: COURIER_EXPORT_ROOT")
+    parser.add_argument("--full", action="store_true", help="export everything, ignoring watermarks")
+    parser.add_argument("--batch-size", type=int, default=None, help="default: COURIER_EXPORT_BATCH_SIZE")
+    asyncio.run(_main(parser.parse_args()))
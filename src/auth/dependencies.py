@@ -1,34 +1,47 @@
 import uuid as _uuid
+from dataclasses import dataclass
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from pydantic import BaseModel
+from jose import JWTError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
-from src.config import settings
+from src.auth.revocation import revocation_list, user_token_id
+from src.auth.tokens import token_verifier
 from src.database import get_db
+from src.models.driver import Driver
 from src.models.user import User, UserRole
 
 bearer_scheme = HTTPBearer()
 
 
-class TokenPayload(BaseModel):
-    sub: str
-    role: str
+@dataclass(frozen=True)
+class Principal:
+    """The caller as described by a verified, unrevoked access token."""
 
+    id: _uuid.UUID
+    role: UserRole
+    session_id: str | None = None
 
-async def get_current_user(
+
+async def get_current_principal(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(bearer_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    token = credentials.credentials
+) -> Principal:
+    """Authenticate from the token alone; no database round trip.
+
+    Deactivated users and logged-out sessions are rejected via the in-memory
+    revocation list.
+    """
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        token_data = TokenPayload(**payload)
-        user_id = _uuid.UUID(token_data.sub)
+        token_data = token_verifier.verify(credentials.credentials)
+        principal = Principal(
+            id=_uuid.UUID(token_data.sub),
+            role=UserRole(token_data.role),
+            session_id=token_data.sid,
+        )
     except (JWTError, KeyError, ValueError) as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -36,7 +49,23 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         ) from exc
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    if revocation_list.is_revoked(user_token_id(principal.id), token_data.iat) or (
+        principal.session_id is not None and revocation_list.is_revoked(principal.session_id, token_data.iat)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
+
+
+async def get_current_user(
+    principal: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """Load the full ``User`` row for endpoints that need more than the token claims."""
+    result = await db.execute(select(User).where(User.id == principal.id))
     user = result.scalar_one_or_none()
     if user is None or not user.is_active:
         raise HTTPException(
@@ -50,8 +79,8 @@ def require_roles(*allowed_roles: UserRole):
     """Dependency factory that restricts access to users with specific roles."""
 
     async def _check(
-        current_user: Annotated[User, Depends(get_current_user)],
-    ) -> User:
+        current_user: Annotated[Principal, Depends(get_current_principal)],
+    ) -> Principal:
         if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -60,3 +89,35 @@ def require_roles(*allowed_roles: UserRole):
         return current_user
 
     return _check
+
+
+async def get_current_driver(
+    current_user: Annotated[Principal, Depends(require_roles(UserRole.DRIVER))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Driver:
+    """Resolve the driver profile of an authenticated driver user."""
+    result = await db.execute(
+        select(Driver).where(Driver.user_id == current_user.id).options(lazyload("*"))
+    )
+    driver = result.scalar_one_or_none()
+    if driver is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="No driver profile is linked to this user",
+        )
+    return driver
+
+
+async def get_current_customer_id(
+    current_user: Annotated[Principal, Depends(require_roles(UserRole.CUSTOMER))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> _uuid.UUID:
+    """Resolve the customer account linked to an authenticated customer user."""
+    result = await db.execute(select(User.customer_id).where(User.id == current_user.id))
+    customer_id = result.scalar_one_or_none()
+    if customer_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="No customer account is linked to this user",
+        )
+    return customer_id
@@ -0,0 +1,72 @@
+"""Password hashing off the event loop.
+
+bcrypt takes tens to hundreds of milliseconds per call by design. Calls run
+in a dedicated thread pool (the bcrypt C extension releases the GIL) behind a
+semaphore, so a burst of logins queues for a bounded time and then fails fast
+with ``PasswordHasherBusy`` instead of stalling every other request on the
+worker.
+"""
+
+import asyncio
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from src.auth.utils import pwd_context
+from src.config import settings
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when no hashing slot frees up within the acquire timeout."""
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        context: CryptContext,
+        *,
+        max_workers: int,
+        max_concurrency: int,
+        acquire_timeout: float,
+    ) -> None:
+        self.context = context
+        self.acquire_timeout = acquire_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._dummy_hash: str | None = None
+
+    async def _run(self, fn, *args):
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.acquire_timeout)
+        except TimeoutError as exc:
+            raise PasswordHasherBusy("Too many concurrent password checks") from exc
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        """Check ``password``; also return a new hash if ``hashed`` uses outdated parameters."""
+        return await self._run(self.context.verify_and_update, password, hashed)
+
+    async def burn(self, password: str) -> None:
+        """Spend the same work as a real check, for logins with an unknown account."""
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hash(secrets.token_urlsafe(16))
+        await self._run(self.context.verify, password, self._dummy_hash)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    pwd_context,
+    max_workers=settings.password_hash_workers,
+    max_concurrency=settings.password_hash_max_concurrency,
+    acquire_timeout=settings.password_hash_acquire_timeout_seconds,
+)
@@ -0,0 +1,168 @@
+"""In-memory token revocation list, synced incrementally from ``revoked_tokens``.
+
+Access tokens are checked against this structure instead of the database.
+Almost every lookup is for an id that was never revoked, so a Bloom filter
+answers those without touching the exact map; only probable hits consult the
+map of id -> revocation time. Each worker polls for rows created since its
+last sync (with a small overlap to cover transactions that committed late),
+so a revocation made on any worker takes effect everywhere within
+``revocation_sync_interval_seconds``. The worker that made it applies it
+locally as soon as its transaction commits, and drops it on rollback.
+"""
+
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.models.auth_session import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+_SYNC_OVERLAP = timedelta(seconds=30)
+_PENDING = "pending_revocations"
+
+
+class BloomFilter:
+    def __init__(self, size_bits: int, hashes: int) -> None:
+        self.size_bits = size_bits
+        self.hashes = hashes
+        self._bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def user_token_id(user_id: object) -> str:
+    return f"user:{user_id}"
+
+
+class RevocationList:
+    def __init__(self, size_bits: int = 1 << 20, hashes: int = 7) -> None:
+        self._size_bits = size_bits
+        self._hashes = hashes
+        self._bloom = BloomFilter(size_bits, hashes)
+        # token id -> (revoked_at, expires_at) as POSIX timestamps
+        self._exact: dict[str, tuple[float, float]] = {}
+        self._watermark: datetime | None = None
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def add(self, token_id: str, revoked_at: datetime, expires_at: datetime) -> None:
+        current = self._exact.get(token_id)
+        entry = (revoked_at.timestamp(), expires_at.timestamp())
+        if current is None or entry[0] > current[0]:
+            self._exact[token_id] = entry
+        self._bloom.add(token_id)
+
+    def add_on_commit(self, db: AsyncSession, token_id: str, revoked_at: datetime, expires_at: datetime) -> None:
+        """Apply the revocation locally once ``db``'s current transaction commits."""
+        db.sync_session.info.setdefault(_PENDING, []).append((token_id, revoked_at, expires_at))
+
+    def is_revoked(self, token_id: str, issued_at: int | None) -> bool:
+        """True if tokens for ``token_id`` issued at ``issued_at`` have been revoked."""
+        if token_id not in self._bloom:
+            return False
+        entry = self._exact.get(token_id)
+        if entry is None:
+            return False
+        return issued_at is None or issued_at <= entry[0]
+
+    def prune(self, now: datetime | None = None) -> None:
+        """Forget expired entries and rebuild the Bloom filter without them."""
+        cutoff = (now or datetime.now(timezone.utc)).timestamp()
+        expired = [token_id for token_id, (_, expires) in self._exact.items() if expires <= cutoff]
+        if not expired:
+            return
+        for token_id in expired:
+            del self._exact[token_id]
+        bloom = BloomFilter(self._size_bits, self._hashes)
+        for token_id in self._exact:
+            bloom.add(token_id)
+        self._bloom = bloom
+
+    def clear(self) -> None:
+        self._exact.clear()
+        self._bloom = BloomFilter(self._size_bits, self._hashes)
+        self._watermark = None
+
+    async def sync(self, db: AsyncSession) -> None:
+        """Load revocations created since the last sync."""
+        now = datetime.now(timezone.utc)
+        query = select(
+            RevokedToken.token_id, RevokedToken.revoked_at, RevokedToken.expires_at, RevokedToken.created_at,
+        )
+        if self._watermark is None:
+            query = query.where(RevokedToken.expires_at > now)
+        else:
+            query = query.where(RevokedToken.created_at > self._watermark - _SYNC_OVERLAP)
+        result = await db.execute(query)
+        for token_id, revoked_at, expires_at, created_at in result:
+            self.add(token_id, _aware(revoked_at), _aware(expires_at))
+            created_at = _aware(created_at)
+            if self._watermark is None or created_at > self._watermark:
+                self._watermark = created_at
+        if self._watermark is None:
+            self._watermark = now
+        self.prune(now)
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._task = asyncio.create_task(self._run(session_factory), name="revocation-sync")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.sync(db)
+                    await db.execute(
+                        delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(timezone.utc))
+                    )
+                    await db.commit()
+            except Exception:
+                logger.exception("Revocation list sync failed")
+            await asyncio.sleep(settings.revocation_sync_interval_seconds)
+
+
+def _aware(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+revocation_list = RevocationList()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session) -> None:
+    for token_id, revoked_at, expires_at in session.info.pop(_PENDING, ()):
+        revocation_list.add(token_id, revoked_at, expires_at)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING, None)
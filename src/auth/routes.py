@@ -0,0 +1,61 @@
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth import service
+from src.auth.dependencies import Principal, get_current_principal, require_roles
+from src.auth.utils import create_access_token
+from src.config import settings
+from src.database import get_db
+from src.models.user import UserRole
+from src.schemas.auth import LoginRequest, RefreshRequest, TokenResponse
+
+router = APIRouter(prefix="/api/auth", tags=["auth"])
+
+
+def _token_response(user, session, refresh_token: str) -> TokenResponse:
+    return TokenResponse(
+        access_token=create_access_token(str(user.id), user.role.value, session_id=str(session.id)),
+        refresh_token=refresh_token,
+        expires_in=settings.jwt_expire_minutes * 60,
+    )
+
+
+@router.post("/token", response_model=TokenResponse)
+async def login(
+    body: LoginRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    user = await service.authenticate(db, body.email, body.password)
+    session, refresh_token = await service.create_session(db, user)
+    return _token_response(user, session, refresh_token)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(
+    body: RefreshRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    user, session, refresh_token = await service.refresh_session(db, body.refresh_token)
+    return _token_response(user, session, refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    principal: Annotated[Principal, Depends(get_current_principal)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    session = await service.get_session(db, principal.session_id)
+    if session is not None and session.user_id == principal.id and session.revoked_at is None:
+        await service.revoke_session(db, session)
+
+
+@router.post("/users/{user_id}/deactivate", status_code=status.HTTP_204_NO_CONTENT)
+async def deactivate_user(
+    user_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: Annotated[Principal, Depends(require_roles(UserRole.ADMIN))],
+):
+    await service.deactivate_user(db, user_id)
@@ -0,0 +1,156 @@
+import hashlib
+import hmac
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.hashing import PasswordHasherBusy, password_hasher
+from src.auth.revocation import revocation_list, user_token_id
+from src.config import settings
+from src.models.auth_session import AuthSession, RevokedToken
+from src.models.user import User
+
+_INVALID_CREDENTIALS = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Incorrect email or password",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+async def authenticate(db: AsyncSession, email: str, password: str) -> User:
+    """Return the active user matching the credentials.
+
+    The bcrypt check runs in the hasher's thread pool. If the stored hash was
+    made with a different cost factor it is transparently replaced.
+    """
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalar_one_or_none()
+    try:
+        if user is None:
+            await password_hasher.burn(password)
+            raise _INVALID_CREDENTIALS
+        valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+    except PasswordHasherBusy as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, retry shortly",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except ValueError:
+        # Stored value is not a recognised hash (e.g. a disabled account marker).
+        raise _INVALID_CREDENTIALS from None
+
+    if not valid or not user.is_active:
+        raise _INVALID_CREDENTIALS
+    if new_hash is not None:
+        user.hashed_password = new_hash
+        await db.flush()
+    return user
+
+
+def _hash_secret(secret: str) -> str:
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+_INVALID_REFRESH = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid or expired refresh token",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+async def create_session(db: AsyncSession, user: User) -> tuple[AuthSession, str]:
+    """Open a login session and return it with its refresh token (``<sid>.<secret>``)."""
+    secret = secrets.token_urlsafe(32)
+    session = AuthSession(
+        id=uuid.uuid4(),
+        user_id=user.id,
+        refresh_token_hash=_hash_secret(secret),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days),
+    )
+    db.add(session)
+    await db.flush()
+    return session, f"{session.id}.{secret}"
+
+
+async def refresh_session(db: AsyncSession, refresh_token: str) -> tuple[User, AuthSession, str]:
+    """Rotate the refresh token of a live session.
+
+    Presenting a refresh token that has already been rotated away means it
+    leaked, so the whole session is revoked.
+    """
+    sid, _, secret = refresh_token.partition(".")
+    try:
+        session_id = uuid.UUID(sid)
+    except ValueError:
+        raise _INVALID_REFRESH from None
+    result = await db.execute(
+        select(AuthSession).where(AuthSession.id == session_id).with_for_update()
+    )
+    session = result.scalar_one_or_none()
+    now = datetime.now(timezone.utc)
+    if session is None or session.revoked_at is not None or _aware(session.expires_at) <= now:
+        raise _INVALID_REFRESH
+    if not hmac.compare_digest(session.refresh_token_hash, _hash_secret(secret)):
+        await revoke_session(db, session)
+        # Commit now: raising below makes ``get_db`` roll the request back.
+        await db.commit()
+        raise _INVALID_REFRESH
+
+    user = await db.get(User, session.user_id)
+    if user is None or not user.is_active:
+        raise _INVALID_REFRESH
+
+    new_secret = secrets.token_urlsafe(32)
+    session.refresh_token_hash = _hash_secret(new_secret)
+    await db.flush()
+    return user, session, f"{session.id}.{new_secret}"
+
+
+async def get_session(db: AsyncSession, session_id: str | None) -> AuthSession | None:
+    if session_id is None:
+        return None
+    try:
+        return await db.get(AuthSession, uuid.UUID(session_id))
+    except ValueError:
+        return None
+
+
+async def revoke_session(db: AsyncSession, session: AuthSession) -> None:
+    now = datetime.now(timezone.utc)
+    session.revoked_at = now
+    _record_revocation(db, str(session.id), now)
+    await db.flush()
+
+
+async def deactivate_user(db: AsyncSession, user_id: uuid.UUID) -> User:
+    """Disable a user and invalidate every token issued to them so far."""
+    user = await db.get(User, user_id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    now = datetime.now(timezone.utc)
+    user.is_active = False
+    await db.execute(
+        update(AuthSession)
+        .where(AuthSession.user_id == user_id, AuthSession.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+    _record_revocation(db, user_token_id(user_id), now)
+    await db.flush()
+    return user
+
+
+def _record_revocation(db: AsyncSession, token_id: str, revoked_at: datetime) -> None:
+    # Access tokens issued before ``revoked_at`` live at most this long.
+    expires_at = revoked_at + timedelta(minutes=settings.jwt_expire_minutes)
+    db.add(RevokedToken(token_id=token_id, revoked_at=revoked_at, expires_at=expires_at))
+    # Apply locally once committed; other workers pick it up on their next sync.
+    revocation_list.add_on_commit(db, token_id, revoked_at, expires_at)
+
+
+def _aware(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
@@ -0,0 +1,92 @@
+"""JWT signing and verification with ``kid``-indexed keys and a decoded-token cache.
+
+Dispatchers reuse one access token for thousands of requests, so verified
+tokens are cached by their raw string until their ``exp``: a hit skips the
+base64/JSON parsing, HMAC check and Pydantic validation entirely. A cached
+entry is only ever returned for the exact bytes that were verified, and the
+cache is cleared whenever the key set changes.
+"""
+
+import time
+from collections import OrderedDict
+
+from jose import JWTError, jwt
+from pydantic import BaseModel
+
+from src.config import settings
+
+
+class TokenPayload(BaseModel):
+    sub: str
+    role: str
+    exp: int | None = None
+    iat: int | None = None
+    sid: str | None = None
+
+
+class TokenVerifier:
+    def __init__(
+        self,
+        keys: dict[str, str],
+        active_kid: str,
+        algorithm: str,
+        cache_size: int = 4096,
+    ) -> None:
+        self.algorithm = algorithm
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, TokenPayload] = OrderedDict()
+        self.set_keys(keys, active_kid)
+
+    @classmethod
+    def from_settings(cls) -> "TokenVerifier":
+        keys = dict(settings.jwt_keys) or {"default": settings.jwt_secret_key}
+        active_kid = settings.jwt_active_kid or next(iter(keys))
+        return cls(keys, active_kid, settings.jwt_algorithm, settings.jwt_cache_size)
+
+    def set_keys(self, keys: dict[str, str], active_kid: str) -> None:
+        """Replace the key set, e.g. after rotation. Tokens signed with removed keys stop verifying."""
+        if active_kid not in keys:
+            raise ValueError(f"Active key id {active_kid!r} is not in the key set")
+        self._keys = dict(keys)
+        self.active_kid = active_kid
+        self._cache.clear()
+
+    def sign(self, claims: dict) -> str:
+        return jwt.encode(
+            claims,
+            self._keys[self.active_kid],
+            algorithm=self.algorithm,
+            headers={"kid": self.active_kid},
+        )
+
+    def verify(self, token: str) -> TokenPayload:
+        """Return the token's payload, raising ``JWTError`` if it is invalid or expired."""
+        cached = self._cache.get(token)
+        if cached is not None:
+            if cached.exp is not None and cached.exp > time.time():
+                self._cache.move_to_end(token)
+                return cached
+            del self._cache[token]
+
+        header = jwt.get_unverified_header(token)
+        kid = header.get("kid")
+        if kid is not None and not isinstance(kid, str):
+            raise JWTError("Invalid key id")
+        # Tokens issued before kids were introduced carry no header; they
+        # verify against the active key.
+        key = self._keys.get(kid if kid is not None else self.active_kid)
+        if key is None:
+            raise JWTError("Unknown signing key")
+        payload = TokenPayload(**jwt.decode(token, key, algorithms=[self.algorithm]))
+
+        if payload.exp is not None:
+            self._cache[token] = payload
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return payload
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+
+token_verifier = TokenVerifier.from_settings()
@@ -1,11 +1,24 @@
 from datetime import datetime, timedelta, timezone
 
-from jose import jwt
 from passlib.context import CryptContext
 
+from src.auth.tokens import token_verifier
 from src.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def build_crypt_context(rounds: int) -> CryptContext:
+    # Pinning min/max rounds to the configured cost makes passlib report any
+    # hash with a different cost as needing an update, in either direction.
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+pwd_context = build_crypt_context(settings.bcrypt_rounds)
 
 
 def hash_password(password: str) -> str:
@@ -16,7 +29,15 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
-def create_access_token(subject: str, role: str, expires_delta: timedelta | None = None) -> str:
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.jwt_expire_minutes))
-    payload = {"sub": subject, "role": role, "exp": expire}
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+def create_access_token(
+    subject: str,
+    role: str,
+    expires_delta: timedelta | None = None,
+    session_id: str | None = None,
+) -> str:
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=settings.jwt_expire_minutes))
+    payload = {"sub": subject, "role": role, "exp": expire, "iat": now}
+    if session_id is not None:
+        payload["sid"] = session_id
+    return token_verifier.sign(payload)
@@ -0,0 +1,44 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import Principal, require_roles
+from src.bulk_import import service
+from src.database import get_db
+from src.models.user import UserRole
+from src.schemas.bulk_import import ImportResult
+
+router = APIRouter(prefix="/api/admin/import", tags=["import"])
+
+AdminOnly = Annotated[Principal, Depends(require_roles(UserRole.ADMIN))]
+
+# The body is the raw CSV (Content-Type: text/csv), read as it streams in.
+_CSV_BODY = {"requestBody": {"required": True, "content": {"text/csv": {"schema": {"type": "string"}}}}}
+
+
+@router.post("/customers", response_model=ImportResult, openapi_extra=_CSV_BODY)
+async def import_customers(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOnly,
+):
+    """Upsert customers on ``contact_email``.
+
+    Columns: company_name, contact_name, contact_email, contact_phone (optional).
+    """
+    return await service.import_csv(db, request.stream(), service.CUSTOMERS)
+
+
+@router.post("/drivers", response_model=ImportResult, openapi_extra=_CSV_BODY)
+async def import_drivers(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOnly,
+):
+    """Upsert driver accounts on ``email``; new ones have no password yet.
+
+    Columns: email, full_name, vehicle_type, license_plate (optional),
+    is_available (optional, default true).
+    """
+    return await service.import_csv(db, request.stream(), service.DRIVERS)
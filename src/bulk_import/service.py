@@ -0,0 +1,286 @@
+"""Bulk CSV import of customers and drivers.
+
+The upload is parsed as it streams in. Rows are validated a chunk at a time
+with one ``TypeAdapter`` call and upserted a chunk at a time: a ``COPY`` into
+a temporary table followed by ``INSERT ... SELECT ... ON CONFLICT`` on
+PostgreSQL, elsewhere one cached ``INSERT ... ON CONFLICT`` statement run
+with ``executemany`` over the chunk. Invalid rows are skipped and reported;
+the rest load in the request's transaction. Within a file the last row for
+an email wins.
+"""
+
+import codecs
+import csv
+import re
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import Table, select, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.user import User, UserRole
+from src.schemas.bulk_import import CustomerImportRow, DriverImportRow, ImportResult, ImportRowError
+
+# Not a hash passlib recognises, so imported drivers cannot log in until a
+# password is set for them.
+UNUSABLE_PASSWORD = "!"
+
+# Only CR, LF and CRLF end a CSV line; str.splitlines() would also split on
+# form feeds, \x1c-\x1e, NEL and U+2028, which are ordinary field characters.
+_LINE = re.compile(r"[^\r\n]*(?:\r\n?|\n)|[^\r\n]+")
+
+Rows = list[tuple[int, BaseModel]]
+LoadResult = tuple[int, int, list[ImportRowError]]
+
+
+async def csv_records(chunks: AsyncIterable[bytes], max_bytes: int) -> AsyncIterator[list[list[str]]]:
+    """Parse a streamed CSV body, yielding the complete records of each chunk.
+
+    A quoted field may span lines and chunks: lines are held back until
+    their double quotes balance.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+    held: list[str] = []
+    in_quotes = False
+    size = 0
+
+    def split(text: str, final: bool) -> list[list[str]]:
+        nonlocal tail, held, in_quotes
+        lines = _LINE.findall(tail + text)
+        tail = lines.pop() if lines and not final and lines[-1][-1] not in "\r\n" else ""
+        lines = held + lines
+        ready = 0
+        for index in range(len(held), len(lines)):
+            if lines[index].count('"') % 2:
+                in_quotes = not in_quotes
+            if not in_quotes:
+                ready = index + 1
+        if final:
+            ready = len(lines)
+        held = lines[ready:]
+        return [record for record in csv.reader(lines[:ready]) if record]
+
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > max_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Upload exceeds {max_bytes} bytes",
+                )
+            if records := split(decoder.decode(chunk), final=False):
+                yield records
+        if records := split(decoder.decode(b"", final=True), final=True):
+            yield records
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Invalid CSV: {exc}") from exc
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def _validate(model: type[BaseModel], batch: list[tuple[int, dict]]) -> tuple[Rows, list[ImportRowError]]:
+    """Validate a chunk in one call; only on failure find out which rows are bad."""
+    adapter = _list_adapter(model)
+    try:
+        parsed = adapter.validate_python([data for _, data in batch])
+        return [(row, item) for (row, _), item in zip(batch, parsed)], []
+    except ValidationError as exc:
+        messages: dict[int, list[str]] = defaultdict(list)
+        for error in exc.errors(include_url=False):
+            index, *loc = error["loc"]
+            messages[index].append(f"{'.'.join(map(str, loc)) or 'row'}: {error['msg']}")
+    good = [entry for index, entry in enumerate(batch) if index not in messages]
+    parsed = adapter.validate_python([data for _, data in good])
+    errors = [ImportRowError(row=batch[index][0], errors=found) for index, found in sorted(messages.items())]
+    return [(row, item) for (row, _), item in zip(good, parsed)], errors
+
+
+async def _upsert(db: AsyncSession, table: Table, rows: list[dict], key: str, update: list[str]) -> None:
+    if not rows:
+        return
+    dialect = db.get_bind().dialect
+    if dialect.name == "postgresql":
+        columns = list(rows[0])
+        processors = [table.c[name].type.bind_processor(dialect) for name in columns]
+        records = [
+            tuple(value if process is None else process(value) for process, value in zip(processors, row.values()))
+            for row in rows
+        ]
+        staging = f"import_{table.name}"
+        # Runs through the session first, so the COPY below is inside its transaction.
+        await db.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} (LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+        ))
+        await db.execute(text(f"TRUNCATE {staging}"))
+        connection = await (await db.connection()).get_raw_connection()
+        await connection.driver_connection.copy_records_to_table(staging, records=records, columns=columns)
+        names = ", ".join(columns)
+        assignments = ", ".join(f"{name} = EXCLUDED.{name}" for name in update)
+        await db.execute(text(
+            f"INSERT INTO {table.name} ({names}) SELECT {names} FROM {staging} "
+            f"ON CONFLICT ({key}) DO UPDATE SET {assignments}"
+        ))
+        return
+
+    # One cached statement run over the whole chunk: executemany on a single
+    # prepared statement, instead of compiling a multi-row VALUES each time.
+    statement = sqlite.insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[key], set_={name: statement.excluded[name] for name in update},
+    )
+    await db.execute(statement, rows)
+
+
+async def _load_customers(db: AsyncSession, rows: Rows) -> LoadResult:
+    latest: dict[str, CustomerImportRow] = {row.contact_email: row for _, row in rows}
+    result = await db.execute(select(Customer.contact_email).where(Customer.contact_email.in_(latest)))
+    existing = set(result.scalars())
+    now = datetime.now(timezone.utc)
+    await _upsert(
+        db,
+        Customer.__table__,
+        [{"id": uuid.uuid4(), "created_at": now, "updated_at": now, **row.model_dump()} for row in latest.values()],
+        key="contact_email",
+        update=["company_name", "contact_name", "contact_phone", "updated_at"],
+    )
+    return len(latest) - len(existing), len(existing), []
+
+
+async def _load_drivers(db: AsyncSession, rows: Rows) -> LoadResult:
+    latest: dict[str, tuple[int, DriverImportRow]] = {row.email: (row_no, row) for row_no, row in rows}
+    result = await db.execute(select(User.email, User.id, User.role).where(User.email.in_(latest)))
+    errors: list[ImportRowError] = []
+    existing: dict[str, uuid.UUID] = {}
+    for email, user_id, role in result:
+        if role != UserRole.DRIVER:
+            row_no, _ = latest.pop(email)
+            errors.append(ImportRowError(row=row_no, errors=[f"email: already used by a non-driver account ({role.value})"]))
+        else:
+            existing[email] = user_id
+
+    now = datetime.now(timezone.utc)
+    user_ids = {email: existing.get(email) or uuid.uuid4() for email in latest}
+    await _upsert(
+        db,
+        User.__table__,
+        [
+            {
+                "id": user_ids[email],
+                "created_at": now,
+                "updated_at": now,
+                "email": email,
+                "hashed_password": UNUSABLE_PASSWORD,
+                "full_name": row.full_name,
+                "role": UserRole.DRIVER,
+                "is_active": True,
+            }
+            for email, (_, row) in latest.items()
+        ],
+        key="email",
+        update=["full_name", "updated_at"],
+    )
+    await _upsert(
+        db,
+        Driver.__table__,
+        [
+            {
+                "id": uuid.uuid4(),
+                "created_at": now,
+                "updated_at": now,
+                "user_id": user_ids[email],
+                "vehicle_type": row.vehicle_type,
+                "license_plate": row.license_plate,
+                "is_available": row.is_available,
+            }
+            for email, (_, row) in latest.items()
+        ],
+        key="user_id",
+        update=["vehicle_type", "license_plate", "is_available", "updated_at"],
+    )
+    return len(latest) - len(existing), len(existing), errors
+
+
+@dataclass(frozen=True)
+class ImportKind:
+    model: type[BaseModel]
+    load: Callable[[AsyncSession, Rows], Awaitable[LoadResult]]
+
+
+CUSTOMERS = ImportKind(CustomerImportRow, _load_customers)
+DRIVERS = ImportKind(DriverImportRow, _load_drivers)
+
+
+def _check_header(model: type[BaseModel], header: list[str]) -> None:
+    fields = model.model_fields
+    unknown = [name for name in header if name not in fields]
+    missing = [name for name, field in fields.items() if field.is_required() and name not in header]
+    if unknown or missing or len(set(header)) != len(header):
+        problems = []
+        if unknown:
+            problems.append(f"unknown columns: {', '.join(unknown)}")
+        if missing:
+            problems.append(f"missing columns: {', '.join(missing)}")
+        if len(set(header)) != len(header):
+            problems.append("duplicate columns")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid CSV header ({'; '.join(problems)}); expected columns: {', '.join(fields)}",
+        )
+
+
+async def import_csv(db: AsyncSession, chunks: AsyncIterable[bytes], kind: ImportKind) -> ImportResult:
+    created = updated = failed = 0
+    errors: list[ImportRowError] = []
+
+    def report(found: list[ImportRowError]) -> None:
+        nonlocal failed
+        failed += len(found)
+        errors.extend(found[:max(0, settings.import_max_reported_errors - len(errors))])
+
+    async def flush(batch: list[tuple[int, dict]]) -> None:
+        nonlocal created, updated
+        rows, invalid = _validate(kind.model, batch)
+        report(invalid)
+        if rows:
+            new, changed, rejected = await kind.load(db, rows)
+            created += new
+            updated += changed
+            report(rejected)
+
+    header: list[str] | None = None
+    row_no = 0
+    batch: list[tuple[int, dict]] = []
+    async for records in csv_records(chunks, settings.import_max_upload_bytes):
+        for record in records:
+            row_no += 1
+            if header is None:
+                header = [name.strip() for name in record]
+                _check_header(kind.model, header)
+                continue
+            if len(record) != len(header):
+                report([ImportRowError(row=row_no, errors=[f"expected {len(header)} fields, got {len(record)}"])])
+                continue
+            batch.append((row_no, {name: value for name, value in zip(header, record) if value.strip()}))
+            if len(batch) >= settings.import_chunk_rows:
+                await flush(batch)
+                batch = []
+    if header is None:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Empty CSV")
+    if batch:
+        await flush(batch)
+    errors.sort(key=lambda error: error.row)
+    return ImportResult(created=created, updated=updated, failed=failed, errors=errors)
@@ -8,6 +8,134 @@ class Settings(BaseSettings):
     jwt_secret_key: str = "change-me-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60
+    # Signing keys by key id, e.g. COURIER_JWT_KEYS='{"2026-10": "..."}'. When
+    # empty, jwt_secret_key is used under the id "default".
+    jwt_keys: dict[str, str] = {}
+    jwt_active_kid: str | None = None
+    jwt_cache_size: int = 4096
+    refresh_token_expire_days: int = 30
+    revocation_sync_interval_seconds: float = 2.0
+
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_max_concurrency: int = 8
+    password_hash_acquire_timeout_seconds: float = 2.0
+
+    blob_store_root: str = "./media"
+    blob_base_url: str = "/media"
+
+    pod_max_upload_bytes: int = 15 * 1024 * 1024
+    pod_upload_chunk_size: int = 64 * 1024
+    pod_photo_max_edge: int = 1600
+    pod_thumbnail_edge: int = 320
+    pod_image_workers: int = 2
+
+    compression_enabled: bool = True
+    # Responses smaller than this are not worth compressing.
+    compression_min_bytes: int = 512
+    # Preference order; br and zstd are skipped unless brotli / zstandard are installed.
+    compression_encodings: list[str] = ["br", "zstd", "gzip"]
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    compression_zstd_level: int = 3
+
+    # Public tracking endpoint. A per-minute limit of 0 disables rate limiting.
+    tracking_rate_limit_per_minute: int = 60
+    tracking_rate_limit_burst: int = 20
+    # The batch bucket is counted in tracking IDs, not requests; the burst must
+    # be at least the largest batch (1000) for a full batch to ever pass.
+    tracking_batch_rate_limit_per_minute: int = 1000
+    tracking_batch_rate_limit_burst: int = 1000
+    tracking_negative_cache_ttl_seconds: float = 60.0
+    tracking_negative_cache_max_entries: int = 100_000
+    tracking_accept_legacy_ids: bool = True
+    # Only enable behind a proxy that overwrites X-Forwarded-For.
+    rate_limit_trust_forwarded_for: bool = False
+
+    invalidation_reconnect_seconds: float = 1.0
+    # Cached tracking responses are invalidated on change, so the TTL only
+    # bounds staleness if an invalidation is ever lost.
+    tracking_cache_ttl_seconds: float = 3600.0
+    tracking_cache_max_entries: int = 50_000
+
+    # Terminal jobs older than this are moved to jobs_archive by src.jobs.archive.
+    archive_after_days: int = 90
+    archive_batch_size: int = 1000
+
+    # Admin CSV imports of customers and drivers (src.bulk_import).
+    import_max_upload_bytes: int = 100 * 1024 * 1024
+    import_chunk_rows: int = 5_000
+    import_max_reported_errors: int = 1_000
+
+    # Analytics export (src.analytics.export): Parquet files under export_root,
+    # one directory per table and creation date. Rows changed within
+    # export_lag_seconds of a run are left to the next run, so transactions
+    # still open when it starts are not skipped.
+    export_root: str = "./exports"
+    export_batch_size: int = 50_000
+    export_lag_seconds: float = 300.0
+    export_compression: str = "zstd"
+
+    # Driver sync tokens trail the clock by sync_lag_seconds; changes in that
+    # window are sent again on the next sync, so a transaction that commits
+    # after a sync with an earlier updated_at still reaches the device.
+    sync_lag_seconds: float = 60.0
+
+    # Driver position fixes: a job's pickup/dropoff fence fires within
+    # geofence_radius_m; "left pickup" needs geofence_exit_radius_m so GPS
+    # jitter at the edge does not flap. Fixes less accurate than
+    # geofence_max_accuracy_m are ignored.
+    geofence_radius_m: float = 75.0
+    geofence_exit_radius_m: float = 150.0
+    geofence_max_accuracy_m: float = 100.0
+    geofence_cache_max_drivers: int = 10_000
+
+    # ETAs: speeds are learned by src.eta.speeds from the last eta_training_days
+    # of deliveries, per vehicle type and hour of day in eta_timezone. Hours
+    # with fewer than eta_min_samples deliveries fall back to the vehicle's
+    # all-day speed, unknown vehicles to eta_default_speed_mps.
+    eta_training_days: int = 30
+    eta_min_samples: int = 5
+    eta_timezone: str = "UTC"
+    eta_default_speed_mps: float = 4.0
+    eta_refresh_interval_seconds: float = 600.0
+    # Older driver positions are not used to estimate the remaining distance.
+    eta_position_max_age_seconds: float = 900.0
+
+    # Raw position fixes older than this are folded into hourly trail chunks
+    # by src.trails.rollup.
+    trail_raw_retention_hours: int = 48
+    trail_rollup_batch_size: int = 10_000
+    trail_max_range_hours: int = 7 * 24
+    trail_max_points: int = 10_000
+
+    # SLA monitor: a breach is recorded when a job stays in a status longer
+    # than its threshold in seconds. These are the defaults (statuses not
+    # listed are not monitored); customers can override them per status.
+    sla_monitor_enabled: bool = True
+    sla_thresholds_seconds: dict[str, int] = {
+        "pending": 30 * 60,
+        "assigned": 60 * 60,
+        "picked_up": 30 * 60,
+        "in_transit": 2 * 60 * 60,
+    }
+    # The monitor sleeps until the next deadline, but never longer than this.
+    sla_max_sleep_seconds: float = 60.0
+    sla_breach_batch_size: int = 500
+
+    idempotency_max_entries: int = 10_000
+    idempotency_ttl_seconds: int = 24 * 60 * 60
+
+    webhooks_enabled: bool = True
+    webhook_poll_interval_seconds: float = 1.0
+    webhook_batch_size: int = 50
+    webhook_max_concurrency: int = 50
+    webhook_timeout_seconds: float = 10.0
+    webhook_max_attempts: int = 8
+    webhook_backoff_base_seconds: float = 2.0
+    webhook_backoff_max_seconds: float = 3600.0
+    webhook_lease_seconds: float = 60.0
+    webhook_outbox_retention_hours: int = 72
 
     model_config = {"env_prefix": "COURIER_", "env_file": ".env"}
 
@@ -0,0 +1,32 @@
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import get_current_customer_id
+from src.customers import service
+from src.database import get_db
+from src.models.job import JobStatus
+from src.schemas.customer import CustomerJobPage, CustomerJobRead
+
+router = APIRouter(prefix="/api/customer", tags=["customer"])
+
+CurrentCustomerId = Annotated[uuid.UUID, Depends(get_current_customer_id)]
+
+
+@router.get("/jobs", response_model=CustomerJobPage)
+async def list_jobs(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    customer_id: CurrentCustomerId,
+    status: JobStatus | None = None,
+    cursor: Annotated[str | None, Query(max_length=200)] = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+):
+    jobs, next_cursor = await service.list_customer_jobs(
+        db, customer_id, status_filter=status, cursor=cursor, limit=limit,
+    )
+    return CustomerJobPage(
+        items=[CustomerJobRead.model_validate(job) for job in jobs],
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,67 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from src.models.job import Job, JobStatus
+from src.timeutils import as_utc
+
+
+def encode_cursor(created_at: datetime, job_id: uuid.UUID) -> str:
+    raw = f"{as_utc(created_at).isoformat()}|{job_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, _, job_id = raw.partition("|")
+        return as_utc(datetime.fromisoformat(created_at)), uuid.UUID(job_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+async def list_customer_jobs(
+    db: AsyncSession,
+    customer_id: uuid.UUID,
+    *,
+    status_filter: JobStatus | None = None,
+    cursor: str | None = None,
+    limit: int = 50,
+) -> tuple[list[Job], str | None]:
+    """Return one newest-first page of a customer's jobs and the cursor for the next.
+
+    Pages are keyed on ``(created_at, id)`` rather than an offset, so every page
+    is a range scan of ``ix_jobs_customer_id_created_at`` no matter how deep the
+    caller has paged.
+    """
+    query = (
+        select(Job)
+        .where(Job.customer_id == customer_id)
+        .options(lazyload("*"))
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .limit(limit + 1)
+    )
+    if status_filter is not None:
+        query = query.where(Job.status == status_filter)
+    if cursor is not None:
+        created_at, job_id = decode_cursor(cursor)
+        # Spelled out instead of a row comparison so the leading
+        # ``created_at <=`` bound is usable as an index condition.
+        query = query.where(
+            and_(
+                Job.created_at <= created_at,
+                or_(Job.created_at < created_at, Job.id < job_id),
+            )
+        )
+    result = await db.execute(query)
+    jobs = list(result.scalars().all())
+    if len(jobs) <= limit:
+        return jobs, None
+    jobs = jobs[:limit]
+    return jobs, encode_cursor(jobs[-1].created_at, jobs[-1].id)
@@ -0,0 +1,246 @@
+"""Status changes triggered by driver position fixes.
+
+Each active job with coordinates has a circular fence around its pickup and
+dropoff point. ``process_fixes`` walks a batch of fixes in time order against
+the driver's fences; when one fires, the next step of the job's state machine
+is applied through ``transition_job`` (source ``"geofence"``), or only
+proposed where the driver still has to act:
+
+* assigned, fix inside the pickup fence: picked_up is applied
+* picked_up, fix beyond the pickup exit radius: in_transit is applied
+* in_transit, fix inside the dropoff fence: delivered is proposed, since
+  proof of delivery still comes from the driver
+
+Fences are cached per driver in ``geofence_index`` and dropped through the
+invalidation bus whenever one of the driver's jobs changes or a job is
+assigned to them, so a batch normally costs no database reads and one
+distance check per fix and active job.
+"""
+
+import math
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import attrgetter
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from src.config import settings
+from src.drivers.service import ACTIVE_STATUSES
+from src.geo import EARTH_RADIUS_M
+from src.invalidation import invalidation_bus
+from src.jobs.service import DRIVER_JOBS_ENTITY, JOB_ENTITY, transition_job
+from src.models.driver import Driver
+from src.models.job import Job, JobStatus
+from src.schemas.position import FenceKind, GeofenceEvent, PositionFix
+from src.timeutils import as_utc
+
+GEOFENCE_SOURCE = "geofence"
+
+_METRES_PER_DEGREE = math.radians(1) * EARTH_RADIUS_M
+
+
+@dataclass(frozen=True, slots=True)
+class Fence:
+    lat: float
+    lng: float
+    # cos(latitude): shrinks longitude degrees to latitude degrees here.
+    lng_scale: float
+
+    @classmethod
+    def around(cls, lat: float, lng: float) -> "Fence":
+        return cls(lat, lng, math.cos(math.radians(lat)))
+
+    def distance_sq(self, lat: float, lng: float) -> float:
+        """Squared distance in degrees of latitude (equirectangular; exact enough at fence scale)."""
+        dy = lat - self.lat
+        dx = (lng - self.lng) * self.lng_scale
+        return dx * dx + dy * dy
+
+
+def radius_sq(metres: float) -> float:
+    """A radius in metres in the units of ``Fence.distance_sq``."""
+    return (metres / _METRES_PER_DEGREE) ** 2
+
+
+@dataclass(frozen=True, slots=True)
+class JobFences:
+    job_id: uuid.UUID
+    status: JobStatus
+    # Fixes recorded before the job last changed are not evaluated against it.
+    updated_at: datetime
+    pickup: Fence | None
+    dropoff: Fence | None
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    fence: FenceKind
+    # Fires on a fix inside the fence, or else on one beyond the exit radius.
+    inside: bool
+    target: JobStatus
+    apply: bool
+
+
+RULES: dict[JobStatus, Rule] = {
+    JobStatus.ASSIGNED: Rule(FenceKind.PICKUP, inside=True, target=JobStatus.PICKED_UP, apply=True),
+    JobStatus.PICKED_UP: Rule(FenceKind.PICKUP, inside=False, target=JobStatus.IN_TRANSIT, apply=True),
+    JobStatus.IN_TRANSIT: Rule(FenceKind.DROPOFF, inside=True, target=JobStatus.DELIVERED, apply=False),
+}
+
+
+def firing(
+    fences: Iterable[JobFences],
+    statuses: dict[uuid.UUID, JobStatus | None],
+    lat: float,
+    lng: float,
+    recorded_at: datetime,
+    enter_sq: float,
+    exit_sq: float,
+) -> Iterator[tuple[JobFences, Rule]]:
+    """Yield the fences that fire for one fix, given each job's current status."""
+    for job in fences:
+        rule = RULES.get(statuses[job.job_id])
+        if rule is None or recorded_at < job.updated_at:
+            continue
+        fence = job.pickup if rule.fence is FenceKind.PICKUP else job.dropoff
+        if fence is None:
+            continue
+        distance_sq = fence.distance_sq(lat, lng)
+        if distance_sq <= enter_sq if rule.inside else distance_sq > exit_sq:
+            yield job, rule
+
+
+class GeofenceIndex:
+    """Fences of each driver's active jobs, least recently used evicted first.
+
+    Subscribed to both job and driver-assignment invalidations; job and driver
+    IDs are UUIDs and cannot collide, so either kind of ID drops the driver's
+    entry. As with the tracking cache, ``generation`` guards against storing
+    fences loaded while an invalidation was in flight.
+    """
+
+    def __init__(self, max_drivers: int) -> None:
+        self.max_drivers = max_drivers
+        self.generation = 0
+        self._by_driver: OrderedDict[str, tuple[JobFences, ...]] = OrderedDict()
+        self._by_job: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_driver)
+
+    def get(self, driver_id: str) -> tuple[JobFences, ...] | None:
+        fences = self._by_driver.get(driver_id)
+        if fences is not None:
+            self._by_driver.move_to_end(driver_id)
+        return fences
+
+    def put(self, driver_id: str, fences: tuple[JobFences, ...], *, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._remove(driver_id)
+        self._by_driver[driver_id] = fences
+        for job in fences:
+            self._by_job[str(job.job_id)] = driver_id
+        while len(self._by_driver) > self.max_drivers:
+            self._remove(next(iter(self._by_driver)))
+
+    def invalidate(self, entity_id: str, version: int) -> None:
+        self.generation += 1
+        self._remove(self._by_job.get(entity_id, entity_id))
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._by_driver.clear()
+        self._by_job.clear()
+
+    def _remove(self, driver_id: str) -> None:
+        for job in self._by_driver.pop(driver_id, ()):
+            self._by_job.pop(str(job.job_id), None)
+
+
+geofence_index = GeofenceIndex(settings.geofence_cache_max_drivers)
+invalidation_bus.subscribe(JOB_ENTITY, geofence_index)
+invalidation_bus.subscribe(DRIVER_JOBS_ENTITY, geofence_index)
+
+
+async def _load_fences(db: AsyncSession, driver_id: uuid.UUID) -> tuple[JobFences, ...]:
+    result = await db.execute(
+        select(
+            Job.id, Job.status, Job.updated_at,
+            Job.pickup_lat, Job.pickup_lng, Job.dropoff_lat, Job.dropoff_lng,
+        ).where(Job.driver_id == driver_id, Job.status.in_(ACTIVE_STATUSES))
+    )
+    return tuple(
+        JobFences(
+            job_id=row.id,
+            status=row.status,
+            updated_at=as_utc(row.updated_at),
+            pickup=Fence.around(row.pickup_lat, row.pickup_lng) if row.pickup_lat is not None else None,
+            dropoff=Fence.around(row.dropoff_lat, row.dropoff_lng) if row.dropoff_lat is not None else None,
+        )
+        for row in result
+        if row.pickup_lat is not None or row.dropoff_lat is not None
+    )
+
+
+async def driver_fences(db: AsyncSession, driver_id: uuid.UUID) -> tuple[JobFences, ...]:
+    key = str(driver_id)
+    fences = geofence_index.get(key)
+    if fences is None:
+        generation = geofence_index.generation
+        fences = await _load_fences(db, driver_id)
+        geofence_index.put(key, fences, generation=generation)
+    return fences
+
+
+async def process_fixes(db: AsyncSession, driver: Driver, fixes: list[PositionFix]) -> list[GeofenceEvent]:
+    """Evaluate a batch of the driver's fixes; return the transitions applied or proposed."""
+    fences = await driver_fences(db, driver.id)
+    if not fences:
+        return []
+
+    enter_sq = radius_sq(settings.geofence_radius_m)
+    exit_sq = radius_sq(settings.geofence_exit_radius_m)
+    max_accuracy = settings.geofence_max_accuracy_m
+    now = datetime.now(timezone.utc)
+    statuses: dict[uuid.UUID, JobStatus | None] = {job.job_id: job.status for job in fences}
+    proposed: set[uuid.UUID] = set()
+    events: list[GeofenceEvent] = []
+
+    for fix in sorted(fixes, key=attrgetter("recorded_at")):
+        if fix.accuracy_m is not None and fix.accuracy_m > max_accuracy:
+            continue
+        # Device clocks drift; never record a transition in the future.
+        recorded_at = min(as_utc(fix.recorded_at), now)
+        for job, rule in list(firing(fences, statuses, fix.lat, fix.lng, recorded_at, enter_sq, exit_sq)):
+            if not rule.apply:
+                if job.job_id not in proposed:
+                    proposed.add(job.job_id)
+                    events.append(GeofenceEvent(
+                        job_id=job.job_id, fence=rule.fence, status=rule.target,
+                        applied=False, recorded_at=recorded_at,
+                    ))
+                continue
+            result = await db.execute(
+                select(Job).where(Job.id == job.job_id).options(lazyload("*")).with_for_update()
+            )
+            row = result.scalar_one_or_none()
+            if row is None or row.driver_id != driver.id or row.status != statuses[job.job_id]:
+                # Changed elsewhere since the fences were cached; stop using them.
+                statuses[job.job_id] = None
+                geofence_index.invalidate(str(driver.id), 0)
+                continue
+            await transition_job(db, row, rule.target, occurred_at=recorded_at, source=GEOFENCE_SOURCE)
+            statuses[job.job_id] = rule.target
+            events.append(GeofenceEvent(
+                job_id=job.job_id, fence=rule.fence, status=rule.target,
+                applied=True, recorded_at=recorded_at,
+            ))
+
+    await db.flush()
+    return events
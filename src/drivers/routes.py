@@ -0,0 +1,76 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import get_current_driver
+from src.database import get_db
+from src.drivers import geofence, service
+from src.models.driver import Driver
+from src.responses import (
+    PRIVATE_REVALIDATE,
+    cache_control,
+    etag_matches,
+    json_response,
+    make_etag,
+    not_modified,
+)
+from src.schemas.position import PositionBatch, PositionBatchResponse
+from src.schemas.sync import DriverJobDelta, SyncRequest, SyncResponse
+from src.trails import service as trail_service
+
+router = APIRouter(prefix="/api/driver", tags=["driver"])
+
+CurrentDriver = Annotated[Driver, Depends(get_current_driver)]
+
+_job_list_adapter = TypeAdapter(list[DriverJobDelta])
+
+
+@router.get(
+    "/jobs",
+    response_model=list[DriverJobDelta],
+    responses={304: {"description": "The job list is unchanged since the given ETag"}},
+    dependencies=[cache_control(PRIVATE_REVALIDATE)],
+)
+async def list_active_jobs(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    driver: CurrentDriver,
+):
+    rows = await service.active_jobs(db, driver)
+    etag = make_etag(part for row in rows for part in (row.id, row.status.value, row.updated_at.isoformat()))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    body = _job_list_adapter.dump_json(_job_list_adapter.validate_python(rows, from_attributes=True))
+    return json_response(body, {"ETag": etag})
+
+
+@router.post("/sync", response_model=SyncResponse)
+async def sync(
+    body: SyncRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    driver: CurrentDriver,
+):
+    since = service.decode_sync_token(body.sync_token) if body.sync_token else None
+    results = await service.apply_operations(db, driver, body.operations)
+    jobs, watermark = await service.jobs_changed_since(
+        db, driver, since, {op.job_id for op in body.operations},
+    )
+    return SyncResponse(
+        sync_token=service.encode_sync_token(watermark),
+        results=results,
+        jobs=[DriverJobDelta.model_validate(job) for job in jobs],
+    )
+
+
+@router.post("/positions", response_model=PositionBatchResponse)
+async def report_positions(
+    body: PositionBatch,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    driver: CurrentDriver,
+):
+    await trail_service.store_fixes(db, driver.id, body.fixes)
+    await service.record_position(db, driver, body.fixes)
+    events = await geofence.process_fixes(db, driver, body.fixes)
+    return PositionBatchResponse(events=events)
@@ -0,0 +1,172 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.invalidation import invalidation_bus
+from src.jobs.service import transition_job
+from src.models.driver import Driver
+from src.models.job import Job, JobStatus
+from src.models.job_status_event import JobStatusEvent
+from src.models.pod import POD
+from src.schemas.position import PositionFix
+from src.schemas.sync import SyncOperation, SyncOperationResult, SyncOutcome
+from src.timeutils import as_utc
+
+TERMINAL_STATUSES = (JobStatus.DELIVERED, JobStatus.FAILED)
+ACTIVE_STATUSES = (JobStatus.ASSIGNED, JobStatus.PICKED_UP, JobStatus.IN_TRANSIT)
+
+# Entity name for invalidation messages when a driver reports a new position
+# (keyed by driver ID); anything derived from it, such as ETAs, is stale.
+DRIVER_POSITION_ENTITY = "driver_position"
+
+
+def encode_sync_token(watermark: datetime) -> str:
+    return base64.urlsafe_b64encode(watermark.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> datetime:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        watermark = datetime.fromisoformat(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid sync token") from exc
+    return as_utc(watermark)
+
+
+async def apply_operations(
+    db: AsyncSession,
+    driver: Driver,
+    operations: list[SyncOperation],
+) -> list[SyncOperationResult]:
+    """Replay a driver's queued status changes in order.
+
+    Operations whose idempotency key was already recorded for this driver are
+    reported as duplicates and skipped; operations that fail validation are
+    reported as rejected without aborting the rest of the batch.
+    """
+    if not operations:
+        return []
+
+    job_ids = {op.job_id for op in operations}
+    result = await db.execute(select(Job).where(Job.id.in_(job_ids)).with_for_update())
+    jobs = {job.id: job for job in result.scalars()}
+
+    keys = {op.idempotency_key for op in operations}
+    result = await db.execute(
+        select(JobStatusEvent.idempotency_key).where(
+            JobStatusEvent.driver_id == driver.id,
+            JobStatusEvent.idempotency_key.in_(keys),
+        )
+    )
+    seen_keys = set(result.scalars())
+
+    now = datetime.now(timezone.utc)
+    results: list[SyncOperationResult] = []
+    for op in operations:
+        outcome, detail = SyncOutcome.APPLIED, None
+        job = jobs.get(op.job_id)
+        if op.idempotency_key in seen_keys:
+            outcome = SyncOutcome.DUPLICATE
+        elif job is None or job.driver_id != driver.id:
+            outcome, detail = SyncOutcome.REJECTED, "Job is not assigned to this driver"
+        else:
+            # Device clocks drift; never record a transition in the future.
+            occurred_at = min(as_utc(op.client_timestamp), now)
+            try:
+                await transition_job(
+                    db, job, op.status,
+                    occurred_at=occurred_at,
+                    source="sync",
+                    idempotency_key=op.idempotency_key,
+                )
+            except HTTPException as exc:
+                outcome, detail = SyncOutcome.REJECTED, exc.detail
+            else:
+                if op.status == JobStatus.DELIVERED and op.pod is not None:
+                    db.add(POD(
+                        job_id=job.id,
+                        signed_by=op.pod.signed_by,
+                        notes=op.pod.notes,
+                        signed_at=occurred_at,
+                    ))
+            seen_keys.add(op.idempotency_key)
+        results.append(SyncOperationResult(
+            idempotency_key=op.idempotency_key, job_id=op.job_id, outcome=outcome, detail=detail,
+        ))
+
+    await db.flush()
+    return results
+
+
+async def jobs_changed_since(
+    db: AsyncSession,
+    driver: Driver,
+    since: datetime | None,
+    touched_job_ids: set[uuid.UUID] | None = None,
+) -> tuple[list[Job], datetime]:
+    """Return the driver's jobs changed at or after ``since`` plus the next watermark.
+
+    Without a watermark the device gets a full snapshot of its active jobs,
+    plus any jobs the current batch just moved into a terminal state.
+
+    ``updated_at`` is stamped at flush, not commit, so the next watermark is
+    held ``sync_lag_seconds`` behind the clock rather than taken from the
+    newest row: jobs changed within the lag are sent again, but one whose
+    transaction commits after this sync is never skipped.
+    """
+    query = select(Job).where(Job.driver_id == driver.id)
+    if since is None:
+        query = query.where(or_(Job.status.not_in(TERMINAL_STATUSES), Job.id.in_(touched_job_ids or ())))
+    else:
+        query = query.where(Job.updated_at >= since)
+    result = await db.execute(query.order_by(Job.updated_at))
+    jobs = list(result.scalars().all())
+
+    watermark = datetime.now(timezone.utc) - timedelta(seconds=settings.sync_lag_seconds)
+    if since is not None:
+        watermark = max(watermark, since)
+    return jobs, watermark
+
+
+async def active_jobs(db: AsyncSession, driver: Driver) -> list[Row]:
+    """Return the driver's active jobs as lightweight rows, oldest assignment first.
+
+    Only the columns of ``DriverJobDelta`` are selected, and the status filter
+    matches the partial index ``ix_jobs_driver_id_active``.
+    """
+    result = await db.execute(
+        select(
+            Job.id,
+            Job.tracking_id,
+            Job.status,
+            Job.pickup_address,
+            Job.dropoff_address,
+            Job.special_instructions,
+            Job.updated_at,
+        )
+        .where(Job.driver_id == driver.id, Job.status.in_(ACTIVE_STATUSES))
+        .order_by(Job.created_at, Job.id)
+    )
+    return list(result.all())
+
+
+async def record_position(db: AsyncSession, driver: Driver, fixes: list[PositionFix]) -> None:
+    """Store the newest of ``fixes`` as the driver's last known position.
+
+    One write per batch however many fixes it holds; fixes older than the
+    stored position (a delayed upload) are ignored.
+    """
+    latest = max(fixes, key=lambda fix: fix.recorded_at)
+    recorded_at = min(as_utc(latest.recorded_at), datetime.now(timezone.utc))
+    if driver.last_position_at is not None and recorded_at <= as_utc(driver.last_position_at):
+        return
+    driver.last_lat = latest.lat
+    driver.last_lng = latest.lng
+    driver.last_position_at = recorded_at
+    await invalidation_bus.publish(db, DRIVER_POSITION_ENTITY, driver.id)
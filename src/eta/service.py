@@ -0,0 +1,69 @@
+"""Estimated delivery times for in-flight jobs.
+
+An estimate is the remaining straight-line distance divided by the learned
+speed for the driver's vehicle type at the current hour (see
+``src.eta.speeds``). The remaining distance is measured from the driver's
+latest position fix when it is recent enough, otherwise the whole pickup to
+dropoff leg is assumed to have started at the job's last status change.
+Estimates are computed on demand; callers cache them until the driver's next
+position update (``DRIVER_POSITION_ENTITY`` invalidations).
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Protocol
+
+from src.config import settings
+from src.eta.speeds import speed_table
+from src.geo import haversine_m
+from src.models.job import JobStatus
+from src.timeutils import as_utc
+
+IN_FLIGHT_STATUSES = (JobStatus.ASSIGNED, JobStatus.PICKED_UP, JobStatus.IN_TRANSIT)
+
+
+class EtaJob(Protocol):
+    status: JobStatus
+    updated_at: datetime
+    pickup_lat: float | None
+    pickup_lng: float | None
+    dropoff_lat: float | None
+    dropoff_lng: float | None
+
+
+class EtaDriver(Protocol):
+    vehicle_type: str | None
+    last_lat: float | None
+    last_lng: float | None
+    last_position_at: datetime | None
+
+
+def job_eta(job: EtaJob, driver: EtaDriver | None, now: datetime | None = None) -> datetime | None:
+    """Estimated delivery time, or ``None`` when the job is not in flight or lacks coordinates."""
+    if job.status not in IN_FLIGHT_STATUSES or job.dropoff_lat is None or driver is None:
+        return None
+    now = now or datetime.now(timezone.utc)
+    position = None
+    if driver.last_position_at is not None and (
+        now - as_utc(driver.last_position_at) <= timedelta(seconds=settings.eta_position_max_age_seconds)
+    ):
+        position = (driver.last_lat, driver.last_lng)
+    has_pickup = job.pickup_lat is not None
+
+    if job.status == JobStatus.ASSIGNED:
+        if position is None or not has_pickup:
+            return None
+        distance_m = (
+            haversine_m(*position, job.pickup_lat, job.pickup_lng)
+            + haversine_m(job.pickup_lat, job.pickup_lng, job.dropoff_lat, job.dropoff_lng)
+        )
+        start = now
+    elif position is not None:
+        distance_m, start = haversine_m(*position, job.dropoff_lat, job.dropoff_lng), now
+    elif has_pickup:
+        distance_m = haversine_m(job.pickup_lat, job.pickup_lng, job.dropoff_lat, job.dropoff_lng)
+        start = as_utc(job.updated_at)
+    else:
+        return None
+
+    eta = start + timedelta(seconds=distance_m / speed_table.speed(driver.vehicle_type, start))
+    return max(eta, now).replace(microsecond=0)
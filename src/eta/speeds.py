@@ -0,0 +1,196 @@
+"""Delivery speeds by vehicle type and hour of day, learned from history.
+
+Training runs as a batch job, e.g. nightly from cron:
+
+    python -m src.eta.speeds --days 30
+
+It takes the delivered jobs with coordinates from the last ``days`` days and
+divides the straight-line pickup-to-dropoff distance by the time from
+in_transit to delivered. The totals are grouped by the driver's vehicle type
+and the local hour the transit leg started, and replace the contents of
+``travel_speeds``. Every worker holds the result in ``speed_table`` and
+reloads it every ``eta_refresh_interval_seconds``.
+"""
+
+import argparse
+import asyncio
+import logging
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from src.config import settings
+from src.geo import haversine_m
+from src.models.driver import Driver
+from src.models.job import Job, JobStatus
+from src.models.job_status_event import JobStatusEvent
+from src.models.travel_speed import TravelSpeed
+from src.timeutils import as_utc
+
+logger = logging.getLogger(__name__)
+
+HOURS = 24
+# Legs outside these bounds are mis-taps (delivery confirmed hours later, or
+# both taps at the door), not travel.
+_MIN_DURATION_S = 60.0
+_MIN_SPEED_MPS = 0.5
+_MAX_SPEED_MPS = 40.0
+
+# (vehicle_type, hour) -> [distance_m, duration_s, samples]
+Totals = dict[tuple[str, int], list[float]]
+
+
+def local_hour(at: datetime) -> int:
+    return at.astimezone(ZoneInfo(settings.eta_timezone)).hour
+
+
+class SpeedTable:
+    """Speeds in m/s: 24 hourly values per vehicle type plus an all-day value.
+
+    Hours with fewer than ``eta_min_samples`` deliveries hold the vehicle's
+    all-day speed, so a lookup is two dict/array indexings. Unknown vehicle
+    types get ``eta_default_speed_mps``.
+    """
+
+    def __init__(self) -> None:
+        self._hourly: dict[str, array] = {}
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._hourly)
+
+    def speed(self, vehicle_type: str | None, at: datetime) -> float:
+        hourly = self._hourly.get(vehicle_type) if vehicle_type is not None else None
+        if hourly is None:
+            return settings.eta_default_speed_mps
+        return hourly[local_hour(at)]
+
+    def replace(self, totals: Iterable[tuple[str, int, float, float, int]]) -> None:
+        """Rebuild from ``(vehicle_type, hour, distance_m, duration_s, samples)`` rows."""
+        by_vehicle: dict[str, list[tuple[int, float, float, int]]] = defaultdict(list)
+        for vehicle_type, hour, distance_m, duration_s, samples in totals:
+            by_vehicle[vehicle_type].append((hour, distance_m, duration_s, samples))
+
+        hourly_speeds: dict[str, array] = {}
+        for vehicle_type, rows in by_vehicle.items():
+            total_duration = sum(row[2] for row in rows)
+            if total_duration <= 0:
+                continue
+            all_day = sum(row[1] for row in rows) / total_duration
+            hourly = array("d", [all_day] * HOURS)
+            for hour, distance_m, duration_s, samples in rows:
+                if samples >= settings.eta_min_samples and duration_s > 0:
+                    hourly[hour] = distance_m / duration_s
+            hourly_speeds[vehicle_type] = hourly
+        self._hourly = hourly_speeds
+
+    async def load(self, db: AsyncSession) -> None:
+        result = await db.execute(select(
+            TravelSpeed.vehicle_type, TravelSpeed.hour,
+            TravelSpeed.distance_m, TravelSpeed.duration_s, TravelSpeed.samples,
+        ))
+        self.replace(result.tuples())
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._task = asyncio.create_task(self._run(session_factory), name="speed-table-refresh")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.load(db)
+            except Exception:
+                logger.exception("Speed table refresh failed")
+            await asyncio.sleep(settings.eta_refresh_interval_seconds)
+
+
+speed_table = SpeedTable()
+
+
+async def collect_totals(db: AsyncSession, since: datetime) -> Totals:
+    """Sum the transit legs of deliveries completed since ``since``."""
+    started = aliased(JobStatusEvent)
+    delivered = aliased(JobStatusEvent)
+    result = await db.stream(
+        select(
+            Driver.vehicle_type,
+            Job.pickup_lat, Job.pickup_lng, Job.dropoff_lat, Job.dropoff_lng,
+            started.occurred_at.label("started_at"),
+            delivered.occurred_at.label("delivered_at"),
+        )
+        .join(Driver, Driver.id == Job.driver_id)
+        .join(started, (started.job_id == Job.id) & (started.to_status == JobStatus.IN_TRANSIT))
+        .join(delivered, (delivered.job_id == Job.id) & (delivered.to_status == JobStatus.DELIVERED))
+        .where(
+            Job.status == JobStatus.DELIVERED,
+            delivered.occurred_at >= since,
+            Job.pickup_lat.is_not(None),
+            Job.dropoff_lat.is_not(None),
+        )
+        .execution_options(yield_per=1000)
+    )
+    totals: Totals = defaultdict(lambda: [0.0, 0.0, 0])
+    async for row in result:
+        started_at = as_utc(row.started_at)
+        duration_s = (as_utc(row.delivered_at) - started_at).total_seconds()
+        distance_m = haversine_m(row.pickup_lat, row.pickup_lng, row.dropoff_lat, row.dropoff_lng)
+        if duration_s < _MIN_DURATION_S or not _MIN_SPEED_MPS <= distance_m / duration_s <= _MAX_SPEED_MPS:
+            continue
+        bucket = totals[(row.vehicle_type, local_hour(started_at))]
+        bucket[0] += distance_m
+        bucket[1] += duration_s
+        bucket[2] += 1
+    return totals
+
+
+async def train(db: AsyncSession, *, days: int | None = None) -> int:
+    """Replace ``travel_speeds`` with totals over the last ``days``; return the number of legs used."""
+    window = settings.eta_training_days if days is None else days
+    totals = await collect_totals(db, datetime.now(timezone.utc) - timedelta(days=window))
+    await db.execute(delete(TravelSpeed))
+    if totals:
+        await db.execute(insert(TravelSpeed), [
+            {
+                "vehicle_type": vehicle_type,
+                "hour": hour,
+                "distance_m": distance_m,
+                "duration_s": duration_s,
+                "samples": int(samples),
+            }
+            for (vehicle_type, hour), (distance_m, duration_s, samples) in totals.items()
+        ])
+    return sum(int(bucket[2]) for bucket in totals.values())
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from src.database import async_session_factory, engine
+
+    try:
+        async with async_session_factory() as db:
+            legs = await train(db, days=args.days)
+            await db.commit()
+        print(f"Trained travel speeds from {legs} deliveries")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Rebuild travel_speeds from recent deliveries.")
+    parser.add_argument("--days", type=int, default=None, help="default: COURIER_ETA_TRAINING_DAYS")
+    asyncio.run(_main(parser.parse_args()))
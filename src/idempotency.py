@@ -0,0 +1,180 @@
+"""``Idempotency-Key`` support for mutating endpoints.
+
+Routers opt in with ``route_class=IdempotentRoute``. When a POST/PUT/PATCH/
+DELETE request carries an ``Idempotency-Key`` header, the first request runs
+normally and its successful response is kept for a TTL; retries with the same
+key replay that response without running the endpoint again. A retry that
+arrives while the original is still running waits for it to finish.
+
+Keys are scoped to the caller's credentials and the route, and the request
+body is fingerprinted so that reusing a key for a different request is
+rejected instead of silently replayed. The store is per process.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+
+from src.config import settings
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAY_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+_MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    body: bytes
+    media_type: str | None
+
+    def to_response(self) -> Response:
+        response = Response(content=self.body, status_code=self.status_code, media_type=self.media_type)
+        response.headers[REPLAY_HEADER] = "true"
+        return response
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    expires_at: float
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    response: StoredResponse | None = None
+
+
+class IdempotencyStore:
+    """Bounded LRU of in-flight and completed requests keyed by idempotency scope."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def begin(self, scope: str, fingerprint: str) -> StoredResponse | None:
+        """Claim ``scope`` or return the response already recorded for it.
+
+        Returns ``None`` when the caller now owns the key and must finish with
+        :meth:`complete` or :meth:`abandon`.
+        """
+        while True:
+            entry = self._entries.get(scope)
+            if entry is not None and entry.response is not None and entry.expires_at <= time.monotonic():
+                del self._entries[scope]
+                entry = None
+
+            if entry is None:
+                self._entries[scope] = _Entry(
+                    fingerprint=fingerprint,
+                    expires_at=time.monotonic() + self.ttl_seconds,
+                )
+                self._evict()
+                return None
+
+            if entry.fingerprint != fingerprint:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"{IDEMPOTENCY_HEADER} was already used for a different request",
+                )
+            if entry.response is not None:
+                self._entries.move_to_end(scope)
+                return entry.response
+
+            await entry.done.wait()
+            # Loop: either a response was recorded, or the owner gave up and
+            # the key is free to claim again.
+
+    def complete(self, scope: str, response: StoredResponse) -> None:
+        entry = self._entries.get(scope)
+        if entry is None:
+            return
+        entry.response = response
+        entry.expires_at = time.monotonic() + self.ttl_seconds
+        entry.done.set()
+
+    def abandon(self, scope: str) -> None:
+        entry = self._entries.pop(scope, None)
+        if entry is not None:
+            entry.done.set()
+
+    def clear(self) -> None:
+        for entry in self._entries.values():
+            entry.done.set()
+        self._entries.clear()
+
+    def _evict(self) -> None:
+        # Oldest entries go first; in-flight entries are skipped so waiters
+        # are never orphaned.
+        overflow = len(self._entries) - self.max_entries
+        if overflow <= 0:
+            return
+        for scope in list(self._entries):
+            if overflow <= 0:
+                break
+            if self._entries[scope].response is not None:
+                del self._entries[scope]
+                overflow -= 1
+
+
+idempotency_store = IdempotencyStore(
+    max_entries=settings.idempotency_max_entries,
+    ttl_seconds=settings.idempotency_ttl_seconds,
+)
+
+
+def _scope(request: Request, key: str) -> str:
+    credentials = request.headers.get("authorization", "")
+    digest = hashlib.sha256(credentials.encode()).hexdigest()
+    return f"{digest}:{request.method}:{request.url.path}:{key}"
+
+
+class IdempotentRoute(APIRoute):
+    """Route class that honours the ``Idempotency-Key`` request header."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def idempotent_handler(request: Request) -> Response:
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if key is None or request.method not in _MUTATING_METHODS:
+                return await handler(request)
+            if not key or len(key) > MAX_KEY_LENGTH:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"{IDEMPOTENCY_HEADER} must be 1-{MAX_KEY_LENGTH} characters",
+                )
+
+            scope = _scope(request, key)
+            fingerprint = hashlib.sha256(await request.body()).hexdigest()
+            stored = await idempotency_store.begin(scope, fingerprint)
+            if stored is not None:
+                return stored.to_response()
+
+            try:
+                response = await handler(request)
+            except BaseException:
+                idempotency_store.abandon(scope)
+                raise
+
+            # Only successful, fully buffered responses are replayable; errors
+            # rolled back their transaction, so retrying them is safe.
+            body = getattr(response, "body", None)
+            if 200 <= response.status_code < 300 and isinstance(body, bytes):
+                idempotency_store.complete(
+                    scope, StoredResponse(response.status_code, body, response.media_type),
+                )
+            else:
+                idempotency_store.abandon(scope)
+            return response
+
+        return idempotent_handler
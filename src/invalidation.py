@@ -0,0 +1,143 @@
+"""Cross-worker cache invalidation.
+
+Writers call :meth:`InvalidationBus.publish` inside their transaction. The
+message (``entity:id:version``) is dispatched to this worker's subscribers
+once the session commits, and dropped if it rolls back. On PostgreSQL it is
+also sent with ``pg_notify``, which the database delivers to every listener
+only when the transaction commits; each worker holds one dedicated asyncpg
+connection that runs ``LISTEN`` and fans notifications out to its subscribers.
+Without PostgreSQL (SQLite, tests) only the local dispatch happens.
+
+When the listening connection drops, notifications may have been missed, so
+every subscriber is cleared on reconnect.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Protocol
+
+import asyncpg
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "courier_invalidation"
+_PENDING = "pending_invalidations"
+_HEALTHCHECK_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class Invalidation:
+    entity: str
+    id: str
+    # Microseconds since the epoch at publish time; later changes have larger versions.
+    version: int
+
+    def encode(self) -> str:
+        return f"{self.entity}:{self.id}:{self.version}"
+
+    @classmethod
+    def decode(cls, payload: str) -> "Invalidation":
+        entity, entity_id, version = payload.split(":", 2)
+        return cls(entity, entity_id, int(version))
+
+
+class Subscriber(Protocol):
+    def invalidate(self, entity_id: str, version: int) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InvalidationBus:
+    def __init__(self) -> None:
+        self._subscribers: dict[str, list[Subscriber]] = defaultdict(list)
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, entity: str, subscriber: Subscriber) -> None:
+        self._subscribers[entity].append(subscriber)
+
+    async def publish(self, db: AsyncSession, entity: str, entity_id: object) -> None:
+        """Announce that ``entity_id`` changed in ``db``'s current transaction."""
+        invalidation = Invalidation(entity, str(entity_id), time.time_ns() // 1000)
+        db.sync_session.info.setdefault(_PENDING, []).append(invalidation)
+        if db.get_bind().dialect.name == "postgresql":
+            await db.execute(select(func.pg_notify(CHANNEL, invalidation.encode())))
+
+    def dispatch(self, invalidation: Invalidation) -> None:
+        for subscriber in self._subscribers.get(invalidation.entity, ()):
+            try:
+                subscriber.invalidate(invalidation.id, invalidation.version)
+            except Exception:
+                logger.exception("Invalidation subscriber failed for %s", invalidation.encode())
+
+    def reset(self) -> None:
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                subscriber.clear()
+
+    def start(self, dsn: str) -> None:
+        self._task = asyncio.create_task(self._listen(dsn), name="invalidation-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _on_notify(self, _connection, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            invalidation = Invalidation.decode(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed invalidation payload %r", payload)
+            return
+        self.dispatch(invalidation)
+
+    async def _listen(self, dsn: str) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _conn: lost.set())
+                await connection.add_listener(CHANNEL, self._on_notify)
+                # Anything may have changed while we were not listening.
+                self.reset()
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), timeout=_HEALTHCHECK_SECONDS)
+                    except asyncio.TimeoutError:
+                        # A half-open TCP connection never reports termination.
+                        await connection.execute("SELECT 1", timeout=_HEALTHCHECK_SECONDS)
+                logger.warning("Invalidation listener connection lost; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation listener failed")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(settings.invalidation_reconnect_seconds)
+
+
+invalidation_bus = InvalidationBus()
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_after_commit(session: Session) -> None:
+    for invalidation in session.info.pop(_PENDING, ()):
+        invalidation_bus.dispatch(invalidation)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,198 @@
+"""Move terminal jobs out of the hot ``jobs`` table into ``jobs_archive``.
+
+Delivered and failed jobs older than ``archive_after_days`` are copied into
+the archive in batches, each in its own transaction, together with their
+proof of delivery and status history; the live rows (and their outbox events)
+are then deleted. SLA breaches are left in place: they reference the job by
+id only and stay queryable after it is archived. Run it periodically, e.g. from cron:
+
+    python -m src.jobs.archive --days 90 --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import logging
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import lazyload, selectinload
+
+from src.config import settings
+from src.models.job import Job, JobStatus
+from src.models.job_archive import JobArchive
+from src.models.job_status_event import JobStatusEvent
+from src.models.pod import POD
+from src.models.webhook import OutboxEvent, WebhookDelivery
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = (JobStatus.DELIVERED, JobStatus.FAILED)
+
+
+def _month_start(value: datetime) -> date:
+    # Partition bounds are in UTC.
+    value = value.astimezone(timezone.utc) if value.tzinfo else value
+    return date(value.year, value.month, 1)
+
+
+def _next_month(value: date) -> date:
+    return date(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+async def _ensure_partitions(db: AsyncSession, months: set[date]) -> None:
+    """Create the monthly ``jobs_archive`` partitions a batch is about to fill."""
+    for month in sorted(months):
+        await db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS jobs_archive_{month:%Y_%m} PARTITION OF jobs_archive "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{_next_month(month).isoformat()} 00:00:00+00')"
+        ))
+
+
+def _pod_snapshot(pod: POD | None) -> dict | None:
+    if pod is None:
+        return None
+    return {
+        "signed_by": pod.signed_by,
+        "signed_at": pod.signed_at.isoformat(),
+        "signature_url": pod.signature_url,
+        "photo_url": pod.photo_url,
+        "photo_thumbnail_url": pod.photo_thumbnail_url,
+        "notes": pod.notes,
+    }
+
+
+def _history(events: list[JobStatusEvent]) -> list[dict]:
+    return [
+        {
+            "from_status": event.from_status.value if event.from_status else None,
+            "to_status": event.to_status.value,
+            "occurred_at": event.occurred_at.isoformat(),
+            "source": event.source,
+            "driver_id": str(event.driver_id) if event.driver_id else None,
+        }
+        for event in events
+    ]
+
+
+async def archive_batch(db: AsyncSession, cutoff: datetime, batch_size: int) -> int:
+    """Archive up to ``batch_size`` terminal jobs created before ``cutoff``; return how many."""
+    postgres = db.get_bind().dialect.name == "postgresql"
+    query = (
+        select(Job.id)
+        .where(Job.status.in_(TERMINAL_STATUSES), Job.created_at < cutoff)
+        .order_by(Job.created_at)
+        .limit(batch_size)
+    )
+    if postgres:
+        # Lets several archivers (or a retry overlapping a slow run) share the work.
+        query = query.with_for_update(skip_locked=True)
+    job_ids = list((await db.execute(query)).scalars())
+    if not job_ids:
+        return 0
+
+    jobs = (await db.execute(
+        select(Job).where(Job.id.in_(job_ids)).options(lazyload("*"), selectinload(Job.pod))
+    )).scalars().all()
+    events: dict[uuid.UUID, list[JobStatusEvent]] = {job_id: [] for job_id in job_ids}
+    for event in (await db.execute(
+        select(JobStatusEvent)
+        .where(JobStatusEvent.job_id.in_(job_ids))
+        .order_by(JobStatusEvent.occurred_at, JobStatusEvent.created_at)
+    )).scalars():
+        events[event.job_id].append(event)
+
+    if postgres:
+        await _ensure_partitions(db, {_month_start(job.created_at) for job in jobs})
+    now = datetime.now(timezone.utc)
+    await db.execute(insert(JobArchive), [
+        {
+            "id": job.id,
+            "created_at": job.created_at,
+            "updated_at": job.updated_at,
+            "tracking_id": job.tracking_id,
+            "status": job.status,
+            "customer_id": job.customer_id,
+            "driver_id": job.driver_id,
+            "pickup_address": job.pickup_address,
+            "dropoff_address": job.dropoff_address,
+            "description": job.description,
+            "special_instructions": job.special_instructions,
+            "pickup_lat": job.pickup_lat,
+            "pickup_lng": job.pickup_lng,
+            "dropoff_lat": job.dropoff_lat,
+            "dropoff_lng": job.dropoff_lng,
+            "pickup_window_start": job.pickup_window_start,
+            "pickup_window_end": job.pickup_window_end,
+            "delivery_window_start": job.delivery_window_start,
+            "delivery_window_end": job.delivery_window_end,
+            "pod": _pod_snapshot(job.pod),
+            "history": _history(events[job.id]),
+            "archived_at": now,
+        }
+        for job in jobs
+    ])
+
+    # The foreign keys cascade on PostgreSQL; delete children explicitly so
+    # SQLite (no FK enforcement by default) ends up in the same state.
+    outbox_ids = select(OutboxEvent.id).where(OutboxEvent.job_id.in_(job_ids))
+    await db.execute(delete(WebhookDelivery).where(WebhookDelivery.event_id.in_(outbox_ids)))
+    await db.execute(delete(OutboxEvent).where(OutboxEvent.job_id.in_(job_ids)))
+    await db.execute(delete(JobStatusEvent).where(JobStatusEvent.job_id.in_(job_ids)))
+    await db.execute(delete(POD).where(POD.job_id.in_(job_ids)))
+    await db.execute(delete(Job).where(Job.id.in_(job_ids)))
+    return len(job_ids)
+
+
+async def archive_terminal_jobs(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    older_than_days: int | None = None,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+) -> int:
+    """Archive in committed batches until nothing is left; return the number of jobs moved."""
+    days = settings.archive_after_days if older_than_days is None else older_than_days
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    total = batches = 0
+    while max_batches is None or batches < max_batches:
+        async with session_factory() as db:
+            moved = await archive_batch(db, cutoff, batch_size or settings.archive_batch_size)
+            await db.commit()
+        if not moved:
+            break
+        total += moved
+        batches += 1
+        logger.info("Archived %d jobs (%d total)", moved, total)
+    return total
+
+
+async def get_archived_job_by_tracking_id(db: AsyncSession, tracking_id: str) -> JobArchive | None:
+    result = await db.execute(select(JobArchive).where(JobArchive.tracking_id == tracking_id))
+    return result.scalars().first()
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from src.database import async_session_factory, engine
+
+    try:
+        total = await archive_terminal_jobs(
+            async_session_factory,
+            older_than_days=args.days,
+            batch_size=args.batch_size,
+            max_batches=args.max_batches,
+        )
+        print(f"Archived {total} jobs")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Move old delivered/failed jobs into jobs_archive.")
+    parser.add_argument("--days", type=int, default=None, help="default: COURIER_ARCHIVE_AFTER_DAYS")
+    parser.add_argument("--batch-size", type=int, default=None, help="default: COURIER_ARCHIVE_BATCH_SIZE")
+    parser.add_argument("--max-batches", type=int, default=None)
+    asyncio.run(_main(parser.parse_args()))
@@ -0,0 +1,167 @@
+"""Pending jobs ordered by how soon they must be started.
+
+``dispatch_queue`` keeps every pending job in a binary heap keyed by its
+latest start time: the end of the pickup window, or the end of the delivery
+window less the estimated pickup-to-dropoff leg, whichever is earlier. Jobs
+without a window sort after all windowed ones, oldest first.
+
+The heap is built from the database at startup (or on first use) and kept
+current through job invalidations on the bus: a job created or changed on
+any worker is marked dirty and re-read, in one query for all dirty jobs,
+before the next lookup. Removal is lazy; a stale entry is skipped when
+reached and the heap is compacted once stale entries outnumber live ones.
+"""
+
+import asyncio
+import heapq
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.eta.speeds import speed_table
+from src.geo import haversine_m
+from src.invalidation import invalidation_bus
+from src.jobs.service import JOB_ENTITY
+from src.models.job import Job, JobStatus
+from src.timeutils import as_utc
+
+NO_DEADLINE = datetime.max.replace(tzinfo=timezone.utc)
+# Past this many dirty jobs a full rebuild is cheaper than a targeted refresh.
+_MAX_DIRTY = 5_000
+
+_QUEUE_COLUMNS = (
+    Job.id, Job.status, Job.created_at,
+    Job.pickup_lat, Job.pickup_lng, Job.dropoff_lat, Job.dropoff_lng,
+    Job.pickup_window_end, Job.delivery_window_end,
+)
+
+
+def latest_start(job) -> datetime | None:
+    """The latest time a driver can set off on ``job`` and still meet its windows."""
+    deadlines = []
+    if job.pickup_window_end is not None:
+        deadlines.append(as_utc(job.pickup_window_end))
+    if job.delivery_window_end is not None:
+        delivery_end = as_utc(job.delivery_window_end)
+        leg_s = 0.0
+        if job.pickup_lat is not None and job.dropoff_lat is not None:
+            distance_m = haversine_m(job.pickup_lat, job.pickup_lng, job.dropoff_lat, job.dropoff_lng)
+            leg_s = distance_m / speed_table.speed(None, delivery_end)
+        deadlines.append(delivery_end - timedelta(seconds=leg_s))
+    return min(deadlines) if deadlines else None
+
+
+@dataclass(order=True, slots=True)
+class QueueEntry:
+    latest_start: datetime
+    created_at: datetime
+    job_id: uuid.UUID
+    live: bool = field(default=True, compare=False)
+
+
+class DispatchQueue:
+    def __init__(self) -> None:
+        self._heap: list[QueueEntry] = []
+        self._entries: dict[uuid.UUID, QueueEntry] = {}
+        self._dirty: set[uuid.UUID] = set()
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, job_id: uuid.UUID, deadline: datetime | None, created_at: datetime) -> None:
+        self.discard(job_id)
+        entry = QueueEntry(deadline or NO_DEADLINE, as_utc(created_at), job_id)
+        self._entries[job_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def discard(self, job_id: uuid.UUID) -> None:
+        entry = self._entries.pop(job_id, None)
+        if entry is None:
+            return
+        entry.live = False
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [entry for entry in self._heap if entry.live]
+            heapq.heapify(self._heap)
+
+    def most_urgent(self, limit: int) -> list[QueueEntry]:
+        """The ``limit`` most urgent live entries, without disturbing the heap.
+
+        Walks the heap best-first with a small frontier heap of candidate
+        positions, so the cost is O(limit log limit) plus stale entries passed.
+        """
+        heap = self._heap
+        result: list[QueueEntry] = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(result) < limit:
+            entry, index = heapq.heappop(frontier)
+            if entry.live:
+                result.append(entry)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return result
+
+    # Bus subscriber interface.
+    def invalidate(self, entity_id: str, version: int) -> None:
+        self._dirty.add(uuid.UUID(entity_id))
+
+    def clear(self) -> None:
+        self._loaded = False
+        self._dirty.clear()
+
+    async def sync(self, db: AsyncSession) -> None:
+        """Bring the heap up to date with the database: rebuild, or re-read dirty jobs."""
+        async with self._lock:
+            if not self._loaded or len(self._dirty) > _MAX_DIRTY:
+                self._dirty.clear()
+                result = await db.execute(select(*_QUEUE_COLUMNS).where(Job.status == JobStatus.PENDING))
+                self._heap, self._entries = [], {}
+                for row in result:
+                    self._entries[row.id] = QueueEntry(
+                        latest_start(row) or NO_DEADLINE, as_utc(row.created_at), row.id,
+                    )
+                self._heap = list(self._entries.values())
+                heapq.heapify(self._heap)
+                self._loaded = True
+                return
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, set()
+            result = await db.execute(select(*_QUEUE_COLUMNS).where(Job.id.in_(dirty)))
+            for row in result:
+                dirty.discard(row.id)
+                if row.status == JobStatus.PENDING:
+                    self.push(row.id, latest_start(row), row.created_at)
+                else:
+                    self.discard(row.id)
+            for job_id in dirty:  # no longer exists (archived)
+                self.discard(job_id)
+
+
+dispatch_queue = DispatchQueue()
+invalidation_bus.subscribe(JOB_ENTITY, dispatch_queue)
+
+
+async def most_urgent(db: AsyncSession, limit: int) -> list[QueueEntry]:
+    """The ``limit`` pending jobs that must be started soonest; for dispatch views and auto-assignment."""
+    await dispatch_queue.sync(db)
+    return dispatch_queue.most_urgent(limit)
+
+
+async def queued_jobs(db: AsyncSession, limit: int) -> list[tuple[Job, datetime | None]]:
+    """The most urgent pending jobs, loaded, with their latest start times."""
+    entries = await most_urgent(db, limit)
+    if not entries:
+        return []
+    result = await db.execute(select(Job).where(Job.id.in_([entry.job_id for entry in entries])))
+    jobs = {job.id: job for job in result.scalars()}
+    return [
+        (jobs[entry.job_id], None if entry.latest_start == NO_DEADLINE else entry.latest_start)
+        for entry in entries
+        if entry.job_id in jobs
+    ]
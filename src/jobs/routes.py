@@ -1,19 +1,49 @@
 import uuid
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.dependencies import require_roles
+from src.auth.dependencies import Principal, require_roles
 from src.database import get_db
-from src.jobs import service
+from src.idempotency import IdempotentRoute
+from src.jobs import dispatch, service
 from src.models.job import JobStatus
-from src.models.user import User, UserRole
-from src.schemas.job import JobAssign, JobCreate, JobListParams, JobRead, JobUpdate
+from src.models.user import UserRole
+from src.responses import NO_STORE, cache_control, json_response
+from src.schemas.job import (
+    JobAssign,
+    JobCreate,
+    JobListParams,
+    JobRead,
+    JobUpdate,
+    QueuedJobRead,
+    job_read_projection,
+)
 
-router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+router = APIRouter(
+    prefix="/api/jobs",
+    tags=["jobs"],
+    route_class=IdempotentRoute,
+    # Dispatch views must always reflect the live state of a job.
+    dependencies=[cache_control(NO_STORE)],
+)
 
-AdminOrDispatcher = Annotated[User, Depends(require_roles(UserRole.ADMIN, UserRole.DISPATCHER))]
+AdminOrDispatcher = Annotated[Principal, Depends(require_roles(UserRole.ADMIN, UserRole.DISPATCHER))]
+
+_job_list_adapter = TypeAdapter(list[JobRead])
+
+FIELDS_QUERY = Query(
+    default=None,
+    description=f"Comma-separated subset of: {', '.join(service.JOB_FIELDS)}. Only these columns are read.",
+)
+
+
+@lru_cache(maxsize=128)
+def _projection_list_adapter(fields: tuple[str, ...]) -> TypeAdapter:
+    return TypeAdapter(list[job_read_projection(fields)])
 
 
 @router.post("", response_model=JobRead, status_code=201)
@@ -29,6 +59,11 @@ async def create_job(
         dropoff_address=body.dropoff_address,
         description=body.description,
         special_instructions=body.special_instructions,
+        pickup_lat=body.pickup_lat,
+        pickup_lng=body.pickup_lng,
+        dropoff_lat=body.dropoff_lat,
+        dropoff_lng=body.dropoff_lng,
+        windows=body.model_dump(include=set(service.WINDOW_FIELDS)),
     )
     return job
 
@@ -37,24 +72,48 @@ async def create_job(
 async def list_jobs(
     db: Annotated[AsyncSession, Depends(get_db)],
     _current_user: AdminOrDispatcher,
+    q: str | None = Query(default=None, min_length=1, max_length=100),
     status: JobStatus | None = Query(default=None),
     created_after: str | None = Query(default=None),
     created_before: str | None = Query(default=None),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=200),
+    fields: str | None = FIELDS_QUERY,
 ):
     from datetime import datetime
 
+    projection = service.parse_fields(fields)
     after = datetime.fromisoformat(created_after) if created_after else None
     before = datetime.fromisoformat(created_before) if created_before else None
-    return await service.list_jobs(
+    rows = await service.list_jobs(
         db,
+        search=q,
         status_filter=status,
         created_after=after,
         created_before=before,
         skip=skip,
         limit=limit,
+        fields=projection,
     )
+    # Validate and encode the rows in one pass in pydantic-core, skipping
+    # FastAPI's per-field jsonable_encoder walk.
+    adapter = _job_list_adapter if projection is None else _projection_list_adapter(projection)
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    return json_response(body)
+
+
+@router.get("/dispatch-queue", response_model=list[QueuedJobRead])
+async def dispatch_queue(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+    limit: int = Query(default=20, ge=1, le=200),
+):
+    """Pending jobs, the one that must be started soonest first."""
+    queued = await dispatch.queued_jobs(db, limit)
+    return [
+        QueuedJobRead.model_validate(job).model_copy(update={"latest_start": latest_start})
+        for job, latest_start in queued
+    ]
 
 
 @router.get("/{job_id}", response_model=JobRead)
@@ -62,8 +121,13 @@ async def get_job(
     job_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
     _current_user: AdminOrDispatcher,
+    fields: str | None = FIELDS_QUERY,
 ):
-    return await service.get_job(db, job_id)
+    projection = service.parse_fields(fields)
+    if projection is None:
+        return await service.get_job(db, job_id)
+    row = await service.get_job_fields(db, job_id, projection)
+    return json_response(job_read_projection(projection).model_validate(row).model_dump_json().encode())
 
 
 @router.patch("/{job_id}", response_model=JobRead)
@@ -80,6 +144,10 @@ async def update_job(
         kwargs["dropoff_address"] = body.dropoff_address
     if body.status is not None:
         kwargs["new_status"] = body.status
+    # Only windows present in the request change; an explicit null clears one.
+    windows = body.model_dump(include=set(service.WINDOW_FIELDS), exclude_unset=True)
+    if windows:
+        kwargs["windows"] = windows
     return await service.update_job(db, job_id, **kwargs)
 
 
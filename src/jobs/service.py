@@ -1,15 +1,24 @@
-import secrets
-import string
+import re
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Row, func, literal_column, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
+from src.invalidation import invalidation_bus
 from src.models.customer import Customer
 from src.models.driver import Driver
 from src.models.job import Job, JobStatus
+from src.models.job_status_event import JobStatusEvent
+from src.tracking.ids import generate_tracking_id, normalize
+from src.webhooks.outbox import enqueue_status_change
+
+# Entity names for cache invalidation messages: a job changed, and a job was
+# assigned to a driver (keyed by driver ID).
+JOB_ENTITY = "job"
+DRIVER_JOBS_ENTITY = "driver_jobs"
 
 ALLOWED_TRANSITIONS: dict[JobStatus, set[JobStatus]] = {
     JobStatus.PENDING: {JobStatus.ASSIGNED},
@@ -32,9 +41,35 @@ def validate_transition(current: JobStatus, target: JobStatus) -> None:
         )
 
 
-def _generate_tracking_id(length: int = 12) -> str:
-    alphabet = string.ascii_uppercase + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+async def transition_job(
+    db: AsyncSession,
+    job: Job,
+    new_status: JobStatus,
+    *,
+    occurred_at: datetime | None = None,
+    source: str = "api",
+    idempotency_key: str | None = None,
+) -> JobStatusEvent:
+    """Move ``job`` to ``new_status`` and record the transition in the event log.
+
+    Every status change goes through here so that the change, its event row
+    and its webhook outbox row are written in the same transaction.
+    """
+    validate_transition(job.status, new_status)
+    event = JobStatusEvent(
+        job_id=job.id,
+        from_status=job.status,
+        to_status=new_status,
+        occurred_at=occurred_at or datetime.now(timezone.utc),
+        source=source,
+        driver_id=job.driver_id,
+        idempotency_key=idempotency_key,
+    )
+    job.status = new_status
+    db.add(event)
+    enqueue_status_change(db, job, event)
+    await invalidation_bus.publish(db, JOB_ENTITY, job.id)
+    return event
 
 
 async def create_job(
@@ -45,44 +80,190 @@ async def create_job(
     dropoff_address: str,
     description: str | None = None,
     special_instructions: str | None = None,
+    pickup_lat: float | None = None,
+    pickup_lng: float | None = None,
+    dropoff_lat: float | None = None,
+    dropoff_lng: float | None = None,
+    windows: dict[str, datetime | None] | None = None,
 ) -> Job:
     result = await db.execute(select(Customer).where(Customer.id == customer_id))
     if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found")
 
     job = Job(
-        tracking_id=_generate_tracking_id(),
+        id=uuid.uuid4(),
+        tracking_id=generate_tracking_id(),
         customer_id=customer_id,
         pickup_address=pickup_address,
         dropoff_address=dropoff_address,
         description=description,
         special_instructions=special_instructions,
+        pickup_lat=pickup_lat,
+        pickup_lng=pickup_lng,
+        dropoff_lat=dropoff_lat,
+        dropoff_lng=dropoff_lng,
+        **(windows or {}),
         status=JobStatus.PENDING,
     )
     db.add(job)
+    db.add(JobStatusEvent(job_id=job.id, from_status=None, to_status=JobStatus.PENDING))
+    await invalidation_bus.publish(db, JOB_ENTITY, job.id)
     await db.flush()
     await db.refresh(job)
     return job
 
 
-async def get_job(db: AsyncSession, job_id: uuid.UUID) -> Job:
-    result = await db.execute(select(Job).where(Job.id == job_id))
+async def get_job(db: AsyncSession, job_id: uuid.UUID, *, for_update: bool = False) -> Job:
+    query = select(Job).where(Job.id == job_id)
+    if for_update:
+        query = query.with_for_update()
+    result = await db.execute(query)
     job = result.scalar_one_or_none()
     if job is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
     return job
 
 
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _prefix_tsquery(term: str) -> str | None:
+    words = re.findall(r"\w+", term)
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+# Search terms shorter than a trigram cannot use the pg_trgm indexes for a
+# substring match; they only match the start of the tracking ID.
+MIN_SUBSTRING_SEARCH = 3
+# A term matching more customers than this is too broad to be useful; only
+# the first ones are used.
+MAX_SEARCH_CUSTOMERS = 500
+
+
+async def _matching_customer_ids(db: AsyncSession, pattern: str) -> list[uuid.UUID]:
+    result = await db.execute(
+        select(Customer.id)
+        .where(or_(
+            Customer.company_name.ilike(pattern, escape="\\"),
+            Customer.contact_name.ilike(pattern, escape="\\"),
+        ))
+        .limit(MAX_SEARCH_CUSTOMERS)
+    )
+    return list(result.scalars())
+
+
+async def _search_clause(db: AsyncSession, term: str) -> ColumnElement[bool]:
+    """Match ``term`` against tracking ID, addresses, description and customer name.
+
+    On PostgreSQL the substring matches are served by the pg_trgm GIN indexes
+    and the description by a ``simple`` tsvector index (migration 004). The
+    matching customers are looked up first, so every branch of the ``OR`` is
+    an index condition and the planner can combine them in a BitmapOr rather
+    than scanning ``jobs``. Other dialects fall back to plain case-insensitive
+    LIKE. Terms shorter than ``MIN_SUBSTRING_SEARCH`` only match a tracking ID
+    prefix, which the trigram index still serves.
+    """
+    if len(term) < MIN_SUBSTRING_SEARCH:
+        return Job.tracking_id.startswith(normalize(term), autoescape=True)
+
+    pattern = f"%{_escape_like(term)}%"
+    clauses = [
+        Job.tracking_id.ilike(pattern, escape="\\"),
+        Job.pickup_address.ilike(pattern, escape="\\"),
+        Job.dropoff_address.ilike(pattern, escape="\\"),
+    ]
+    if customer_ids := await _matching_customer_ids(db, pattern):
+        clauses.append(Job.customer_id.in_(customer_ids))
+    if db.get_bind().dialect.name == "postgresql":
+        tsquery = _prefix_tsquery(term)
+        if tsquery is not None:
+            document = func.to_tsvector(
+                literal_column("'simple'"), func.coalesce(Job.description, literal_column("''")),
+            )
+            clauses.append(document.op("@@")(func.to_tsquery(literal_column("'simple'"), tsquery)))
+    else:
+        clauses.append(Job.description.ilike(pattern, escape="\\"))
+    return or_(*clauses)
+
+
+# The columns of ``JobRead``; listing selects these instead of whole entities so
+# no relationships are loaded and rows go straight into the response model.
+JOB_READ_COLUMNS = (
+    Job.id,
+    Job.tracking_id,
+    Job.status,
+    Job.customer_id,
+    Job.driver_id,
+    Job.pickup_address,
+    Job.dropoff_address,
+    Job.description,
+    Job.special_instructions,
+    Job.pickup_lat,
+    Job.pickup_lng,
+    Job.dropoff_lat,
+    Job.dropoff_lng,
+    Job.pickup_window_start,
+    Job.pickup_window_end,
+    Job.delivery_window_start,
+    Job.delivery_window_end,
+    Job.created_at,
+    Job.updated_at,
+)
+
+WINDOW_FIELDS = ("pickup_window_start", "pickup_window_end", "delivery_window_start", "delivery_window_end")
+
+# ``fields=`` names accepted by the job endpoints, in response order.
+JOB_FIELDS = tuple(column.key for column in JOB_READ_COLUMNS)
+_COLUMNS_BY_FIELD = {column.key: column for column in JOB_READ_COLUMNS}
+
+
+def parse_fields(raw: str | None) -> tuple[str, ...] | None:
+    """Parse a comma-separated ``fields=`` value into ``JOB_FIELDS`` order.
+
+    ``None`` (parameter absent) means every field.
+    """
+    if raw is None:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - _COLUMNS_BY_FIELD.keys()
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}" if unknown else "No fields requested",
+        )
+    return tuple(name for name in JOB_FIELDS if name in requested)
+
+
+def _columns(fields: tuple[str, ...] | None) -> tuple:
+    if fields is None:
+        return JOB_READ_COLUMNS
+    return tuple(_COLUMNS_BY_FIELD[name] for name in fields)
+
+
+async def get_job_fields(db: AsyncSession, job_id: uuid.UUID, fields: tuple[str, ...]) -> Row:
+    """Fetch only the requested columns of one job, without loading the entity."""
+    result = await db.execute(select(*_columns(fields)).where(Job.id == job_id))
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return row
+
+
 async def list_jobs(
     db: AsyncSession,
     *,
+    search: str | None = None,
     status_filter: JobStatus | None = None,
     created_after: datetime | None = None,
     created_before: datetime | None = None,
     skip: int = 0,
     limit: int = 50,
-) -> list[Job]:
-    query = select(Job)
+    fields: tuple[str, ...] | None = None,
+) -> list[Row]:
+    query = select(*_columns(fields))
+    if search:
+        query = query.where(await _search_clause(db, search))
     if status_filter is not None:
         query = query.where(Job.status == status_filter)
     if created_after is not None:
@@ -91,7 +272,7 @@ async def list_jobs(
         query = query.where(Job.created_at <= created_before)
     query = query.order_by(Job.created_at.desc()).offset(skip).limit(limit)
     result = await db.execute(query)
-    return list(result.scalars().all())
+    return list(result.all())
 
 
 async def update_job(
@@ -103,12 +284,12 @@ async def update_job(
     description: str | None = ...,  # type: ignore[assignment]
     special_instructions: str | None = ...,  # type: ignore[assignment]
     new_status: JobStatus | None = None,
+    windows: dict[str, datetime | None] | None = None,
 ) -> Job:
     job = await get_job(db, job_id)
 
     if new_status is not None:
-        validate_transition(job.status, new_status)
-        job.status = new_status
+        await transition_job(db, job, new_status)
 
     if pickup_address is not None:
         job.pickup_address = pickup_address
@@ -118,6 +299,9 @@ async def update_job(
         job.description = description
     if special_instructions is not ...:
         job.special_instructions = special_instructions
+    for name, value in (windows or {}).items():
+        setattr(job, name, value)
+    await invalidation_bus.publish(db, JOB_ENTITY, job.id)
 
     await db.flush()
     await db.refresh(job)
@@ -135,14 +319,16 @@ async def assign_job(db: AsyncSession, job_id: uuid.UUID, driver_id: uuid.UUID)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Driver not found")
 
     job.driver_id = driver_id
-    job.status = JobStatus.ASSIGNED
+    await transition_job(db, job, JobStatus.ASSIGNED)
+    await invalidation_bus.publish(db, DRIVER_JOBS_ENTITY, driver_id)
     await db.flush()
     await db.refresh(job)
     return job
 
 
 async def get_job_by_tracking_id(db: AsyncSession, tracking_id: str) -> Job:
-    result = await db.execute(select(Job).where(Job.tracking_id == tracking_id))
+    # Tracking reads only the job's own columns; skip the eager relationships.
+    result = await db.execute(select(Job).where(Job.tracking_id == tracking_id).options(lazyload("*")))
     job = result.scalar_one_or_none()
     if job is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tracking ID not found")
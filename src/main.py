@@ -1,16 +1,88 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from src.auth.hashing import password_hasher
+from src.auth.revocation import revocation_list
+from src.auth.routes import router as auth_router
+from src.bulk_import.routes import router as import_router
+from src.config import settings
+from src.customers.routes import router as customer_router
+from src.database import async_session_factory, engine
+from src.drivers.routes import router as driver_router
+from src.eta.speeds import speed_table
+from src.invalidation import invalidation_bus
+from src.jobs.dispatch import dispatch_queue
 from src.jobs.routes import router as jobs_router
+from src.middleware import CacheControlMiddleware, CompressionMiddleware
+from src.pods import imaging
+from src.pods.routes import media_router
+from src.pods.routes import router as pods_router
+from src.sla.monitor import sla_monitor
+from src.sla.routes import router as sla_router
 from src.tracking.routes import router as tracking_router
+from src.trails.routes import router as trails_router
+from src.webhooks.routes import router as webhooks_router
+from src.webhooks.worker import WebhookWorker
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    revocation_list.start(async_session_factory)
+    speed_table.start(async_session_factory)
+    if engine.dialect.name == "postgresql":
+        invalidation_bus.start(engine.url.set(drivername="postgresql").render_as_string(hide_password=False))
+    async with async_session_factory() as db:
+        await dispatch_queue.sync(db)
+    if settings.sla_monitor_enabled:
+        sla_monitor.start(async_session_factory)
+    webhook_worker = WebhookWorker(async_session_factory) if settings.webhooks_enabled else None
+    if webhook_worker is not None:
+        webhook_worker.start()
+    yield
+    if webhook_worker is not None:
+        await webhook_worker.stop()
+    await revocation_list.stop()
+    await speed_table.stop()
+    await sla_monitor.stop()
+    await invalidation_bus.stop()
+    imaging.shutdown_executor()
+    password_hasher.shutdown()
+
 
 app = FastAPI(
     title="Pedal Over Petrol — Courier API",
     version="0.1.0",
     description="Phase 1: Job lifecycle management for the courier system.",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(CacheControlMiddleware)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_min_bytes,
+        encodings=settings.compression_encodings,
+        levels={
+            "gzip": settings.compression_gzip_level,
+            "br": settings.compression_brotli_quality,
+            "zstd": settings.compression_zstd_level,
+        },
+    )
+
+app.include_router(auth_router)
 app.include_router(jobs_router)
+app.include_router(pods_router)
+app.include_router(media_router)
 app.include_router(tracking_router)
+app.include_router(trails_router)
+app.include_router(driver_router)
+app.include_router(customer_router)
+app.include_router(webhooks_router)
+app.include_router(sla_router)
+app.include_router(import_router)
 
 
 @app.get("/health")
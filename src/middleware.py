@@ -0,0 +1,212 @@
+"""ASGI middleware for response compression and Cache-Control policies.
+
+Compression negotiates brotli, zstd or gzip from ``Accept-Encoding``; brotli
+and zstd are used only when their packages are installed. Buffered responses
+smaller than ``minimum_size`` go out as-is, and streaming responses are
+compressed chunk by chunk.
+"""
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only without brotli installed
+    brotli = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard installed
+    zstandard = None  # type: ignore[assignment]
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/problem+json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def available_encodings() -> set[str]:
+    encodings = {"gzip"}
+    if brotli is not None:
+        encodings.add("br")
+    if zstandard is not None:
+        encodings.add("zstd")
+    return encodings
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def choose_encoding(accept_encoding: str | None, preference: list[str]) -> str | None:
+    """Pick the first of ``preference`` the client accepts (q > 0)."""
+    if not accept_encoding:
+        return None
+    accepted = _accepted_encodings(accept_encoding)
+    return next((encoding for encoding in preference if encoding in accepted), None)
+
+
+class _Compressor:
+    """Uniform streaming interface over the gzip, brotli and zstd compressors."""
+
+    def __init__(self, encoding: str, level: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._impl = brotli.Compressor(quality=level)
+        elif encoding == "zstd":
+            self._impl = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._impl = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._impl.process(data)
+        return self._impl.compress(data)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._impl.finish()
+        return self._impl.flush()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 512,
+        encodings: list[str] | None = None,
+        levels: dict[str, int] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        available = available_encodings()
+        self.encodings = [e for e in (encodings or ["br", "zstd", "gzip"]) if e in available]
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        responder = _CompressionResponder(send, encoding, self.levels.get(encoding or "", 0), self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str | None, level: int, minimum_size: int) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._level = level
+        self._minimum_size = minimum_size
+        self._start: Message | None = None
+        self._compressor: _Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if self._start is not None:
+            await self._first_body(self._start, message)
+            self._start = None
+            return
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        more_body = message.get("more_body", False)
+        chunk = self._compressor.compress(message.get("body", b""))
+        if not more_body:
+            chunk += self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _first_body(self, start: Message, message: Message) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        content_type = headers.get("content-type", "")
+
+        if not content_type.startswith(COMPRESSIBLE_TYPES) or start["status"] in (204, 304):
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+        if (
+            self._encoding is None
+            or "content-encoding" in headers
+            or "no-transform" in headers.get("cache-control", "")
+            or (not more_body and len(body) < self._minimum_size)
+        ):
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        self._compressor = _Compressor(self._encoding, self._level)
+        headers["Content-Encoding"] = self._encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The compressed bytes differ from the identity representation.
+            headers["ETag"] = f"W/{etag}"
+
+        chunk = self._compressor.compress(body)
+        if more_body:
+            del headers["content-length"]
+        else:
+            chunk += self._compressor.finish()
+            headers["Content-Length"] = str(len(chunk))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+class CacheControlMiddleware:
+    """Apply the Cache-Control policy a route declared with ``responses.cache_control``.
+
+    Only successful and 304 responses get the policy; headers a route sets
+    itself are left alone.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_policy(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                policy = scope.get("state", {}).get("cache_control")
+                status = message["status"]
+                if policy is not None and (200 <= status < 300 or status == 304):
+                    headers = MutableHeaders(raw=message["headers"])
+                    headers.setdefault("Cache-Control", policy)
+            await send(message)
+
+        await self.app(scope, receive, send_with_policy)
@@ -1,18 +1,40 @@
 from src.models.base import Base
+from src.models.auth_session import AuthSession, RevokedToken
 from src.models.user import User
 from src.models.driver import Driver
+from src.models.driver_trail import DriverPosition, DriverTrailChunk
 from src.models.customer import Customer
+from src.models.export_watermark import ExportWatermark
 from src.models.job import Job, JobStatus
+from src.models.job_archive import JobArchive
+from src.models.job_status_event import JobStatusEvent
 from src.models.pod import POD
 from src.models.pricing_rule import PricingRule
+from src.models.sla import SlaBreach, SlaThreshold
+from src.models.travel_speed import TravelSpeed
+from src.models.webhook import OutboxEvent, WebhookDeadLetter, WebhookDelivery, WebhookSubscription
 
 __all__ = [
     "Base",
+    "AuthSession",
+    "RevokedToken",
     "User",
     "Driver",
+    "DriverPosition",
+    "DriverTrailChunk",
     "Customer",
+    "ExportWatermark",
     "Job",
     "JobStatus",
+    "JobArchive",
+    "JobStatusEvent",
     "POD",
     "PricingRule",
+    "SlaThreshold",
+    "SlaBreach",
+    "TravelSpeed",
+    "OutboxEvent",
+    "WebhookSubscription",
+    "WebhookDelivery",
+    "WebhookDeadLetter",
 ]
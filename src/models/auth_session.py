@@ -0,0 +1,49 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class AuthSession(Base):
+    """A login session, identified in access tokens by its ``sid`` claim.
+
+    Only a SHA-256 digest of the current refresh token secret is stored; the
+    secret rotates on every refresh.
+    """
+
+    __tablename__ = "auth_sessions"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False,
+    )
+    refresh_token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_auth_sessions_user_id", "user_id"),
+    )
+
+
+class RevokedToken(Base):
+    """A revoked session (``sid``) or user (``user:<id>``).
+
+    Access tokens issued at or before ``revoked_at`` for that id are rejected.
+    Rows are only needed until every such access token has expired, which is
+    what ``expires_at`` records.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    token_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_revoked_tokens_created_at", "created_at"),
+        Index("ix_revoked_tokens_expires_at", "expires_at"),
+    )
@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import ForeignKey, Index, String, Uuid
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -18,6 +19,10 @@ class Driver(Base):
     vehicle_type: Mapped[str] = mapped_column(String(100), nullable=False)
     license_plate: Mapped[str] = mapped_column(String(50), nullable=True)
     is_available: Mapped[bool] = mapped_column(default=True)
+    # Latest position fix reported by the driver app.
+    last_lat: Mapped[float | None] = mapped_column(Float, nullable=True)
+    last_lng: Mapped[float | None] = mapped_column(Float, nullable=True)
+    last_position_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     user: Mapped["User"] = relationship(back_populates="driver_profile", lazy="selectin")  # noqa: F821
     jobs: Mapped[list["Job"]] = relationship(back_populates="driver", lazy="selectin")  # noqa: F821
@@ -0,0 +1,45 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, Text, UniqueConstraint, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class DriverPosition(Base):
+    """A raw position fix, kept until ``src.trails.rollup`` folds it into a chunk."""
+
+    __tablename__ = "driver_positions"
+
+    driver_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("drivers.id", ondelete="CASCADE"), nullable=False,
+    )
+    lat: Mapped[float] = mapped_column(Float, nullable=False)
+    lng: Mapped[float] = mapped_column(Float, nullable=False)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    accuracy_m: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_driver_positions_driver_id_recorded_at", "driver_id", "recorded_at"),
+        Index("ix_driver_positions_recorded_at", "recorded_at"),
+    )
+
+
+class DriverTrailChunk(Base):
+    """One hour of a driver's trail, delta/polyline encoded (see ``src.trails.codec``)."""
+
+    __tablename__ = "driver_trail_chunks"
+
+    driver_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("drivers.id", ondelete="CASCADE"), nullable=False,
+    )
+    hour_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    point_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    encoded: Mapped[str] = mapped_column(Text, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("driver_id", "hour_start", name="uq_driver_trail_chunks_driver_hour"),
+    )
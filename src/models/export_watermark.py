@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class ExportWatermark(Base):
+    """How far the analytics export of one table has got.
+
+    Rows changed before ``watermark`` have been exported; the next run starts
+    from it.
+    """
+
+    __tablename__ = "export_watermarks"
+
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
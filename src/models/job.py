@@ -1,7 +1,8 @@
 import enum
 import uuid
+from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Uuid
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -37,15 +38,35 @@ class Job(Base):
     dropoff_address: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     special_instructions: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # WGS84 coordinates of the addresses, when known; they drive the geofences.
+    pickup_lat: Mapped[float | None] = mapped_column(Float, nullable=True)
+    pickup_lng: Mapped[float | None] = mapped_column(Float, nullable=True)
+    dropoff_lat: Mapped[float | None] = mapped_column(Float, nullable=True)
+    dropoff_lng: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Service windows agreed with the customer (same-day, 1-hour, ...).
+    pickup_window_start: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    pickup_window_end: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    delivery_window_start: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    delivery_window_end: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     customer: Mapped["Customer"] = relationship(back_populates="jobs", lazy="selectin")  # noqa: F821
     driver: Mapped["Driver | None"] = relationship(back_populates="jobs", lazy="selectin")  # noqa: F821
     pod: Mapped["POD | None"] = relationship(back_populates="job", uselist=False, lazy="selectin")  # noqa: F821
 
+    # PostgreSQL-only search indexes (pg_trgm on tracking_id/addresses and a
+    # tsvector index on description) are created by migration 004.
     __table_args__ = (
         Index("ix_jobs_status", "status"),
         Index("ix_jobs_created_at", "created_at"),
+        # Incremental analytics exports select rows changed since a watermark.
+        Index("ix_jobs_updated_at", "updated_at"),
         Index("ix_jobs_driver_id", "driver_id"),
-        Index("ix_jobs_customer_id", "customer_id"),
+        # Drivers poll for their active jobs; only a small slice of the table.
+        Index(
+            "ix_jobs_driver_id_active", "driver_id",
+            postgresql_where=text("status IN ('assigned', 'picked_up', 'in_transit')"),
+        ),
+        # Serves both customer_id lookups and the customer's newest-first listing.
+        Index("ix_jobs_customer_id_created_at", "customer_id", "created_at"),
         Index("ix_jobs_tracking_id", "tracking_id"),
     )
@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, DateTime, Float, Index, String, Text, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+from src.models.job import JobStatus
+
+
+class JobArchive(Base):
+    """Cold copy of a terminal job, moved out of ``jobs`` by ``src.jobs.archive``.
+
+    Each row is self-contained: the proof of delivery and status history are
+    folded in as JSON because their live tables cascade-delete with the job.
+    Customer and driver ids are kept as plain values, without foreign keys.
+    On PostgreSQL the table is range-partitioned by ``created_at`` into monthly
+    partitions (migration 009), which is why ``created_at`` is part of the key.
+    """
+
+    __tablename__ = "jobs_archive"
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    tracking_id: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[JobStatus] = mapped_column(nullable=False)
+    customer_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), nullable=False)
+    driver_id: Mapped[uuid.UUID | None] = mapped_column(Uuid(as_uuid=True), nullable=True)
+    pickup_address: Mapped[str] = mapped_column(String(500), nullable=False)
+    dropoff_address: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    special_instructions: Mapped[str | None] = mapped_column(Text, nullable=True)
+    pickup_lat: Mapped[float | None] = mapped_column(Float, nullable=True)
+    pickup_lng: Mapped[float | None] = mapped_column(Float, nullable=True)
+    dropoff_lat: Mapped[float | None] = mapped_column(Float, nullable=True)
+    dropoff_lng: Mapped[float | None] = mapped_column(Float, nullable=True)
+    pickup_window_start: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    pickup_window_end: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    delivery_window_start: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    delivery_window_end: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    pod: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    history: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        Index("ix_jobs_archive_tracking_id", "tracking_id"),
+        Index("ix_jobs_archive_customer_id_created_at", "customer_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
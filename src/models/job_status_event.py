@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+from src.models.job import JobStatus
+
+
+class JobStatusEvent(Base):
+    """Append-only log of job status transitions.
+
+    ``occurred_at`` is when the transition happened according to the client
+    (a driver app may report it long after the fact); ``created_at`` is when
+    the server recorded it.
+    """
+
+    __tablename__ = "job_status_events"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False,
+    )
+    from_status: Mapped[JobStatus | None] = mapped_column(nullable=True)
+    to_status: Mapped[JobStatus] = mapped_column(nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    source: Mapped[str] = mapped_column(String(20), nullable=False, default="api")
+    driver_id: Mapped[uuid.UUID | None] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("drivers.id", ondelete="SET NULL"), nullable=True,
+    )
+    idempotency_key: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+    __table_args__ = (
+        Index("ix_job_status_events_job_id", "job_id"),
+        Index("ix_job_status_events_created_at", "created_at"),
+        UniqueConstraint("driver_id", "idempotency_key", name="uq_job_status_events_driver_key"),
+    )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, Uuid
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -19,6 +19,7 @@ class POD(Base):
     signed_by: Mapped[str] = mapped_column(String(255), nullable=False)
     signature_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     photo_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    photo_thumbnail_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     signed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -26,3 +27,7 @@ class POD(Base):
     )
 
     job: Mapped["Job"] = relationship(back_populates="pod", lazy="selectin")  # noqa: F821
+
+    __table_args__ = (
+        Index("ix_pods_updated_at", "updated_at"),
+    )
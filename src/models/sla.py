@@ -0,0 +1,50 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+from src.models.job import JobStatus
+
+
+class SlaThreshold(Base):
+    """A customer's override of the default time allowed in one job status."""
+
+    __tablename__ = "sla_thresholds"
+
+    customer_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("customers.id", ondelete="CASCADE"), nullable=False,
+    )
+    status: Mapped[JobStatus] = mapped_column(nullable=False)
+    seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("customer_id", "status", name="uq_sla_thresholds_customer_status"),
+    )
+
+
+class SlaBreach(Base):
+    """A job that stayed in ``status`` longer than its threshold.
+
+    Unique per stay (job, status, entered_at), so every worker's monitor can
+    try to record the same breach and only one row results. ``job_id`` has no
+    foreign key: breaches outlive the job's move to ``jobs_archive``.
+    """
+
+    __tablename__ = "sla_breaches"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), nullable=False)
+    customer_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), nullable=False)
+    tracking_id: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[JobStatus] = mapped_column(nullable=False)
+    entered_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    threshold_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    breached_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("job_id", "status", "entered_at", name="uq_sla_breaches_job_status_entered"),
+        Index("ix_sla_breaches_breached_at", "breached_at"),
+        Index("ix_sla_breaches_customer_id_breached_at", "customer_id", "breached_at"),
+    )
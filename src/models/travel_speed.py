@@ -0,0 +1,26 @@
+from sqlalchemy import Float, Integer, SmallInteger, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class TravelSpeed(Base):
+    """Delivery totals by vehicle type and local hour of day, for ETAs.
+
+    Rebuilt by ``python -m src.eta.speeds``. ``distance_m`` is the summed
+    straight-line pickup-to-dropoff distance and ``duration_s`` the summed
+    in_transit-to-delivered time of ``samples`` deliveries whose transit leg
+    started in ``hour``.
+    """
+
+    __tablename__ = "travel_speeds"
+
+    vehicle_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    hour: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    distance_m: Mapped[float] = mapped_column(Float, nullable=False)
+    duration_s: Mapped[float] = mapped_column(Float, nullable=False)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("vehicle_type", "hour", name="uq_travel_speeds_vehicle_type_hour"),
+    )
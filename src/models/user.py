@@ -1,6 +1,7 @@
 import enum
+import uuid
 
-from sqlalchemy import Index, String
+from sqlalchemy import ForeignKey, Index, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -21,6 +22,11 @@ class User(Base):
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[UserRole] = mapped_column(nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True)
+    # Set for CUSTOMER users: the customer account whose jobs they can see.
+    customer_id: Mapped[uuid.UUID | None] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("customers.id", ondelete="SET NULL"), nullable=True,
+    )
 
     driver_profile: Mapped["Driver"] = relationship(  # noqa: F821
         back_populates="user", uselist=False, lazy="selectin",
@@ -29,4 +35,5 @@ class User(Base):
     __table_args__ = (
         Index("ix_users_email", "email"),
         Index("ix_users_role", "role"),
+        Index("ix_users_customer_id", "customer_id"),
     )
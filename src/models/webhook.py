@@ -0,0 +1,99 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text, Uuid, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.models.base import Base
+
+
+class WebhookSubscription(Base):
+    __tablename__ = "webhook_subscriptions"
+
+    customer_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("customers.id", ondelete="CASCADE"), nullable=False,
+    )
+    url: Mapped[str] = mapped_column(String(500), nullable=False)
+    secret: Mapped[str] = mapped_column(String(128), nullable=False)
+    is_active: Mapped[bool] = mapped_column(default=True)
+
+    __table_args__ = (
+        Index("ix_webhook_subscriptions_customer_id", "customer_id"),
+    )
+
+
+class OutboxEvent(Base):
+    """Domain event written in the same transaction as the change it describes."""
+
+    __tablename__ = "outbox_events"
+
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    customer_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), nullable=False)
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False,
+    )
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    dispatched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_events_pending", "created_at",
+            postgresql_where=text("dispatched_at IS NULL"),
+            sqlite_where=text("dispatched_at IS NULL"),
+        ),
+    )
+
+
+class WebhookDelivery(Base):
+    """One outbox event queued for one subscription."""
+
+    __tablename__ = "webhook_deliveries"
+
+    subscription_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("webhook_subscriptions.id", ondelete="CASCADE"), nullable=False,
+    )
+    event_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("outbox_events.id", ondelete="CASCADE"), nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    delivered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    subscription: Mapped["WebhookSubscription"] = relationship(lazy="joined")
+    event: Mapped["OutboxEvent"] = relationship(lazy="joined")
+
+    __table_args__ = (
+        Index(
+            "ix_webhook_deliveries_due", "next_attempt_at",
+            postgresql_where=text("delivered_at IS NULL"),
+            sqlite_where=text("delivered_at IS NULL"),
+        ),
+    )
+
+
+class WebhookDeadLetter(Base):
+    """A delivery that exhausted its retries."""
+
+    __tablename__ = "webhook_dead_letters"
+
+    subscription_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("webhook_subscriptions.id", ondelete="CASCADE"), nullable=False,
+    )
+    event_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("ix_webhook_dead_letters_subscription_id", "subscription_id"),
+    )
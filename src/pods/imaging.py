@@ -0,0 +1,69 @@
+"""Photo downscaling for proof-of-delivery uploads.
+
+Decoding and resampling camera photos is CPU-bound, so it runs in a process
+pool rather than on the event loop. Pillow is optional: without it photos are
+stored exactly as uploaded.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.config import settings
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - exercised only without Pillow installed
+    Image = None  # type: ignore[assignment]
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def imaging_available() -> bool:
+    return Image is not None
+
+
+def process_image(source: str, photo_path: str, thumb_path: str, max_edge: int, thumb_edge: int) -> None:
+    """Write a downscaled JPEG and a thumbnail of ``source``. Runs in a worker process."""
+    with Image.open(source) as img:
+        # Let the JPEG decoder skip detail we are about to throw away.
+        img.draft("RGB", (max_edge, max_edge))
+        img = ImageOps.exif_transpose(img).convert("RGB")
+        img.thumbnail((max_edge, max_edge))
+        img.save(photo_path, "JPEG", quality=85, optimize=True)
+        img.thumbnail((thumb_edge, thumb_edge))
+        img.save(thumb_path, "JPEG", quality=80, optimize=True)
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.pod_image_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+async def make_derivatives(source: Path, workdir: Path) -> tuple[Path, Path]:
+    photo_path = workdir / "photo.jpg"
+    thumb_path = workdir / "thumb.jpg"
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        get_executor(),
+        process_image,
+        str(source),
+        str(photo_path),
+        str(thumb_path),
+        settings.pod_photo_max_edge,
+        settings.pod_thumbnail_edge,
+    )
+    return photo_path, thumb_path
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
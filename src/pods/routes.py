@@ -0,0 +1,66 @@
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import Principal, require_roles
+from src.database import get_db
+from src.models.user import UserRole
+from src.pods import service
+from src.schemas.pod import PODRead
+from src.storage.blob import BlobStore, get_blob_store
+
+router = APIRouter(prefix="/api/jobs", tags=["pod"])
+# Serves the ``/media`` URLs built from the default ``blob_base_url``. When
+# ``blob_base_url`` points at a CDN instead, this route is simply unused.
+media_router = APIRouter(prefix="/media", tags=["pod"])
+
+PODSubmitter = Annotated[
+    Principal, Depends(require_roles(UserRole.ADMIN, UserRole.DISPATCHER, UserRole.DRIVER))
+]
+AdminOrDispatcher = Annotated[Principal, Depends(require_roles(UserRole.ADMIN, UserRole.DISPATCHER))]
+
+
+@router.post("/{job_id}/pod", response_model=PODRead, status_code=201)
+async def submit_pod(
+    job_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    store: Annotated[BlobStore, Depends(get_blob_store)],
+    current_user: PODSubmitter,
+    signed_by: Annotated[str, Form(min_length=1, max_length=255)],
+    notes: Annotated[str | None, Form()] = None,
+    signature: Annotated[UploadFile | None, File()] = None,
+    photo: Annotated[UploadFile | None, File()] = None,
+):
+    return await service.submit_pod(
+        db,
+        store,
+        job_id,
+        current_user,
+        signed_by=signed_by,
+        notes=notes,
+        signature=signature,
+        photo=photo,
+    )
+
+
+@router.get("/{job_id}/pod", response_model=PODRead)
+async def get_pod(
+    job_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+):
+    return await service.get_pod(db, job_id)
+
+
+@media_router.get("/{key:path}")
+async def download_pod_file(
+    key: str,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    store: Annotated[BlobStore, Depends(get_blob_store)],
+    _current_user: AdminOrDispatcher,
+):
+    chunks, content_type = await service.open_pod_file(db, store, key)
+    return StreamingResponse(chunks, media_type=content_type)
@@ -0,0 +1,222 @@
+import asyncio
+import mimetypes
+import shutil
+import tempfile
+import uuid
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from fastapi import HTTPException, UploadFile, status
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import Principal
+from src.config import settings
+from src.jobs.service import get_job, transition_job, validate_transition
+from src.models.driver import Driver
+from src.models.job import Job, JobStatus
+from src.models.pod import POD
+from src.models.user import UserRole
+from src.pods import imaging
+from src.storage.blob import BlobStore, BlobTooLargeError, StoredBlob
+
+SIGNATURE_CONTENT_TYPES = {"image/png", "image/jpeg", "image/svg+xml"}
+PHOTO_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp"}
+_EXTENSIONS = {"image/png": "png", "image/jpeg": "jpg", "image/svg+xml": "svg", "image/webp": "webp"}
+
+
+async def _iter_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await upload.read(settings.pod_upload_chunk_size):
+        yield chunk
+
+
+async def _iter_file(path: Path) -> AsyncIterator[bytes]:
+    fh = await asyncio.to_thread(path.open, "rb")
+    try:
+        while chunk := await asyncio.to_thread(fh.read, settings.pod_upload_chunk_size):
+            yield chunk
+    finally:
+        fh.close()
+
+
+def _check_content_type(upload: UploadFile, allowed: set[str], field: str) -> str:
+    content_type = (upload.content_type or "").split(";")[0].strip().lower()
+    if content_type not in allowed:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported {field} content type '{content_type}'. Allowed: {sorted(allowed)}.",
+        )
+    return content_type
+
+
+async def ensure_can_submit(db: AsyncSession, job: Job, current_user: Principal) -> None:
+    if current_user.role != UserRole.DRIVER:
+        return
+    result = await db.execute(select(Driver.id).where(Driver.user_id == current_user.id))
+    driver_id = result.scalar_one_or_none()
+    if driver_id is None or job.driver_id != driver_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Drivers can only submit proof of delivery for their own jobs",
+        )
+
+
+async def _store_signature(store: BlobStore, job_id: uuid.UUID, upload: UploadFile) -> StoredBlob:
+    content_type = _check_content_type(upload, SIGNATURE_CONTENT_TYPES, "signature")
+    key = f"pods/{job_id}/signature-{uuid.uuid4().hex}.{_EXTENSIONS[content_type]}"
+    return await store.put(
+        key,
+        _iter_upload(upload),
+        content_type=content_type,
+        max_bytes=settings.pod_max_upload_bytes,
+    )
+
+
+async def _store_photo(
+    store: BlobStore, job_id: uuid.UUID, upload: UploadFile,
+) -> tuple[StoredBlob, StoredBlob | None]:
+    content_type = _check_content_type(upload, PHOTO_CONTENT_TYPES, "photo")
+    stem = f"pods/{job_id}/photo-{uuid.uuid4().hex}"
+
+    if not imaging.imaging_available():
+        photo = await store.put(
+            f"{stem}.{_EXTENSIONS[content_type]}",
+            _iter_upload(upload),
+            content_type=content_type,
+            max_bytes=settings.pod_max_upload_bytes,
+        )
+        return photo, None
+
+    workdir = Path(tempfile.mkdtemp(prefix="pod-"))
+    try:
+        # Spool the upload to a scratch file chunk by chunk so the worker
+        # process can decode it from disk.
+        source = workdir / "source"
+        size = 0
+        fh = await asyncio.to_thread(source.open, "wb")
+        try:
+            async for chunk in _iter_upload(upload):
+                size += len(chunk)
+                if size > settings.pod_max_upload_bytes:
+                    raise BlobTooLargeError(f"Upload exceeds {settings.pod_max_upload_bytes} bytes")
+                await asyncio.to_thread(fh.write, chunk)
+        finally:
+            await asyncio.to_thread(fh.close)
+
+        try:
+            photo_path, thumb_path = await imaging.make_derivatives(source, workdir)
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Photo could not be decoded as an image",
+            ) from exc
+
+        photo = await store.put(f"{stem}.jpg", _iter_file(photo_path), content_type="image/jpeg")
+        try:
+            thumb = await store.put(f"{stem}-thumb.jpg", _iter_file(thumb_path), content_type="image/jpeg")
+        except BaseException:
+            await store.delete(photo.key)
+            raise
+        return photo, thumb
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+async def submit_pod(
+    db: AsyncSession,
+    store: BlobStore,
+    job_id: uuid.UUID,
+    current_user: Principal,
+    *,
+    signed_by: str,
+    notes: str | None = None,
+    signature: UploadFile | None = None,
+    photo: UploadFile | None = None,
+) -> POD:
+    """Store POD files and mark the job delivered in the caller's transaction.
+
+    The POD row and the ``DELIVERED`` transition are flushed together, so they
+    commit or roll back as one unit. Uploaded blobs are removed again if
+    anything fails before the flush succeeds.
+    """
+    job = await get_job(db, job_id, for_update=True)
+    await ensure_can_submit(db, job, current_user)
+    validate_transition(job.status, JobStatus.DELIVERED)
+    existing = await db.execute(select(POD.id).where(POD.job_id == job_id))
+    if existing.scalar_one_or_none() is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Proof of delivery already submitted")
+
+    stored: list[StoredBlob] = []
+    try:
+        signature_blob = photo_blob = thumb_blob = None
+        if signature is not None:
+            signature_blob = await _store_signature(store, job_id, signature)
+            stored.append(signature_blob)
+        if photo is not None:
+            photo_blob, thumb_blob = await _store_photo(store, job_id, photo)
+            stored.extend(b for b in (photo_blob, thumb_blob) if b is not None)
+
+        pod = POD(
+            job_id=job_id,
+            signed_by=signed_by,
+            notes=notes,
+            signature_url=signature_blob.url if signature_blob else None,
+            photo_url=photo_blob.url if photo_blob else None,
+            photo_thumbnail_url=thumb_blob.url if thumb_blob else None,
+        )
+        db.add(pod)
+        await transition_job(db, job, JobStatus.DELIVERED)
+        await db.flush()
+    except BlobTooLargeError as exc:
+        await _discard(store, stored)
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)) from exc
+    except BaseException:
+        await _discard(store, stored)
+        raise
+
+    await db.refresh(pod)
+    return pod
+
+
+async def _discard(store: BlobStore, blobs: list[StoredBlob]) -> None:
+    for blob in blobs:
+        await store.delete(blob.key)
+
+
+async def get_pod(db: AsyncSession, job_id: uuid.UUID) -> POD:
+    result = await db.execute(select(POD).where(POD.job_id == job_id))
+    pod = result.scalar_one_or_none()
+    if pod is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Proof of delivery not found")
+    return pod
+
+
+async def open_pod_file(db: AsyncSession, store: BlobStore, key: str) -> tuple[AsyncIterator[bytes], str]:
+    """Stream a stored POD file, returning its chunks and content type.
+
+    Only keys referenced by a POD row are served, so the route cannot be used
+    to read arbitrary blobs. The first chunk is read up front so a missing
+    file surfaces as a 404 instead of failing mid-response.
+    """
+    url = store.url_for(key)
+    result = await db.execute(
+        select(POD.id)
+        .where(or_(POD.signature_url == url, POD.photo_url == url, POD.photo_thumbnail_url == url))
+        .limit(1)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    chunks = store.open(key)
+    try:
+        first = await anext(chunks, b"")
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found") from exc
+
+    async def stream() -> AsyncIterator[bytes]:
+        yield first
+        async for chunk in chunks:
+            yield chunk
+
+    content_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+    return stream(), content_type
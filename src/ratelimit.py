@@ -0,0 +1,114 @@
+"""Token-bucket rate limiting for unauthenticated endpoints.
+
+Routes opt in with ``dependencies=[rate_limit("tracking", ...)]``. Buckets are
+keyed by limit name and client IP. The default backend keeps buckets in
+process memory, so with N workers a client effectively gets N buckets; deploy
+a shared ``RateLimitBackend`` (overriding ``get_rate_limit_backend``) where
+that matters.
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from fastapi import Depends, HTTPException, Request, status
+
+from src.config import settings
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    retry_after: float = 0.0
+
+
+class RateLimitBackend(ABC):
+    @abstractmethod
+    async def take(self, key: str, *, rate: float, burst: int, cost: float = 1.0) -> RateLimitDecision:
+        """Take ``cost`` tokens from the bucket ``key`` refilling at ``rate`` tokens/second."""
+
+    @abstractmethod
+    async def reset(self) -> None: ...
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Per-process buckets in a bounded LRU; idle buckets are evicted first."""
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> (tokens, last refill time)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, *, rate: float, burst: int, cost: float = 1.0) -> RateLimitDecision:
+        now = self._clock()
+        tokens, updated = self._buckets.pop(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated) * rate)
+        if tokens >= cost:
+            decision = RateLimitDecision(allowed=True)
+            tokens -= cost
+        else:
+            decision = RateLimitDecision(allowed=False, retry_after=(cost - tokens) / rate)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return decision
+
+    async def reset(self) -> None:
+        self._buckets.clear()
+
+
+_backend: RateLimitBackend = InMemoryRateLimitBackend()
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    return _backend
+
+
+def client_ip(request: Request) -> str:
+    if settings.rate_limit_trust_forwarded_for:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _one() -> float:
+    return 1.0
+
+
+def rate_limit(
+    name: str,
+    *,
+    per_minute: Callable[[], int],
+    burst: Callable[[], int],
+    cost: Callable[..., float] = _one,
+):
+    """Route dependency enforcing a per-client-IP token bucket.
+
+    ``per_minute`` and ``burst`` are read on every request so settings can be
+    changed at runtime; a ``per_minute`` of 0 disables the limit. ``cost`` is
+    itself resolved as a dependency (it may take the request body) and gives
+    the number of tokens a request takes, e.g. one per ID in a batch lookup.
+    """
+
+    async def _check(
+        request: Request,
+        backend: RateLimitBackend = Depends(get_rate_limit_backend),
+        tokens: float = Depends(cost),
+    ) -> None:
+        limit = per_minute()
+        if limit <= 0:
+            return
+        decision = await backend.take(f"{name}:{client_ip(request)}", rate=limit / 60, burst=burst(), cost=tokens)
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+            )
+
+    return Depends(_check)
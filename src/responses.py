@@ -0,0 +1,56 @@
+"""Helpers for conditional GETs and per-route caching policy.
+
+Compression is handled for every route by ``CompressionMiddleware``.
+"""
+
+import hashlib
+from collections.abc import Iterable
+
+from fastapi import Depends, Request, Response, status
+
+# Policies for ``cache_control``.
+NO_STORE = "no-store"
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def cache_control(policy: str):
+    """Route dependency declaring the ``Cache-Control`` header for successful responses.
+
+    Usage: ``@router.get(..., dependencies=[cache_control("public, max-age=15")])``.
+    ``CacheControlMiddleware`` applies it, so it also covers routes that return
+    a ``Response`` directly.
+    """
+
+    def _declare(request: Request) -> None:
+        request.state.cache_control = policy
+
+    return Depends(_declare)
+
+
+def make_etag(parts: Iterable[object]) -> str:
+    """Weak ETag over cheap version markers (ids, ``updated_at`` values), not the body."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b"\x00")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison: ignore the W/ prefix on either side.
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def json_response(body: bytes, headers: dict[str, str] | None = None) -> Response:
+    """Return already-encoded JSON."""
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,38 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+# Deliberately loose: catches columns swapped or mistyped, not every RFC 5322 corner.
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+
+class _ImportRow(BaseModel):
+    # Empty cells are dropped before validation, so they read as "not given".
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+
+class CustomerImportRow(_ImportRow):
+    company_name: str = Field(min_length=1, max_length=255)
+    contact_name: str = Field(min_length=1, max_length=255)
+    contact_email: str = Field(max_length=255, pattern=EMAIL_PATTERN)
+    contact_phone: str | None = Field(default=None, max_length=50)
+
+
+class DriverImportRow(_ImportRow):
+    email: str = Field(max_length=255, pattern=EMAIL_PATTERN)
+    full_name: str = Field(min_length=1, max_length=255)
+    vehicle_type: str = Field(min_length=1, max_length=100)
+    license_plate: str | None = Field(default=None, max_length=50)
+    is_available: bool = True
+
+
+class ImportRowError(BaseModel):
+    # 1-based record number in the file; the header is row 1.
+    row: int
+    errors: list[str]
+
+
+class ImportResult(BaseModel):
+    created: int
+    updated: int
+    failed: int
+    # At most COURIER_IMPORT_MAX_REPORTED_ERRORS; ``failed`` has the full count.
+    errors: list[ImportRowError]
@@ -3,6 +3,8 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
+from src.models.job import JobStatus
+
 
 class CustomerBase(BaseModel):
     company_name: str
@@ -20,3 +22,21 @@ class CustomerRead(CustomerBase):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class CustomerJobRead(BaseModel):
+    id: uuid.UUID
+    tracking_id: str
+    status: JobStatus
+    pickup_address: str
+    dropoff_address: str
+    description: str | None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class CustomerJobPage(BaseModel):
+    items: list[CustomerJobRead]
+    next_cursor: str | None = None
@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
+from functools import lru_cache
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, create_model, model_validator
 
 from src.models.job import JobStatus
 
@@ -12,6 +13,33 @@ class JobCreate(BaseModel):
     dropoff_address: str = Field(min_length=1, max_length=500)
     description: str | None = None
     special_instructions: str | None = None
+    pickup_lat: float | None = Field(default=None, ge=-90, le=90)
+    pickup_lng: float | None = Field(default=None, ge=-180, le=180)
+    dropoff_lat: float | None = Field(default=None, ge=-90, le=90)
+    dropoff_lng: float | None = Field(default=None, ge=-180, le=180)
+    pickup_window_start: datetime | None = None
+    pickup_window_end: datetime | None = None
+    delivery_window_start: datetime | None = None
+    delivery_window_end: datetime | None = None
+
+    @model_validator(mode="after")
+    def _coordinates_in_pairs(self) -> "JobCreate":
+        for point in ("pickup", "dropoff"):
+            if (getattr(self, f"{point}_lat") is None) != (getattr(self, f"{point}_lng") is None):
+                raise ValueError(f"{point}_lat and {point}_lng must be given together")
+        return self
+
+    @model_validator(mode="after")
+    def _windows_ordered(self) -> "JobCreate":
+        _check_windows(self)
+        return self
+
+
+def _check_windows(body: "JobCreate | JobUpdate") -> None:
+    for window in ("pickup_window", "delivery_window"):
+        start, end = getattr(body, f"{window}_start"), getattr(body, f"{window}_end")
+        if start is not None and end is not None and end <= start:
+            raise ValueError(f"{window}_end must be after {window}_start")
 
 
 class JobUpdate(BaseModel):
@@ -20,6 +48,15 @@ class JobUpdate(BaseModel):
     description: str | None = None
     special_instructions: str | None = None
     status: JobStatus | None = None
+    pickup_window_start: datetime | None = None
+    pickup_window_end: datetime | None = None
+    delivery_window_start: datetime | None = None
+    delivery_window_end: datetime | None = None
+
+    @model_validator(mode="after")
+    def _windows_ordered(self) -> "JobUpdate":
+        _check_windows(self)
+        return self
 
 
 class JobAssign(BaseModel):
@@ -36,12 +73,35 @@ class JobRead(BaseModel):
     dropoff_address: str
     description: str | None
     special_instructions: str | None
+    pickup_lat: float | None
+    pickup_lng: float | None
+    dropoff_lat: float | None
+    dropoff_lng: float | None
+    pickup_window_start: datetime | None
+    pickup_window_end: datetime | None
+    delivery_window_start: datetime | None
+    delivery_window_end: datetime | None
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+class QueuedJobRead(JobRead):
+    # Latest time a driver can set off and still meet the job's windows; null without windows.
+    latest_start: datetime | None = None
+
+
+@lru_cache(maxsize=128)
+def job_read_projection(fields: tuple[str, ...]) -> type[BaseModel]:
+    """``JobRead`` trimmed to ``fields``, built once per distinct field set."""
+    return create_model(
+        "JobReadProjection",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (JobRead.model_fields[name].annotation, ...) for name in fields},
+    )
+
+
 class JobListParams(BaseModel):
     status: JobStatus | None = None
     created_after: datetime | None = None
@@ -57,5 +117,17 @@ class TrackingResponse(BaseModel):
     dropoff_address: str
     driver_id: uuid.UUID | None
     created_at: datetime
+    # Estimated delivery time while the job is in flight and has coordinates.
+    eta: datetime | None = None
 
     model_config = {"from_attributes": True}
+
+
+class TrackingBatchRequest(BaseModel):
+    tracking_ids: list[str] = Field(min_length=1, max_length=1000)
+
+
+class TrackingBatchResponse(BaseModel):
+    # Keyed by the tracking IDs as sent, before case and whitespace normalization.
+    results: dict[str, TrackingResponse]
+    unknown: list[str]
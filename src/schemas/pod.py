@@ -17,6 +17,7 @@ class PODCreate(PODBase):
 
 class PODRead(PODBase):
     id: uuid.UUID
+    photo_thumbnail_url: str | None = None
     job_id: uuid.UUID
     signed_at: datetime
     created_at: datetime
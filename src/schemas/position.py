@@ -0,0 +1,52 @@
+import enum
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from src.models.job import JobStatus
+
+
+class PositionFix(BaseModel):
+    lat: float = Field(ge=-90, le=90)
+    lng: float = Field(ge=-180, le=180)
+    recorded_at: datetime
+    # Horizontal accuracy reported by the device, in metres.
+    accuracy_m: float | None = Field(default=None, ge=0)
+
+
+class PositionBatch(BaseModel):
+    fixes: list[PositionFix] = Field(min_length=1, max_length=1000)
+
+
+class FenceKind(str, enum.Enum):
+    PICKUP = "pickup"
+    DROPOFF = "dropoff"
+
+
+class GeofenceEvent(BaseModel):
+    job_id: uuid.UUID
+    fence: FenceKind
+    status: JobStatus
+    # False when the transition is only proposed and the driver must confirm it.
+    applied: bool
+    recorded_at: datetime
+
+
+class PositionBatchResponse(BaseModel):
+    events: list[GeofenceEvent]
+
+
+class TrailPoint(BaseModel):
+    lat: float
+    lng: float
+    recorded_at: datetime
+
+
+class TrailResponse(BaseModel):
+    driver_id: uuid.UUID
+    start: datetime
+    end: datetime
+    # Fixes in the range before simplification.
+    raw_points: int
+    points: list[TrailPoint]
@@ -0,0 +1,53 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.models.job import JobStatus
+from src.sla.monitor import MONITORED_STATUSES
+
+
+class SlaThresholdsUpdate(BaseModel):
+    """A customer's overrides, replacing any previous ones; seconds per status."""
+
+    thresholds: dict[JobStatus, int] = Field(default_factory=dict)
+
+    @field_validator("thresholds")
+    @classmethod
+    def _non_terminal(cls, value: dict[JobStatus, int]) -> dict[JobStatus, int]:
+        for job_status, seconds in value.items():
+            if job_status not in MONITORED_STATUSES:
+                raise ValueError(f"'{job_status.value}' is a terminal status")
+            if seconds <= 0:
+                raise ValueError("thresholds must be positive")
+        return value
+
+
+class SlaThresholdsRead(BaseModel):
+    customer_id: uuid.UUID
+    overrides: dict[JobStatus, int]
+    # Defaults merged with the overrides: what the monitor applies.
+    effective: dict[JobStatus, int]
+
+
+class SlaBreachRead(BaseModel):
+    id: uuid.UUID
+    job_id: uuid.UUID
+    customer_id: uuid.UUID
+    tracking_id: str
+    status: JobStatus
+    entered_at: datetime
+    threshold_seconds: int
+    breached_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class SlaMonitorStats(BaseModel):
+    """This worker's monitor; breach counts are for breaches it recorded."""
+
+    tracked_jobs: int
+    next_deadline: datetime | None
+    breaches_total: dict[JobStatus, int]
+    max_lag_seconds: float
+    last_tick_seconds: float
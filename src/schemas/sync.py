@@ -0,0 +1,67 @@
+import enum
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.models.job import JobStatus
+
+SYNCABLE_STATUSES = frozenset(
+    {JobStatus.PICKED_UP, JobStatus.IN_TRANSIT, JobStatus.DELIVERED, JobStatus.FAILED}
+)
+
+
+class SyncPODMetadata(BaseModel):
+    signed_by: str = Field(min_length=1, max_length=255)
+    notes: str | None = None
+
+
+class SyncOperation(BaseModel):
+    idempotency_key: str = Field(min_length=1, max_length=100)
+    job_id: uuid.UUID
+    status: JobStatus
+    client_timestamp: datetime
+    pod: SyncPODMetadata | None = None
+
+    @field_validator("status")
+    @classmethod
+    def _driver_settable(cls, value: JobStatus) -> JobStatus:
+        if value not in SYNCABLE_STATUSES:
+            raise ValueError(f"Drivers cannot set status '{value.value}'")
+        return value
+
+
+class SyncRequest(BaseModel):
+    sync_token: str | None = None
+    operations: list[SyncOperation] = Field(default_factory=list, max_length=500)
+
+
+class SyncOutcome(str, enum.Enum):
+    APPLIED = "applied"
+    DUPLICATE = "duplicate"
+    REJECTED = "rejected"
+
+
+class SyncOperationResult(BaseModel):
+    idempotency_key: str
+    job_id: uuid.UUID
+    outcome: SyncOutcome
+    detail: str | None = None
+
+
+class DriverJobDelta(BaseModel):
+    id: uuid.UUID
+    tracking_id: str
+    status: JobStatus
+    pickup_address: str
+    dropoff_address: str
+    special_instructions: str | None
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class SyncResponse(BaseModel):
+    sync_token: str
+    results: list[SyncOperationResult]
+    jobs: list[DriverJobDelta]
@@ -0,0 +1,38 @@
+import uuid
+from datetime import datetime
+
+from pydantic import AnyHttpUrl, BaseModel, Field
+
+
+class WebhookSubscriptionCreate(BaseModel):
+    url: AnyHttpUrl
+    secret: str | None = Field(default=None, min_length=16, max_length=128)
+
+
+class WebhookSubscriptionRead(BaseModel):
+    id: uuid.UUID
+    customer_id: uuid.UUID
+    url: str
+    is_active: bool
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class WebhookSubscriptionCreated(WebhookSubscriptionRead):
+    """Returned once on creation; the secret is not shown again."""
+
+    secret: str
+
+
+class WebhookDeadLetterRead(BaseModel):
+    id: uuid.UUID
+    subscription_id: uuid.UUID
+    event_id: uuid.UUID
+    event_type: str
+    payload: dict
+    attempts: int
+    last_error: str | None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,304 @@
+"""Time-in-status monitoring for non-terminal jobs.
+
+``sla_monitor`` holds one timer per monitored job: the time it entered its
+current status plus the threshold for that status and its customer. Timers
+sit in a heap, so the monitor sleeps until the earliest deadline (or until
+it is woken by an invalidation) instead of scanning ``jobs``. Status changes
+reach it as job invalidations on the bus, from this worker or any other, and
+only the changed jobs are re-read; a change to a customer's thresholds
+re-times that customer's jobs.
+
+When a deadline passes the breach is inserted into ``sla_breaches``. Its
+unique (job, status, entered_at) key lets every worker run the monitor: one
+insert wins, and only that worker logs the breach and counts it.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.invalidation import invalidation_bus
+from src.jobs.service import ALLOWED_TRANSITIONS, JOB_ENTITY
+from src.models.job import Job, JobStatus
+from src.models.job_status_event import JobStatusEvent
+from src.models.sla import SlaBreach, SlaThreshold
+from src.timeutils import as_utc
+
+logger = logging.getLogger(__name__)
+
+# Invalidation entity for a customer's threshold overrides, keyed by customer ID.
+SLA_THRESHOLDS_ENTITY = "sla_thresholds"
+MONITORED_STATUSES = frozenset(ALLOWED_TRANSITIONS)
+# Past this many dirty jobs a full rebuild is cheaper than a targeted refresh.
+_MAX_DIRTY = 5_000
+
+
+def default_thresholds() -> dict[JobStatus, int]:
+    return {JobStatus(name): seconds for name, seconds in settings.sla_thresholds_seconds.items()}
+
+
+def _job_rows():
+    # The latest event into the current status; older rows predate the event log.
+    entered_at = (
+        select(func.max(JobStatusEvent.occurred_at))
+        .where(JobStatusEvent.job_id == Job.id, JobStatusEvent.to_status == Job.status)
+        .correlate(Job)
+        .scalar_subquery()
+    )
+    return select(
+        Job.id, Job.customer_id, Job.tracking_id, Job.status, Job.created_at, entered_at.label("entered_at"),
+    )
+
+
+@dataclass(order=True, slots=True)
+class Timer:
+    deadline: datetime
+    job_id: uuid.UUID
+    customer_id: uuid.UUID = field(compare=False)
+    tracking_id: str = field(compare=False)
+    status: JobStatus = field(compare=False)
+    entered_at: datetime = field(compare=False)
+    threshold_seconds: int = field(compare=False)
+    live: bool = field(default=True, compare=False)
+
+
+class _ThresholdSubscriber:
+    def __init__(self, monitor: "SlaMonitor") -> None:
+        self._monitor = monitor
+
+    def invalidate(self, entity_id: str, version: int) -> None:
+        self._monitor.customer_changed(uuid.UUID(entity_id))
+
+    def clear(self) -> None:
+        self._monitor.clear()
+
+
+class SlaMonitor:
+    def __init__(self) -> None:
+        self._heap: list[Timer] = []
+        self._timers: dict[uuid.UUID, Timer] = {}
+        self._overrides: dict[uuid.UUID, dict[JobStatus, int]] = {}
+        self._defaults = default_thresholds()
+        self._dirty_jobs: set[uuid.UUID] = set()
+        self._dirty_customers: set[uuid.UUID] = set()
+        self._loaded = False
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        # Metrics, for this worker only.
+        self.breaches_total: Counter[JobStatus] = Counter()
+        self.max_lag_seconds = 0.0
+        self.last_tick_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    @property
+    def next_deadline(self) -> datetime | None:
+        while self._heap and not self._heap[0].live:
+            heapq.heappop(self._heap)
+        return self._heap[0].deadline if self._heap else None
+
+    def threshold(self, customer_id: uuid.UUID, status: JobStatus) -> int | None:
+        overrides = self._overrides.get(customer_id)
+        if overrides is not None and status in overrides:
+            return overrides[status]
+        return self._defaults.get(status)
+
+    # Bus subscriber interface, for job invalidations.
+    def invalidate(self, entity_id: str, version: int) -> None:
+        self._dirty_jobs.add(uuid.UUID(entity_id))
+        self._wake.set()
+
+    def customer_changed(self, customer_id: uuid.UUID) -> None:
+        self._dirty_customers.add(customer_id)
+        self._wake.set()
+
+    def clear(self) -> None:
+        self._loaded = False
+        self._wake.set()
+
+    def _discard(self, job_id: uuid.UUID) -> None:
+        timer = self._timers.pop(job_id, None)
+        if timer is None:
+            return
+        timer.live = False
+        if len(self._heap) > 2 * len(self._timers) + 64:
+            self._heap = [timer for timer in self._heap if timer.live]
+            heapq.heapify(self._heap)
+
+    def _timer(self, row) -> Timer | None:
+        if row.status not in MONITORED_STATUSES:
+            return None
+        threshold = self.threshold(row.customer_id, row.status)
+        if threshold is None:
+            return None
+        entered_at = as_utc(row.entered_at or row.created_at)
+        return Timer(
+            entered_at + timedelta(seconds=threshold),
+            row.id, row.customer_id, row.tracking_id, row.status, entered_at, threshold,
+        )
+
+    def _retime(self, row) -> None:
+        self._discard(row.id)
+        timer = self._timer(row)
+        if timer is not None:
+            self._timers[row.id] = timer
+            heapq.heappush(self._heap, timer)
+
+    async def _load_overrides(self, db: AsyncSession, customer_ids: set[uuid.UUID] | None = None) -> None:
+        query = select(SlaThreshold.customer_id, SlaThreshold.status, SlaThreshold.seconds)
+        if customer_ids is None:
+            self._overrides = {}
+        else:
+            query = query.where(SlaThreshold.customer_id.in_(customer_ids))
+            for customer_id in customer_ids:
+                self._overrides.pop(customer_id, None)
+        for customer_id, status, seconds in await db.execute(query):
+            self._overrides.setdefault(customer_id, {})[status] = seconds
+
+    async def sync(self, db: AsyncSession) -> None:
+        """Bring the timers up to date: rebuild, or re-read changed jobs and customers."""
+        if not self._loaded or len(self._dirty_jobs) > _MAX_DIRTY:
+            self._dirty_jobs.clear()
+            self._dirty_customers.clear()
+            self._defaults = default_thresholds()
+            await self._load_overrides(db)
+            result = await db.execute(_job_rows().where(Job.status.in_(MONITORED_STATUSES)))
+            self._timers = {}
+            for row in result:
+                timer = self._timer(row)
+                if timer is not None:
+                    self._timers[row.id] = timer
+            self._heap = list(self._timers.values())
+            heapq.heapify(self._heap)
+            self._loaded = True
+            return
+
+        if self._dirty_customers:
+            customers, self._dirty_customers = self._dirty_customers, set()
+            await self._load_overrides(db, customers)
+            result = await db.execute(
+                _job_rows().where(Job.customer_id.in_(customers), Job.status.in_(MONITORED_STATUSES))
+            )
+            for row in result:
+                self._retime(row)
+
+        if self._dirty_jobs:
+            dirty, self._dirty_jobs = self._dirty_jobs, set()
+            result = await db.execute(_job_rows().where(Job.id.in_(dirty)))
+            for row in result:
+                dirty.discard(row.id)
+                self._retime(row)
+            for job_id in dirty:  # no longer exists (archived)
+                self._discard(job_id)
+
+    def pop_due(self, now: datetime, limit: int) -> list[Timer]:
+        due: list[Timer] = []
+        while self._heap and self._heap[0].deadline <= now and len(due) < limit:
+            timer = heapq.heappop(self._heap)
+            if timer.live:
+                del self._timers[timer.job_id]
+                due.append(timer)
+        return due
+
+    async def record(self, db: AsyncSession, due: list[Timer], now: datetime) -> list[Timer]:
+        """Insert breaches for ``due``; return those this call recorded first."""
+        # A transition committed on another worker may not have reached us yet.
+        result = await db.execute(select(Job.id, Job.status).where(Job.id.in_([timer.job_id for timer in due])))
+        current = dict(result.tuples().all())
+        due = [timer for timer in due if current.get(timer.job_id) == timer.status]
+        if not due:
+            return []
+
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        statement = (
+            dialect.insert(SlaBreach)
+            .values([
+                {
+                    "id": uuid.uuid4(),
+                    "job_id": timer.job_id,
+                    "customer_id": timer.customer_id,
+                    "tracking_id": timer.tracking_id,
+                    "status": timer.status,
+                    "entered_at": timer.entered_at,
+                    "threshold_seconds": timer.threshold_seconds,
+                    "breached_at": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for timer in due
+            ])
+            .on_conflict_do_nothing(index_elements=["job_id", "status", "entered_at"])
+            .returning(SlaBreach.job_id)
+        )
+        inserted = set((await db.execute(statement)).scalars())
+        recorded = [timer for timer in due if timer.job_id in inserted]
+        for timer in recorded:
+            lag = (now - timer.deadline).total_seconds()
+            self.breaches_total[timer.status] += 1
+            self.max_lag_seconds = max(self.max_lag_seconds, lag)
+            logger.warning(
+                "SLA breach: job %s %s for over %ds (since %s)",
+                timer.tracking_id, timer.status.value, timer.threshold_seconds, timer.entered_at.isoformat(),
+            )
+        return recorded
+
+    async def tick(self, session_factory: async_sessionmaker[AsyncSession], now: datetime | None = None) -> int:
+        """Sync, then record every breach now due; return how many were recorded."""
+        started = time.perf_counter()
+        recorded = 0
+        async with session_factory() as db:
+            await self.sync(db)
+            now = now or datetime.now(timezone.utc)
+            while due := self.pop_due(now, settings.sla_breach_batch_size):
+                recorded += len(await self.record(db, due, now))
+            await db.commit()
+        self.last_tick_seconds = time.perf_counter() - started
+        return recorded
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._task = asyncio.create_task(self._run(session_factory), name="sla-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        while True:
+            self._wake.clear()
+            sleep = settings.sla_max_sleep_seconds
+            try:
+                await self.tick(session_factory)
+                next_deadline = self.next_deadline
+                if next_deadline is not None:
+                    until = (next_deadline - datetime.now(timezone.utc)).total_seconds()
+                    sleep = min(sleep, max(until, 0.0))
+            except Exception:
+                logger.exception("SLA monitor tick failed")
+                # Timers popped before the failure are gone; rebuild on the next tick.
+                self._loaded = False
+                self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=sleep)
+            except TimeoutError:
+                pass
+
+
+sla_monitor = SlaMonitor()
+invalidation_bus.subscribe(JOB_ENTITY, sla_monitor)
+invalidation_bus.subscribe(SLA_THRESHOLDS_ENTITY, _ThresholdSubscriber(sla_monitor))
@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import Principal, require_roles
+from src.database import get_db
+from src.models.user import UserRole
+from src.responses import NO_STORE, cache_control
+from src.schemas.sla import SlaBreachRead, SlaMonitorStats, SlaThresholdsRead, SlaThresholdsUpdate
+from src.sla import service
+from src.sla.monitor import sla_monitor
+
+router = APIRouter(prefix="/api/sla", tags=["sla"], dependencies=[cache_control(NO_STORE)])
+
+AdminOrDispatcher = Annotated[Principal, Depends(require_roles(UserRole.ADMIN, UserRole.DISPATCHER))]
+
+
+@router.get("/breaches", response_model=list[SlaBreachRead])
+async def list_breaches(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+    customer_id: uuid.UUID | None = None,
+    since: datetime | None = None,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=200),
+):
+    return await service.list_breaches(db, customer_id=customer_id, since=since, skip=skip, limit=limit)
+
+
+@router.get("/monitor", response_model=SlaMonitorStats)
+async def monitor_stats(_current_user: AdminOrDispatcher):
+    return SlaMonitorStats(
+        tracked_jobs=len(sla_monitor),
+        next_deadline=sla_monitor.next_deadline,
+        breaches_total=dict(sla_monitor.breaches_total),
+        max_lag_seconds=sla_monitor.max_lag_seconds,
+        last_tick_seconds=sla_monitor.last_tick_seconds,
+    )
+
+
+@router.get("/customers/{customer_id}/thresholds", response_model=SlaThresholdsRead)
+async def get_thresholds(
+    customer_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+):
+    overrides, effective = await service.get_thresholds(db, customer_id)
+    return SlaThresholdsRead(customer_id=customer_id, overrides=overrides, effective=effective)
+
+
+@router.put("/customers/{customer_id}/thresholds", response_model=SlaThresholdsRead)
+async def set_thresholds(
+    customer_id: uuid.UUID,
+    body: SlaThresholdsUpdate,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+):
+    overrides, effective = await service.set_thresholds(db, customer_id, body.thresholds)
+    return SlaThresholdsRead(customer_id=customer_id, overrides=overrides, effective=effective)
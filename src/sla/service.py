@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.invalidation import invalidation_bus
+from src.models.customer import Customer
+from src.models.job import JobStatus
+from src.models.sla import SlaBreach, SlaThreshold
+from src.sla.monitor import SLA_THRESHOLDS_ENTITY, default_thresholds
+
+
+async def _ensure_customer(db: AsyncSession, customer_id: uuid.UUID) -> None:
+    result = await db.execute(select(Customer.id).where(Customer.id == customer_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found")
+
+
+async def get_thresholds(
+    db: AsyncSession, customer_id: uuid.UUID,
+) -> tuple[dict[JobStatus, int], dict[JobStatus, int]]:
+    """Return the customer's overrides and the effective thresholds."""
+    await _ensure_customer(db, customer_id)
+    result = await db.execute(
+        select(SlaThreshold.status, SlaThreshold.seconds).where(SlaThreshold.customer_id == customer_id)
+    )
+    overrides = dict(result.tuples().all())
+    return overrides, {**default_thresholds(), **overrides}
+
+
+async def set_thresholds(
+    db: AsyncSession, customer_id: uuid.UUID, thresholds: dict[JobStatus, int],
+) -> tuple[dict[JobStatus, int], dict[JobStatus, int]]:
+    """Replace the customer's overrides; every worker's monitor re-times their jobs."""
+    await _ensure_customer(db, customer_id)
+    await db.execute(delete(SlaThreshold).where(SlaThreshold.customer_id == customer_id))
+    if thresholds:
+        await db.execute(insert(SlaThreshold), [
+            {"customer_id": customer_id, "status": job_status, "seconds": seconds}
+            for job_status, seconds in thresholds.items()
+        ])
+    await invalidation_bus.publish(db, SLA_THRESHOLDS_ENTITY, customer_id)
+    return dict(thresholds), {**default_thresholds(), **thresholds}
+
+
+async def list_breaches(
+    db: AsyncSession,
+    *,
+    customer_id: uuid.UUID | None = None,
+    since: datetime | None = None,
+    skip: int = 0,
+    limit: int = 50,
+) -> list[SlaBreach]:
+    query = select(SlaBreach).order_by(SlaBreach.breached_at.desc(), SlaBreach.id).offset(skip).limit(limit)
+    if customer_id is not None:
+        query = query.where(SlaBreach.customer_id == customer_id)
+    if since is not None:
+        query = query.where(SlaBreach.breached_at >= since)
+    result = await db.execute(query)
+    return list(result.scalars().all())
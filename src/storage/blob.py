@@ -0,0 +1,121 @@
+import asyncio
+import os
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.config import settings
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    key: str
+    url: str
+    size: int
+
+
+class BlobTooLargeError(Exception):
+    """Raised when a streamed upload exceeds the configured size limit."""
+
+
+class BlobStore(ABC):
+    """Minimal object-storage interface used for uploaded files.
+
+    Implementations receive data as an async stream of chunks so that callers
+    never need to hold a whole file in memory.
+    """
+
+    @abstractmethod
+    async def put(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        *,
+        content_type: str | None = None,
+        max_bytes: int | None = None,
+    ) -> StoredBlob:
+        ...
+
+    @abstractmethod
+    def open(self, key: str) -> AsyncIterator[bytes]:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def url_for(self, key: str) -> str:
+        ...
+
+
+class LocalBlobStore(BlobStore):
+    """Stores blobs as files under a root directory.
+
+    Writes go to a temporary sibling file that is renamed into place once the
+    stream completes, so readers never observe a partially written blob.
+    """
+
+    def __init__(self, root: str | os.PathLike[str], base_url: str, chunk_size: int = 64 * 1024) -> None:
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+        self.chunk_size = chunk_size
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid blob key: {key!r}")
+        return path
+
+    async def put(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        *,
+        content_type: str | None = None,
+        max_bytes: int | None = None,
+    ) -> StoredBlob:
+        path = self._path(key)
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+        size = 0
+        fh = await asyncio.to_thread(open, tmp_path, "wb")
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise BlobTooLargeError(f"Upload exceeds {max_bytes} bytes")
+                await asyncio.to_thread(fh.write, chunk)
+            await asyncio.to_thread(fh.close)
+            await asyncio.to_thread(os.replace, tmp_path, path)
+        except BaseException:
+            fh.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return StoredBlob(key=key, url=self.url_for(key), size=size)
+
+    async def open(self, key: str) -> AsyncIterator[bytes]:
+        fh = await asyncio.to_thread(open, self._path(key), "rb")
+        try:
+            while chunk := await asyncio.to_thread(fh.read, self.chunk_size):
+                yield chunk
+        finally:
+            fh.close()
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    def url_for(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+
+_blob_store: BlobStore | None = None
+
+
+def get_blob_store() -> BlobStore:
+    global _blob_store
+    if _blob_store is None:
+        _blob_store = LocalBlobStore(settings.blob_store_root, settings.blob_base_url)
+    return _blob_store
@@ -1,26 +1,69 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.database import get_db
-from src.jobs.service import get_job_by_tracking_id
-from src.schemas.job import TrackingResponse
+from src.ratelimit import rate_limit
+from src.responses import NO_STORE, cache_control, etag_matches, json_response, not_modified
+from src.schemas.job import TrackingBatchRequest, TrackingBatchResponse, TrackingResponse
+from src.tracking import service
 
 router = APIRouter(prefix="/api/tracking", tags=["tracking"])
 
+# Public and identical for every caller, so shared caches may hold it briefly.
+TRACKING_CACHE_CONTROL = "public, max-age=15"
 
-@router.get("/{tracking_id}", response_model=TrackingResponse)
+
+def _batch_cost(body: TrackingBatchRequest) -> float:
+    # One token per ID, so a batch cannot look up more IDs than single lookups could.
+    return len(body.tracking_ids)
+
+
+@router.post(
+    "/batch",
+    response_model=TrackingBatchResponse,
+    dependencies=[
+        rate_limit(
+            "tracking-batch",
+            per_minute=lambda: settings.tracking_batch_rate_limit_per_minute,
+            burst=lambda: settings.tracking_batch_rate_limit_burst,
+            cost=_batch_cost,
+        ),
+        cache_control(NO_STORE),
+    ],
+)
+async def track_jobs(
+    body: TrackingBatchRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    found, unknown = await service.tracking_batch(db, body.tracking_ids)
+    # Splice the cached per-job bodies in rather than decoding and re-encoding them.
+    results = b",".join(orjson.dumps(tracking_id) + b":" + encoded for tracking_id, encoded in found.items())
+    return json_response(b'{"results":{' + results + b'},"unknown":' + orjson.dumps(unknown) + b"}")
+
+
+@router.get(
+    "/{tracking_id}",
+    response_model=TrackingResponse,
+    responses={304: {"description": "The job is unchanged since the given ETag"}},
+    dependencies=[
+        rate_limit(
+            "tracking",
+            per_minute=lambda: settings.tracking_rate_limit_per_minute,
+            burst=lambda: settings.tracking_rate_limit_burst,
+        ),
+        cache_control(TRACKING_CACHE_CONTROL),
+    ],
+)
 async def track_job(
     tracking_id: str,
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    job = await get_job_by_tracking_id(db, tracking_id)
-    return TrackingResponse(
-        tracking_id=job.tracking_id,
-        status=job.status,
-        pickup_address=job.pickup_address,
-        dropoff_address=job.dropoff_address,
-        driver_id=job.driver_id,
-        created_at=job.created_at,
-    )
+    tracking = await service.tracking_response(db, tracking_id)
+    if etag_matches(request, tracking.etag):
+        return not_modified(tracking.etag)
+    return json_response(tracking.body, {"ETag": tracking.etag})
@@ -0,0 +1,293 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastapi import HTTPException, status
+from sqlalchemy import ARRAY, Row, String, any_, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.drivers.service import DRIVER_POSITION_ENTITY
+from src.eta.service import IN_FLIGHT_STATUSES, job_eta
+from src.invalidation import invalidation_bus
+from src.jobs.archive import get_archived_job_by_tracking_id
+from src.jobs.service import JOB_ENTITY, get_job_by_tracking_id
+from src.models.driver import Driver
+from src.models.job import Job
+from src.models.job_archive import JobArchive
+from src.responses import make_etag
+from src.schemas.job import TrackingResponse
+from src.tracking import ids
+
+_NOT_FOUND = "Tracking ID not found"
+
+
+class NegativeLookupCache:
+    """Bounded TTL set of tracking IDs recently looked up and not found.
+
+    Repeated lookups of unknown IDs (enumeration, stale links) are answered
+    from here instead of the database. New tracking IDs are random, so a job
+    created while its ID is cached as missing is vanishingly unlikely; entries
+    expire after the TTL regardless.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, tracking_id: str) -> bool:
+        expires_at = self._entries.get(tracking_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[tracking_id]
+            return False
+        return True
+
+    def add(self, tracking_id: str) -> None:
+        self._entries.pop(tracking_id, None)
+        self._entries[tracking_id] = time.monotonic() + self.ttl_seconds
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+unknown_tracking_ids = NegativeLookupCache(
+    settings.tracking_negative_cache_max_entries,
+    settings.tracking_negative_cache_ttl_seconds,
+)
+
+
+@dataclass(frozen=True)
+class CachedTracking:
+    job_id: str
+    driver_id: str | None
+    etag: str
+    body: bytes
+    expires_at: float
+
+
+class TrackingResponseCache:
+    """Encoded tracking responses by tracking ID, dropped when the job changes.
+
+    Subscribed to job invalidations on the bus, so entries can live for a long
+    TTL, and to driver position updates, which change the ETA (job and driver
+    IDs are UUIDs and cannot collide). A lookup that raced with an
+    invalidation is not stored: ``generation`` is read before the database
+    query and compared when the result is put.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self._entries: OrderedDict[str, CachedTracking] = OrderedDict()
+        self._by_job: dict[str, str] = {}
+        self._by_driver: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, tracking_id: str) -> CachedTracking | None:
+        entry = self._entries.get(tracking_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(tracking_id)
+            return None
+        self._entries.move_to_end(tracking_id)
+        return entry
+
+    def put(
+        self,
+        tracking_id: str,
+        job_id: str,
+        etag: str,
+        body: bytes,
+        *,
+        generation: int,
+        driver_id: str | None = None,
+    ) -> CachedTracking:
+        entry = CachedTracking(job_id, driver_id, etag, body, time.monotonic() + self.ttl_seconds)
+        if generation != self.generation:
+            return entry
+        self._remove(tracking_id)
+        self._entries[tracking_id] = entry
+        self._by_job[job_id] = tracking_id
+        if driver_id is not None:
+            self._by_driver.setdefault(driver_id, set()).add(tracking_id)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+        return entry
+
+    def invalidate(self, entity_id: str, version: int) -> None:
+        self.generation += 1
+        tracking_id = self._by_job.get(entity_id)
+        if tracking_id is not None:
+            self._remove(tracking_id)
+        for tracking_id in list(self._by_driver.get(entity_id, ())):
+            self._remove(tracking_id)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._by_job.clear()
+        self._by_driver.clear()
+
+    def _remove(self, tracking_id: str) -> None:
+        entry = self._entries.pop(tracking_id, None)
+        if entry is None:
+            return
+        self._by_job.pop(entry.job_id, None)
+        if entry.driver_id is not None:
+            tracking_ids = self._by_driver.get(entry.driver_id)
+            if tracking_ids is not None:
+                tracking_ids.discard(tracking_id)
+                if not tracking_ids:
+                    del self._by_driver[entry.driver_id]
+
+
+tracking_responses = TrackingResponseCache(
+    settings.tracking_cache_max_entries,
+    settings.tracking_cache_ttl_seconds,
+)
+invalidation_bus.subscribe(JOB_ENTITY, tracking_responses)
+invalidation_bus.subscribe(DRIVER_POSITION_ENTITY, tracking_responses)
+
+
+async def tracking_response(db: AsyncSession, tracking_id: str) -> CachedTracking:
+    """Return the encoded tracking response and its ETag, from cache when possible."""
+    tracking_id = ids.normalize(tracking_id)
+    cached = tracking_responses.get(tracking_id)
+    if cached is not None:
+        return cached
+    generation = tracking_responses.generation
+    job = await find_job(db, tracking_id)
+    driver = None
+    if isinstance(job, Job) and job.driver_id is not None and job.status in IN_FLIGHT_STATUSES:
+        result = await db.execute(select(*_DRIVER_COLUMNS).where(Driver.id == job.driver_id))
+        driver = result.one_or_none()
+    return _cache_row(job, generation, driver)
+
+
+def _cache_row(row: Job | JobArchive | Row, generation: int, driver: Row | None = None) -> CachedTracking:
+    response = TrackingResponse.model_validate(row, from_attributes=True)
+    if driver is not None:
+        response.eta = job_eta(row, driver)
+    etag = make_etag((row.id, row.updated_at.isoformat(), response.eta.isoformat() if response.eta else ""))
+    return tracking_responses.put(
+        row.tracking_id, str(row.id), etag, response.model_dump_json().encode(),
+        generation=generation,
+        driver_id=str(row.driver_id) if driver is not None else None,
+    )
+
+
+_DRIVER_COLUMNS = (Driver.vehicle_type, Driver.last_lat, Driver.last_lng, Driver.last_position_at)
+
+
+def _tracking_columns(model: type[Job] | type[JobArchive]) -> tuple:
+    return (
+        model.id,
+        model.tracking_id,
+        model.status,
+        model.pickup_address,
+        model.dropoff_address,
+        model.driver_id,
+        model.created_at,
+        model.updated_at,
+    )
+
+
+def _tracking_id_in(db: AsyncSession, column, tracking_ids: list[str]):
+    if db.get_bind().dialect.name == "postgresql":
+        # One array parameter instead of one bind per ID keeps the statement
+        # text (and its cached plan) the same for every batch size.
+        return column == any_(bindparam("tracking_ids", tracking_ids, type_=ARRAY(String)))
+    return column.in_(tracking_ids)
+
+
+async def tracking_batch(db: AsyncSession, tracking_ids: list[str]) -> tuple[dict[str, bytes], list[str]]:
+    """Resolve many tracking IDs at once.
+
+    Returns encoded ``TrackingResponse`` bodies plus the IDs that matched
+    nothing, both keyed by the IDs exactly as sent (not normalized), so
+    clients can match results to their input. Cached responses are used where
+    present; the rest are fetched with one query against ``jobs`` and, for
+    what is still missing, one against the archive.
+    """
+    sent: dict[str, list[str]] = {}
+    for tracking_id in dict.fromkeys(tracking_ids):
+        sent.setdefault(ids.normalize(tracking_id), []).append(tracking_id)
+
+    found: dict[str, bytes] = {}
+    unknown: list[str] = []
+    pending: list[str] = []
+    for tracking_id in sent:
+        if (
+            not ids.is_well_formed(tracking_id, accept_legacy=settings.tracking_accept_legacy_ids)
+            or tracking_id in unknown_tracking_ids
+        ):
+            unknown.append(tracking_id)
+        elif (cached := tracking_responses.get(tracking_id)) is not None:
+            found[tracking_id] = cached.body
+        else:
+            pending.append(tracking_id)
+
+    generation = tracking_responses.generation
+    if pending:
+        # Live jobs carry what the ETA needs: coordinates and the driver's position.
+        result = await db.execute(
+            select(
+                *_tracking_columns(Job),
+                Job.pickup_lat, Job.pickup_lng, Job.dropoff_lat, Job.dropoff_lng,
+                *_DRIVER_COLUMNS,
+            )
+            .outerjoin(Driver, Driver.id == Job.driver_id)
+            .where(_tracking_id_in(db, Job.tracking_id, pending))
+        )
+        for row in result:
+            in_flight = row.driver_id is not None and row.status in IN_FLIGHT_STATUSES
+            found[row.tracking_id] = _cache_row(row, generation, row if in_flight else None).body
+        pending = [tracking_id for tracking_id in pending if tracking_id not in found]
+    if pending:
+        result = await db.execute(
+            select(*_tracking_columns(JobArchive)).where(_tracking_id_in(db, JobArchive.tracking_id, pending))
+        )
+        for row in result:
+            found[row.tracking_id] = _cache_row(row, generation).body
+        pending = [tracking_id for tracking_id in pending if tracking_id not in found]
+
+    for tracking_id in pending:
+        unknown_tracking_ids.add(tracking_id)
+    results = {original: body for tracking_id, body in found.items() for original in sent[tracking_id]}
+    return results, [original for tracking_id in unknown + pending for original in sent[tracking_id]]
+
+
+async def find_job(db: AsyncSession, tracking_id: str) -> Job | JobArchive:
+    """Look up a job for the public tracking endpoint, falling back to the archive.
+
+    Malformed IDs and IDs recently found not to exist are rejected with the
+    same 404 as a real miss, without touching the database.
+    """
+    tracking_id = ids.normalize(tracking_id)
+    if (
+        not ids.is_well_formed(tracking_id, accept_legacy=settings.tracking_accept_legacy_ids)
+        or tracking_id in unknown_tracking_ids
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_NOT_FOUND)
+    try:
+        return await get_job_by_tracking_id(db, tracking_id)
+    except HTTPException as exc:
+        if exc.status_code != status.HTTP_404_NOT_FOUND:
+            raise
+    archived = await get_archived_job_by_tracking_id(db, tracking_id)
+    if archived is None:
+        unknown_tracking_ids.add(tracking_id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_NOT_FOUND)
+    return archived
@@ -0,0 +1,110 @@
+"""Compact encoding and simplification of driver trails.
+
+Chunks use the Google encoded-polyline scheme extended to three values per
+point: latitude and longitude at 1e-5 degrees (about a metre) and the time in
+whole seconds since the start of the chunk's hour, each delta-encoded against
+the previous point. A typical fix costs 6-10 ASCII characters instead of the
+three floats and timestamp of a raw row.
+"""
+
+import math
+from collections.abc import Iterable, Sequence
+
+from src.geo import EARTH_RADIUS_M
+
+# (lat, lng, seconds since the chunk's hour_start)
+Point = tuple[float, float, int]
+
+_SCALE = 1e5
+_METRES_PER_DEGREE = math.radians(1) * EARTH_RADIUS_M
+# Ground metres covered by one 256 px web-map (Web Mercator) pixel at zoom 0 on the equator.
+_METRES_PER_PIXEL_Z0 = 2 * math.pi * 6_378_137.0 / 256
+
+
+def _encode_value(value: int, out: list[str]) -> None:
+    value = ~(value << 1) if value < 0 else value << 1
+    while value >= 0x20:
+        out.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+    out.append(chr(value + 63))
+
+
+def encode(points: Iterable[Point]) -> str:
+    out: list[str] = []
+    prev_lat = prev_lng = prev_t = 0
+    for lat, lng, t in points:
+        ilat, ilng = round(lat * _SCALE), round(lng * _SCALE)
+        _encode_value(ilat - prev_lat, out)
+        _encode_value(ilng - prev_lng, out)
+        _encode_value(t - prev_t, out)
+        prev_lat, prev_lng, prev_t = ilat, ilng, t
+    return "".join(out)
+
+
+def decode(encoded: str) -> list[Point]:
+    values: list[int] = []
+    shift = result = 0
+    for char in encoded:
+        byte = ord(char) - 63
+        result |= (byte & 0x1F) << shift
+        shift += 5
+        if byte < 0x20:
+            values.append(~(result >> 1) if result & 1 else result >> 1)
+            shift = result = 0
+
+    points: list[Point] = []
+    lat = lng = t = 0
+    for i in range(0, len(values) - 2, 3):
+        lat += values[i]
+        lng += values[i + 1]
+        t += values[i + 2]
+        points.append((lat / _SCALE, lng / _SCALE, t))
+    return points
+
+
+def tolerance_for_zoom(zoom: int, latitude: float) -> float:
+    """Metres per screen pixel at a web-map ``zoom`` level and ``latitude``."""
+    return _METRES_PER_PIXEL_Z0 * math.cos(math.radians(latitude)) / 2**zoom
+
+
+def simplify(points: Sequence[tuple[float, float]], tolerance_m: float) -> list[int]:
+    """Douglas-Peucker: indices of the points to keep so no dropped point is
+    further than ``tolerance_m`` from the simplified line.
+
+    Iterative, on an equirectangular projection around the first point, which
+    is accurate to well under a pixel over a city-sized trail.
+    """
+    count = len(points)
+    if count <= 2 or tolerance_m <= 0:
+        return list(range(count))
+    lat0 = points[0][0]
+    x_scale = math.cos(math.radians(lat0)) * _METRES_PER_DEGREE
+    xs = [(lng - points[0][1]) * x_scale for _, lng in points]
+    ys = [(lat - lat0) * _METRES_PER_DEGREE for lat, _ in points]
+    tolerance_sq = tolerance_m * tolerance_m
+
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = xs[first], ys[first]
+        dx, dy = xs[last] - ax, ys[last] - ay
+        length_sq = dx * dx + dy * dy
+        farthest, max_sq = -1, tolerance_sq
+        for i in range(first + 1, last):
+            px, py = xs[i] - ax, ys[i] - ay
+            if length_sq == 0:
+                distance_sq = px * px + py * py
+            else:
+                # Distance to the segment, not the infinite line, so back-tracks are kept.
+                t = max(0.0, min(1.0, (px * dx + py * dy) / length_sq))
+                ex, ey = px - t * dx, py - t * dy
+                distance_sq = ex * ex + ey * ey
+            if distance_sq > max_sq:
+                farthest, max_sq = i, distance_sq
+        if farthest != -1:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+    return [i for i in range(count) if keep[i]]
@@ -0,0 +1,144 @@
+"""Fold raw position fixes into hourly encoded trail chunks.
+
+Fixes older than ``trail_raw_retention_hours`` are read in batches, merged
+into the ``driver_trail_chunks`` row for their driver and hour (created if
+missing, re-encoded if it already holds earlier fixes) and deleted, each
+batch in its own transaction. Raw fixes are claimed with ``SKIP LOCKED`` and
+chunks are locked before they are merged, so several runs can work at once. Run it periodically, e.g. hourly from cron:
+
+    python -m src.trails.rollup --hours 48
+"""
+
+import argparse
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.models.driver_trail import DriverPosition, DriverTrailChunk
+from src.timeutils import as_utc
+from src.trails import codec
+from src.trails.service import hour_start
+
+logger = logging.getLogger(__name__)
+
+
+async def roll_up_batch(db: AsyncSession, cutoff: datetime, batch_size: int) -> int:
+    """Move up to ``batch_size`` raw fixes recorded before ``cutoff`` into chunks; return how many."""
+    postgres = db.get_bind().dialect.name == "postgresql"
+    query = (
+        select(DriverPosition.id, DriverPosition.driver_id, DriverPosition.lat, DriverPosition.lng,
+               DriverPosition.recorded_at)
+        .where(DriverPosition.recorded_at < cutoff)
+        .order_by(DriverPosition.recorded_at)
+        .limit(batch_size)
+    )
+    if postgres:
+        query = query.with_for_update(skip_locked=True)
+    rows = (await db.execute(query)).all()
+    if not rows:
+        return 0
+
+    groups: dict[tuple[uuid.UUID, datetime], list[codec.Point]] = defaultdict(list)
+    for row in rows:
+        recorded_at = as_utc(row.recorded_at)
+        start = hour_start(recorded_at)
+        groups[(row.driver_id, start)].append((row.lat, row.lng, int((recorded_at - start).total_seconds())))
+
+    # Make sure every (driver, hour) has a chunk, then lock them in key order:
+    # a concurrent run merging other fixes into the same chunk waits for this
+    # transaction instead of overwriting its re-encoded points.
+    keys = sorted(groups)
+    now = datetime.now(timezone.utc)
+    await db.execute(
+        (postgresql if postgres else sqlite).insert(DriverTrailChunk)
+        .values([
+            {
+                "id": uuid.uuid4(),
+                "driver_id": driver_id,
+                "hour_start": start,
+                "point_count": 0,
+                "encoded": "",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for driver_id, start in keys
+        ])
+        .on_conflict_do_nothing(index_elements=["driver_id", "hour_start"])
+    )
+    query = (
+        select(DriverTrailChunk)
+        .where(
+            DriverTrailChunk.driver_id.in_({driver_id for driver_id, _ in keys}),
+            DriverTrailChunk.hour_start.in_({start for _, start in keys}),
+        )
+        .order_by(DriverTrailChunk.driver_id, DriverTrailChunk.hour_start)
+    )
+    if postgres:
+        query = query.with_for_update()
+    chunks = {(chunk.driver_id, as_utc(chunk.hour_start)): chunk for chunk in (await db.execute(query)).scalars()}
+
+    for key, points in groups.items():
+        chunk = chunks[key]
+        # Non-empty for a straggler in an hour already rolled up (e.g. a late offline upload).
+        points = codec.decode(chunk.encoded) + points
+        points.sort(key=lambda point: point[2])
+        chunk.encoded = codec.encode(points)
+        chunk.point_count = len(points)
+
+    await db.execute(delete(DriverPosition).where(DriverPosition.id.in_([row.id for row in rows])))
+    await db.flush()
+    return len(rows)
+
+
+async def roll_up(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    older_than_hours: int | None = None,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+) -> int:
+    """Roll up in committed batches until nothing is left; return the number of fixes moved."""
+    hours = settings.trail_raw_retention_hours if older_than_hours is None else older_than_hours
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    total = batches = 0
+    while max_batches is None or batches < max_batches:
+        async with session_factory() as db:
+            moved = await roll_up_batch(db, cutoff, batch_size or settings.trail_rollup_batch_size)
+            await db.commit()
+        if not moved:
+            break
+        total += moved
+        batches += 1
+        logger.info("Rolled up %d fixes (%d total)", moved, total)
+    return total
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from src.database import async_session_factory, engine
+
+    try:
+        total = await roll_up(
+            async_session_factory,
+            older_than_hours=args.hours,
+            batch_size=args.batch_size,
+            max_batches=args.max_batches,
+        )
+        print(f"Rolled up {total} position fixes")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Fold old raw position fixes into hourly trail chunks.")
+    parser.add_argument("--hours", type=int, default=None, help="default: COURIER_TRAIL_RAW_RETENTION_HOURS")
+    parser.add_argument("--batch-size", type=int, default=None, help="default: COURIER_TRAIL_ROLLUP_BATCH_SIZE")
+    parser.add_argument("--max-batches", type=int, default=None)
+    asyncio.run(_main(parser.parse_args()))
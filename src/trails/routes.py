@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import Principal, require_roles
+from src.database import get_db
+from src.models.user import UserRole
+from src.responses import NO_STORE, cache_control
+from src.schemas.position import TrailPoint, TrailResponse
+from src.timeutils import as_utc
+from src.trails import service
+
+router = APIRouter(prefix="/api/drivers/{driver_id}/trail", tags=["trails"])
+
+AdminOrDispatcher = Annotated[Principal, Depends(require_roles(UserRole.ADMIN, UserRole.DISPATCHER))]
+
+
+@router.get("", response_model=TrailResponse, dependencies=[cache_control(NO_STORE)])
+async def get_trail(
+    driver_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+    start: datetime | None = Query(default=None, description="Default: 24 hours before end"),
+    end: datetime | None = Query(default=None, description="Default: now"),
+    zoom: int | None = Query(
+        default=None, ge=0, le=22,
+        description="Web-map zoom level; the trail is simplified to one pixel at this zoom. Omit for every fix.",
+    ),
+):
+    end = as_utc(end) if end else datetime.now(timezone.utc)
+    start = as_utc(start) if start else end - timedelta(hours=24)
+    points, raw_count = await service.get_trail(db, driver_id, start, end, zoom)
+    return TrailResponse(
+        driver_id=driver_id,
+        start=start,
+        end=end,
+        raw_points=raw_count,
+        points=[TrailPoint(lat=lat, lng=lng, recorded_at=recorded_at) for lat, lng, recorded_at in points],
+    )
@@ -0,0 +1,95 @@
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.driver import Driver
+from src.models.driver_trail import DriverPosition, DriverTrailChunk
+from src.schemas.position import PositionFix
+from src.timeutils import as_utc
+from src.trails import codec
+
+
+def hour_start(value: datetime) -> datetime:
+    return as_utc(value).replace(minute=0, second=0, microsecond=0)
+
+
+async def store_fixes(db: AsyncSession, driver_id: uuid.UUID, fixes: list[PositionFix]) -> None:
+    """Append a batch of raw fixes in one multi-row insert."""
+    await db.execute(insert(DriverPosition), [
+        {
+            "driver_id": driver_id,
+            "lat": fix.lat,
+            "lng": fix.lng,
+            "recorded_at": as_utc(fix.recorded_at),
+            "accuracy_m": fix.accuracy_m,
+        }
+        for fix in fixes
+    ])
+
+
+async def trail_points(
+    db: AsyncSession, driver_id: uuid.UUID, start: datetime, end: datetime,
+) -> list[tuple[float, float, datetime]]:
+    """The driver's fixes in ``[start, end)`` from chunks and raw rows, oldest first.
+
+    Roll-up moves fixes from raw rows to chunks in one transaction, so each
+    fix is read from exactly one of the two.
+    """
+    start, end = as_utc(start), as_utc(end)
+    points: list[tuple[float, float, datetime]] = []
+    chunks = await db.execute(
+        select(DriverTrailChunk.hour_start, DriverTrailChunk.encoded).where(
+            DriverTrailChunk.driver_id == driver_id,
+            DriverTrailChunk.hour_start >= hour_start(start),
+            DriverTrailChunk.hour_start < end,
+        )
+    )
+    for chunk_start, encoded in chunks:
+        chunk_start = as_utc(chunk_start)
+        for lat, lng, offset in codec.decode(encoded):
+            recorded_at = chunk_start + timedelta(seconds=offset)
+            if start <= recorded_at < end:
+                points.append((lat, lng, recorded_at))
+
+    raw = await db.execute(
+        select(DriverPosition.recorded_at, DriverPosition.lat, DriverPosition.lng).where(
+            DriverPosition.driver_id == driver_id,
+            DriverPosition.recorded_at >= start,
+            DriverPosition.recorded_at < end,
+        )
+    )
+    points.extend((lat, lng, as_utc(recorded_at)) for recorded_at, lat, lng in raw)
+    points.sort(key=lambda point: point[2])
+    return points
+
+
+async def get_trail(
+    db: AsyncSession,
+    driver_id: uuid.UUID,
+    start: datetime,
+    end: datetime,
+    zoom: int | None = None,
+) -> tuple[list[tuple[float, float, datetime]], int]:
+    """Return the trail, simplified to one screen pixel at ``zoom`` if given, and the raw point count."""
+    if end <= start or end - start > timedelta(hours=settings.trail_max_range_hours):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Trail range must be positive and at most {settings.trail_max_range_hours} hours",
+        )
+    result = await db.execute(select(Driver.id).where(Driver.id == driver_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Driver not found")
+
+    points = await trail_points(db, driver_id, start, end)
+    raw_count = len(points)
+    if zoom is not None and points:
+        tolerance = codec.tolerance_for_zoom(zoom, points[0][0])
+        points = [points[i] for i in codec.simplify([(lat, lng) for lat, lng, _ in points], tolerance)]
+    if len(points) > settings.trail_max_points:
+        step = len(points) / settings.trail_max_points
+        points = [points[int(i * step)] for i in range(settings.trail_max_points - 1)] + [points[-1]]
+    return points, raw_count
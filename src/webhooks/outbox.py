@@ -0,0 +1,30 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.job import Job
+from src.models.job_status_event import JobStatusEvent
+from src.models.webhook import OutboxEvent
+
+JOB_STATUS_CHANGED = "job.status_changed"
+
+
+def enqueue_status_change(db: AsyncSession, job: Job, event: JobStatusEvent) -> OutboxEvent:
+    """Add a ``job.status_changed`` outbox row to the caller's transaction.
+
+    Nothing is sent here; the delivery worker picks the row up after commit,
+    so customer endpoints never sit on the request path.
+    """
+    outbox = OutboxEvent(
+        event_type=JOB_STATUS_CHANGED,
+        customer_id=job.customer_id,
+        job_id=job.id,
+        payload={
+            "job_id": str(job.id),
+            "tracking_id": job.tracking_id,
+            "previous_status": event.from_status.value if event.from_status else None,
+            "status": event.to_status.value,
+            "driver_id": str(job.driver_id) if job.driver_id else None,
+            "occurred_at": event.occurred_at.isoformat(),
+        },
+    )
+    db.add(outbox)
+    return outbox
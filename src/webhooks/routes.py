@@ -0,0 +1,60 @@
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import Principal, require_roles
+from src.database import get_db
+from src.models.user import UserRole
+from src.schemas.webhook import (
+    WebhookDeadLetterRead,
+    WebhookSubscriptionCreate,
+    WebhookSubscriptionCreated,
+    WebhookSubscriptionRead,
+)
+from src.webhooks import service
+
+router = APIRouter(prefix="/api/customers/{customer_id}/webhooks", tags=["webhooks"])
+
+AdminOrDispatcher = Annotated[Principal, Depends(require_roles(UserRole.ADMIN, UserRole.DISPATCHER))]
+
+
+@router.post("", response_model=WebhookSubscriptionCreated, status_code=201)
+async def create_subscription(
+    customer_id: uuid.UUID,
+    body: WebhookSubscriptionCreate,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+):
+    return await service.create_subscription(db, customer_id, url=str(body.url), secret=body.secret)
+
+
+@router.get("", response_model=list[WebhookSubscriptionRead])
+async def list_subscriptions(
+    customer_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+):
+    return await service.list_subscriptions(db, customer_id)
+
+
+@router.delete("/{subscription_id}", status_code=204)
+async def delete_subscription(
+    customer_id: uuid.UUID,
+    subscription_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+):
+    await service.delete_subscription(db, customer_id, subscription_id)
+
+
+@router.get("/dead-letters", response_model=list[WebhookDeadLetterRead])
+async def list_dead_letters(
+    customer_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    _current_user: AdminOrDispatcher,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=200),
+):
+    return await service.list_dead_letters(db, customer_id, skip=skip, limit=limit)
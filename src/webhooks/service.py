@@ -0,0 +1,73 @@
+import secrets
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.customer import Customer
+from src.models.webhook import WebhookDeadLetter, WebhookSubscription
+
+
+async def _ensure_customer(db: AsyncSession, customer_id: uuid.UUID) -> None:
+    result = await db.execute(select(Customer.id).where(Customer.id == customer_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found")
+
+
+async def create_subscription(
+    db: AsyncSession,
+    customer_id: uuid.UUID,
+    *,
+    url: str,
+    secret: str | None = None,
+) -> WebhookSubscription:
+    await _ensure_customer(db, customer_id)
+    subscription = WebhookSubscription(
+        customer_id=customer_id,
+        url=url,
+        secret=secret or secrets.token_hex(32),
+    )
+    db.add(subscription)
+    await db.flush()
+    await db.refresh(subscription)
+    return subscription
+
+
+async def list_subscriptions(db: AsyncSession, customer_id: uuid.UUID) -> list[WebhookSubscription]:
+    await _ensure_customer(db, customer_id)
+    result = await db.execute(
+        select(WebhookSubscription)
+        .where(WebhookSubscription.customer_id == customer_id)
+        .order_by(WebhookSubscription.created_at)
+    )
+    return list(result.scalars().all())
+
+
+async def delete_subscription(db: AsyncSession, customer_id: uuid.UUID, subscription_id: uuid.UUID) -> None:
+    result = await db.execute(
+        select(WebhookSubscription).where(
+            WebhookSubscription.id == subscription_id,
+            WebhookSubscription.customer_id == customer_id,
+        )
+    )
+    subscription = result.scalar_one_or_none()
+    if subscription is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Webhook subscription not found")
+    await db.delete(subscription)
+    await db.flush()
+
+
+async def list_dead_letters(
+    db: AsyncSession, customer_id: uuid.UUID, *, skip: int = 0, limit: int = 50,
+) -> list[WebhookDeadLetter]:
+    await _ensure_customer(db, customer_id)
+    result = await db.execute(
+        select(WebhookDeadLetter)
+        .join(WebhookSubscription, WebhookSubscription.id == WebhookDeadLetter.subscription_id)
+        .where(WebhookSubscription.customer_id == customer_id)
+        .order_by(WebhookDeadLetter.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,15 @@
+import hashlib
+import hmac
+
+SIGNATURE_HEADER = "X-Courier-Signature"
+TIMESTAMP_HEADER = "X-Courier-Timestamp"
+
+
+def sign(secret: str, timestamp: int, body: bytes) -> str:
+    """HMAC-SHA256 over ``"{timestamp}." + body``, formatted as ``sha256=<hex>``."""
+    mac = hmac.new(secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256)
+    return f"sha256={mac.hexdigest()}"
+
+
+def verify(secret: str, timestamp: int, body: bytes, signature: str) -> bool:
+    return hmac.compare_digest(sign(secret, timestamp, body), signature)
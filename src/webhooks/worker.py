@@ -0,0 +1,243 @@
+"""Background delivery of webhook outbox events.
+
+Each cycle has three short transactions:
+
+1. fan-out: undispatched outbox events become one ``WebhookDelivery`` per
+   active subscription of the event's customer;
+2. claim: due deliveries are leased by pushing ``next_attempt_at`` forward,
+   so other workers skip them while HTTP calls are in flight;
+3. record: results are written back, retries rescheduled with exponential
+   backoff, and exhausted deliveries moved to ``webhook_dead_letters``.
+
+Events for the same endpoint are sent together as one signed batch, and
+endpoints are called concurrently over a shared pooled ``httpx.AsyncClient``.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import contains_eager
+
+from src.config import settings
+from src.models.webhook import OutboxEvent, WebhookDeadLetter, WebhookDelivery, WebhookSubscription
+from src.webhooks.signing import SIGNATURE_HEADER, TIMESTAMP_HEADER, sign
+
+logger = logging.getLogger(__name__)
+
+_PURGE_INTERVAL_SECONDS = 3600
+
+
+def backoff_delay(attempts: int) -> float:
+    delay = min(settings.webhook_backoff_base_seconds * 2 ** (attempts - 1), settings.webhook_backoff_max_seconds)
+    return delay * random.uniform(0.9, 1.1)
+
+
+def _event_body(event: OutboxEvent) -> dict:
+    return {
+        "id": str(event.id),
+        "type": event.event_type,
+        "created_at": event.created_at.isoformat(),
+        "data": event.payload,
+    }
+
+
+class WebhookWorker:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.client = client or httpx.AsyncClient(
+            timeout=settings.webhook_timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=settings.webhook_max_concurrency,
+                max_keepalive_connections=settings.webhook_max_concurrency,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(settings.webhook_max_concurrency)
+        self._task: asyncio.Task | None = None
+        self._last_purge = 0.0
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="webhook-worker")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.client.aclose()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if time.monotonic() - self._last_purge > _PURGE_INTERVAL_SECONDS:
+                    await self.purge()
+                    self._last_purge = time.monotonic()
+                delivered = await self.run_once()
+            except Exception:
+                logger.exception("Webhook delivery cycle failed")
+                delivered = 0
+            if not delivered:
+                await asyncio.sleep(settings.webhook_poll_interval_seconds)
+
+    async def run_once(self) -> int:
+        """Run one fan-out/claim/deliver cycle. Returns the number of deliveries attempted."""
+        await self.fan_out()
+        deliveries = await self.claim_due()
+        if not deliveries:
+            return 0
+
+        by_subscription: dict[uuid.UUID, list[WebhookDelivery]] = defaultdict(list)
+        for delivery in deliveries:
+            by_subscription[delivery.subscription_id].append(delivery)
+
+        results = await asyncio.gather(*(
+            self._send(batch[0].subscription, batch) for batch in by_subscription.values()
+        ))
+        await self.record(dict(zip(by_subscription, results)), by_subscription)
+        return len(deliveries)
+
+    async def fan_out(self) -> None:
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(OutboxEvent)
+                .where(OutboxEvent.dispatched_at.is_(None))
+                .order_by(OutboxEvent.created_at)
+                .limit(settings.webhook_batch_size * 10)
+                .with_for_update(skip_locked=True)
+            )
+            events = list(result.scalars())
+            if not events:
+                return
+
+            result = await db.execute(
+                select(WebhookSubscription.id, WebhookSubscription.customer_id).where(
+                    WebhookSubscription.customer_id.in_({e.customer_id for e in events}),
+                    WebhookSubscription.is_active.is_(True),
+                )
+            )
+            subscriptions: dict[uuid.UUID, list[uuid.UUID]] = defaultdict(list)
+            for subscription_id, customer_id in result:
+                subscriptions[customer_id].append(subscription_id)
+
+            now = datetime.now(timezone.utc)
+            for event in events:
+                for subscription_id in subscriptions.get(event.customer_id, ()):
+                    db.add(WebhookDelivery(subscription_id=subscription_id, event_id=event.id, next_attempt_at=now))
+                event.dispatched_at = now
+            await db.commit()
+
+    async def claim_due(self) -> list[WebhookDelivery]:
+        async with self.session_factory() as db:
+            now = datetime.now(timezone.utc)
+            result = await db.execute(
+                select(WebhookDelivery)
+                .join(WebhookDelivery.subscription)
+                .options(contains_eager(WebhookDelivery.subscription))
+                .where(
+                    WebhookDelivery.delivered_at.is_(None),
+                    WebhookDelivery.next_attempt_at <= now,
+                    WebhookSubscription.is_active.is_(True),
+                )
+                .order_by(WebhookDelivery.next_attempt_at)
+                .limit(settings.webhook_batch_size * 10)
+                .with_for_update(of=WebhookDelivery, skip_locked=True)
+            )
+            deliveries = list(result.unique().scalars())
+            lease_until = now + timedelta(seconds=settings.webhook_lease_seconds)
+            for delivery in deliveries:
+                delivery.next_attempt_at = lease_until
+            await db.commit()
+            return deliveries
+
+    async def _send(
+        self, subscription: WebhookSubscription, deliveries: list[WebhookDelivery],
+    ) -> list[str | None]:
+        """POST the deliveries to one endpoint in batches; returns an error (or None) per delivery."""
+        errors: list[str | None] = []
+        for start in range(0, len(deliveries), settings.webhook_batch_size):
+            batch = deliveries[start:start + settings.webhook_batch_size]
+            body = json.dumps({"events": [_event_body(d.event) for d in batch]}, separators=(",", ":")).encode()
+            timestamp = int(time.time())
+            headers = {
+                "Content-Type": "application/json",
+                TIMESTAMP_HEADER: str(timestamp),
+                SIGNATURE_HEADER: sign(subscription.secret, timestamp, body),
+            }
+            error: str | None = None
+            try:
+                async with self._semaphore:
+                    response = await self.client.post(subscription.url, content=body, headers=headers)
+                if response.status_code >= 300:
+                    error = f"HTTP {response.status_code}"
+            except httpx.HTTPError as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            errors.extend([error] * len(batch))
+        return errors
+
+    async def record(
+        self,
+        results: dict[uuid.UUID, list[str | None]],
+        deliveries: dict[uuid.UUID, list[WebhookDelivery]],
+    ) -> None:
+        async with self.session_factory() as db:
+            now = datetime.now(timezone.utc)
+            for subscription_id, errors in results.items():
+                for delivery, error in zip(deliveries[subscription_id], errors):
+                    if error is None:
+                        await db.execute(
+                            update(WebhookDelivery)
+                            .where(WebhookDelivery.id == delivery.id)
+                            .values(delivered_at=now, attempts=delivery.attempts + 1, last_error=None)
+                        )
+                        continue
+
+                    attempts = delivery.attempts + 1
+                    if attempts >= settings.webhook_max_attempts:
+                        logger.warning("Webhook delivery %s dead-lettered after %d attempts", delivery.id, attempts)
+                        db.add(WebhookDeadLetter(
+                            subscription_id=subscription_id,
+                            event_id=delivery.event_id,
+                            event_type=delivery.event.event_type,
+                            payload=_event_body(delivery.event),
+                            attempts=attempts,
+                            last_error=error,
+                        ))
+                        await db.execute(delete(WebhookDelivery).where(WebhookDelivery.id == delivery.id))
+                    else:
+                        await db.execute(
+                            update(WebhookDelivery)
+                            .where(WebhookDelivery.id == delivery.id)
+                            .values(
+                                attempts=attempts,
+                                last_error=error,
+                                next_attempt_at=now + timedelta(seconds=backoff_delay(attempts)),
+                            )
+                        )
+            await db.commit()
+
+    async def purge(self) -> None:
+        """Drop dispatched outbox events (and their finished deliveries) past retention."""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.webhook_outbox_retention_hours)
+        async with self.session_factory() as db:
+            await db.execute(
+                delete(OutboxEvent).where(
+                    OutboxEvent.dispatched_at.is_not(None),
+                    OutboxEvent.dispatched_at < cutoff,
+                )
+            )
+            await db.commit()
@@ -8,11 +8,16 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from src.auth.utils import create_access_token
 from src.database import get_db
+from src.drivers.geofence import geofence_index
+from src.jobs.dispatch import dispatch_queue
 from src.main import app
 from src.models import Base
 from src.models.customer import Customer
 from src.models.driver import Driver
 from src.models.user import User, UserRole
+from src.ratelimit import InMemoryRateLimitBackend, get_rate_limit_backend
+from src.sla.monitor import sla_monitor
+from src.tracking.service import tracking_responses, unknown_tracking_ids
 
 TEST_DB_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -48,7 +53,14 @@ async def client(db_engine):
                 await session.rollback()
                 raise
 
+    rate_limits = InMemoryRateLimitBackend()
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_rate_limit_backend] = lambda: rate_limits
+    unknown_tracking_ids.clear()
+    tracking_responses.clear()
+    geofence_index.clear()
+    dispatch_queue.clear()
+    sla_monitor.clear()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -120,3 +132,9 @@ async def driver(db_session: AsyncSession, driver_user: User) -> Driver:
     await db_session.commit()
     await db_session.refresh(drv)
     return drv
+
+
+@pytest_asyncio.fixture()
+def driver_headers(driver: Driver, driver_user: User) -> dict[str, str]:
+    token = create_access_token(str(driver_user.id), driver_user.role.value)
+    return {"Authorization": f"Bearer {token}"}
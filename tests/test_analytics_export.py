@@ -0,0 +1,91 @@
+"""Tests for the incremental Parquet export."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.analytics.export import get_watermark, run_export
+from src.config import settings
+from src.models.customer import Customer
+from src.storage.blob import LocalBlobStore
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+async def session_factory(db_engine):
+    return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture()
+def no_lag(monkeypatch):
+    monkeypatch.setattr(settings, "export_lag_seconds", 0)
+
+
+def _read(root: Path, table: str) -> pa.Table:
+    files = sorted((root / table).rglob("*.parquet"))
+    return pa.concat_tables([pq.read_table(path) for path in files]) if files else None
+
+
+async def _create_job(client: AsyncClient, headers: dict, customer: Customer, label: str) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={"customer_id": str(customer.id), "pickup_address": f"{label} a", "dropoff_address": f"{label} b"},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+class TestExport:
+    async def test_full_export_writes_date_partitions(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, session_factory, tmp_path, no_lag,
+    ):
+        jobs = [await _create_job(client, admin_headers, customer, str(i)) for i in range(3)]
+        exported = await run_export(session_factory, LocalBlobStore(tmp_path, ""), batch_size=2)
+        assert exported == {"jobs": 3, "job_status_events": 3, "pods": 0}
+
+        today = datetime.now(timezone.utc).date().isoformat()
+        [partition] = (tmp_path / "jobs").iterdir()
+        assert partition.name == f"date={today}"
+
+        table = _read(tmp_path, "jobs")
+        assert sorted(table.column("id").to_pylist()) == sorted(job["id"] for job in jobs)
+        assert table.schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+        assert table.schema.field("pickup_lat").type == pa.float64()
+        assert set(table.column("status").to_pylist()) == {"pending"}
+        assert _read(tmp_path, "pods") is None
+
+    async def test_incremental_export_only_reads_changes(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, session_factory, tmp_path, no_lag,
+    ):
+        first = await _create_job(client, admin_headers, customer, "first")
+        await _create_job(client, admin_headers, customer, "second")
+        await run_export(session_factory, LocalBlobStore(tmp_path / "run1", ""))
+        async with session_factory() as db:
+            watermark = await get_watermark(db, "jobs")
+        assert watermark is not None
+
+        resp = await client.patch(f"/api/jobs/{first['id']}", json={"pickup_address": "moved"}, headers=admin_headers)
+        assert resp.status_code == 200, resp.text
+        exported = await run_export(session_factory, LocalBlobStore(tmp_path / "run2", ""))
+        assert exported == {"jobs": 1, "job_status_events": 0, "pods": 0}
+        table = _read(tmp_path / "run2", "jobs")
+        assert table.column("id").to_pylist() == [first["id"]]
+        assert table.column("pickup_address").to_pylist() == ["moved"]
+
+    async def test_recent_changes_wait_for_the_lag(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, session_factory, tmp_path,
+    ):
+        await _create_job(client, admin_headers, customer, "new")
+        exported = await run_export(session_factory, LocalBlobStore(tmp_path / "now", ""))
+        assert exported["jobs"] == 0
+        later = datetime.now(timezone.utc) + timedelta(seconds=settings.export_lag_seconds + 1)
+        exported = await run_export(session_factory, LocalBlobStore(tmp_path / "later", ""), now=later)
+        assert exported["jobs"] == 1
@@ -0,0 +1,140 @@
+"""Tests for archiving terminal jobs and the tracking fallback."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.jobs.archive import archive_terminal_jobs
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.job import Job, JobStatus
+from src.models.job_archive import JobArchive
+from src.models.job_status_event import JobStatusEvent
+from src.models.pod import POD
+from src.models.sla import SlaBreach
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _job(client: AsyncClient, headers: dict, customer: Customer, driver: Driver, statuses: list[str]) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"},
+        headers=headers,
+    )
+    job = resp.json()
+    await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=headers)
+    for status in statuses:
+        resp = await client.patch(f"/api/jobs/{job['id']}", json={"status": status}, headers=headers)
+        assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+async def _age(db_session: AsyncSession, job_id: str, days: int) -> None:
+    created = datetime.now(timezone.utc) - timedelta(days=days)
+    await db_session.execute(update(Job).where(Job.id == uuid.UUID(job_id)).values(created_at=created))
+    await db_session.commit()
+
+
+async def _count(db_session: AsyncSession, model) -> int:
+    return (await db_session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+class TestArchive:
+    async def test_moves_only_old_terminal_jobs(
+        self, client: AsyncClient, admin_headers: dict, db_engine, db_session: AsyncSession,
+        customer: Customer, driver: Driver,
+    ):
+        delivered = await _job(client, admin_headers, customer, driver, ["picked_up", "in_transit", "delivered"])
+        failed = await _job(client, admin_headers, customer, driver, ["picked_up", "in_transit", "failed"])
+        active = await _job(client, admin_headers, customer, driver, ["picked_up"])
+        recent = await _job(client, admin_headers, customer, driver, ["picked_up", "in_transit", "delivered"])
+        for job in (delivered, failed, active):
+            await _age(db_session, job["id"], 120)
+        db_session.add(POD(job_id=uuid.UUID(delivered["id"]), signed_by="Reception", notes="Left at desk"))
+        await db_session.commit()
+
+        factory = async_sessionmaker(db_engine, expire_on_commit=False)
+        moved = await archive_terminal_jobs(factory, older_than_days=90, batch_size=1)
+        assert moved == 2
+
+        remaining = set((await db_session.execute(select(Job.tracking_id))).scalars())
+        assert remaining == {active["tracking_id"], recent["tracking_id"]}
+        assert await _count(db_session, POD) == 0
+
+        archived = (await db_session.execute(
+            select(JobArchive).where(JobArchive.tracking_id == delivered["tracking_id"])
+        )).scalar_one()
+        assert archived.pod["signed_by"] == "Reception"
+        assert [h["to_status"] for h in archived.history] == [
+            "pending", "assigned", "picked_up", "in_transit", "delivered",
+        ]
+        events = await db_session.execute(
+            select(func.count()).select_from(JobStatusEvent).where(JobStatusEvent.job_id == uuid.UUID(delivered["id"]))
+        )
+        assert events.scalar_one() == 0
+
+    async def test_keeps_job_fields(
+        self, client: AsyncClient, admin_headers: dict, db_engine, db_session: AsyncSession,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _job(client, admin_headers, customer, driver, ["picked_up", "in_transit", "delivered"])
+        start = datetime(2026, 6, 1, 9, tzinfo=timezone.utc)
+        await db_session.execute(update(Job).where(Job.id == uuid.UUID(job["id"])).values(
+            pickup_window_start=start, pickup_window_end=start + timedelta(hours=1),
+            delivery_window_end=start + timedelta(hours=4),
+            pickup_lat=51.5074, pickup_lng=-0.1278, dropoff_lat=51.5155, dropoff_lng=-0.0922,
+        ))
+        await _age(db_session, job["id"], 120)
+        await archive_terminal_jobs(async_sessionmaker(db_engine, expire_on_commit=False), older_than_days=90)
+
+        archived = (await db_session.execute(
+            select(JobArchive).where(JobArchive.tracking_id == job["tracking_id"])
+        )).scalar_one()
+        windows = (
+            archived.pickup_window_start, archived.pickup_window_end,
+            archived.delivery_window_start, archived.delivery_window_end,
+        )
+        assert [value and value.replace(tzinfo=timezone.utc) for value in windows] == [
+            start, start + timedelta(hours=1), None, start + timedelta(hours=4),
+        ]
+        coordinates = (archived.pickup_lat, archived.pickup_lng, archived.dropoff_lat, archived.dropoff_lng)
+        assert coordinates == (51.5074, -0.1278, 51.5155, -0.0922)
+
+    async def test_sla_breaches_survive_archiving(
+        self, client: AsyncClient, admin_headers: dict, db_engine, db_session: AsyncSession,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _job(client, admin_headers, customer, driver, ["picked_up", "in_transit", "delivered"])
+        await _age(db_session, job["id"], 120)
+        now = datetime.now(timezone.utc)
+        db_session.add(SlaBreach(
+            job_id=uuid.UUID(job["id"]), customer_id=customer.id, tracking_id=job["tracking_id"],
+            status=JobStatus.PENDING, entered_at=now - timedelta(hours=1), threshold_seconds=60, breached_at=now,
+        ))
+        await db_session.commit()
+
+        factory = async_sessionmaker(db_engine, expire_on_commit=False)
+        assert await archive_terminal_jobs(factory, older_than_days=90) == 1
+        resp = await client.get("/api/sla/breaches", params={"customer_id": str(customer.id)}, headers=admin_headers)
+        assert [breach["tracking_id"] for breach in resp.json()] == [job["tracking_id"]]
+
+    async def test_tracking_falls_back_to_archive(
+        self, client: AsyncClient, admin_headers: dict, db_engine, db_session: AsyncSession,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _job(client, admin_headers, customer, driver, ["picked_up", "in_transit", "delivered"])
+        await _age(db_session, job["id"], 120)
+        await archive_terminal_jobs(async_sessionmaker(db_engine, expire_on_commit=False), older_than_days=90)
+
+        resp = await client.get(f"/api/tracking/{job['tracking_id']}")
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "delivered"
+        assert "etag" in resp.headers
+
+    async def test_nothing_to_archive(self, db_engine):
+        assert await archive_terminal_jobs(async_sessionmaker(db_engine), older_than_days=90) == 0
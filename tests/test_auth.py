@@ -0,0 +1,109 @@
+"""Tests for the login endpoint and off-loop password hashing."""
+
+import asyncio
+import time
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.hashing import PasswordHasher, PasswordHasherBusy, password_hasher
+from src.auth.utils import build_crypt_context
+from src.models.user import User, UserRole
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture(autouse=True)
+def fast_hashing(monkeypatch):
+    monkeypatch.setattr(password_hasher, "context", build_crypt_context(4))
+
+
+async def _user(db_session: AsyncSession, password: str, *, rounds: int = 4, is_active: bool = True) -> User:
+    user = User(
+        id=uuid.uuid4(),
+        email="login@test.com",
+        hashed_password=build_crypt_context(rounds).hash(password),
+        full_name="Login User",
+        role=UserRole.DISPATCHER,
+        is_active=is_active,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+class TestLogin:
+    async def test_login_issues_usable_token(self, client: AsyncClient, db_session: AsyncSession):
+        await _user(db_session, "correct horse")
+        resp = await client.post("/api/auth/token", json={"email": "login@test.com", "password": "correct horse"})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["token_type"] == "bearer"
+
+        resp = await client.get("/api/jobs", headers={"Authorization": f"Bearer {body['access_token']}"})
+        assert resp.status_code == 200
+
+    async def test_wrong_password_and_unknown_email_look_the_same(
+        self, client: AsyncClient, db_session: AsyncSession,
+    ):
+        await _user(db_session, "correct horse")
+        wrong = await client.post("/api/auth/token", json={"email": "login@test.com", "password": "nope"})
+        unknown = await client.post("/api/auth/token", json={"email": "ghost@test.com", "password": "nope"})
+        assert wrong.status_code == unknown.status_code == 401
+        assert wrong.json() == unknown.json()
+
+    async def test_inactive_user_rejected(self, client: AsyncClient, db_session: AsyncSession):
+        await _user(db_session, "correct horse", is_active=False)
+        resp = await client.post("/api/auth/token", json={"email": "login@test.com", "password": "correct horse"})
+        assert resp.status_code == 401
+
+    async def test_hash_upgraded_when_cost_changes(self, client: AsyncClient, db_session: AsyncSession):
+        user = await _user(db_session, "correct horse", rounds=5)
+        resp = await client.post("/api/auth/token", json={"email": "login@test.com", "password": "correct horse"})
+        assert resp.status_code == 200
+
+        await db_session.refresh(user)
+        assert user.hashed_password.startswith("$2b$04$")
+
+    async def test_busy_hasher_returns_503(self, client: AsyncClient, db_session: AsyncSession, monkeypatch):
+        await _user(db_session, "correct horse")
+
+        async def busy(*args):
+            raise PasswordHasherBusy()
+
+        monkeypatch.setattr(password_hasher, "_run", busy)
+        resp = await client.post("/api/auth/token", json={"email": "login@test.com", "password": "correct horse"})
+        assert resp.status_code == 503
+        assert resp.headers["retry-after"] == "1"
+
+
+class TestPasswordHasher:
+    async def test_hashing_does_not_block_event_loop(self):
+        hasher = PasswordHasher(build_crypt_context(10), max_workers=2, max_concurrency=2, acquire_timeout=5)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await hasher.hash("pw")
+        elapsed = time.perf_counter() - start
+        task.cancel()
+        hasher.shutdown()
+        assert ticks >= int(elapsed / 0.005 * 0.5)
+
+    async def test_concurrency_limit_fails_fast(self):
+        hasher = PasswordHasher(build_crypt_context(12), max_workers=1, max_concurrency=1, acquire_timeout=0.01)
+        first = asyncio.create_task(hasher.hash("pw"))
+        await asyncio.sleep(0)
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.hash("pw")
+        await first
+        hasher.shutdown()
@@ -0,0 +1,165 @@
+"""Tests for refresh-token rotation, logout and token revocation."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.hashing import password_hasher
+from src.auth.revocation import RevocationList, revocation_list
+from src.auth.service import deactivate_user
+from src.auth.utils import build_crypt_context
+from src.models.auth_session import AuthSession, RevokedToken
+from src.models.user import User, UserRole
+
+pytestmark = pytest.mark.asyncio
+
+PASSWORD = "correct horse"
+
+
+@pytest_asyncio.fixture(autouse=True)
+def fast_hashing(monkeypatch):
+    monkeypatch.setattr(password_hasher, "context", build_crypt_context(4))
+
+
+@pytest_asyncio.fixture(autouse=True)
+def clear_revocations():
+    revocation_list.clear()
+    yield
+    revocation_list.clear()
+
+
+@pytest_asyncio.fixture()
+async def dispatcher(db_session: AsyncSession) -> User:
+    user = User(
+        id=uuid.uuid4(),
+        email="session@test.com",
+        hashed_password=build_crypt_context(4).hash(PASSWORD),
+        full_name="Session User",
+        role=UserRole.DISPATCHER,
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+async def _login(client: AsyncClient) -> dict:
+    resp = await client.post("/api/auth/token", json={"email": "session@test.com", "password": PASSWORD})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+def _bearer(tokens: dict) -> dict[str, str]:
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+class TestRefresh:
+    async def test_login_returns_refresh_token(self, client: AsyncClient, dispatcher: User):
+        tokens = await _login(client)
+        assert tokens["refresh_token"]
+
+    async def test_refresh_rotates_token(self, client: AsyncClient, dispatcher: User):
+        tokens = await _login(client)
+        resp = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert resp.status_code == 200, resp.text
+        rotated = resp.json()
+        assert rotated["refresh_token"] != tokens["refresh_token"]
+        assert (await client.get("/api/jobs", headers=_bearer(rotated))).status_code == 200
+
+    async def test_reused_refresh_token_revokes_session(self, client: AsyncClient, dispatcher: User):
+        tokens = await _login(client)
+        rotated = (await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})).json()
+
+        reuse = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert reuse.status_code == 401
+
+        # The legitimate holder is logged out too.
+        resp = await client.post("/api/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+        assert resp.status_code == 401
+        assert (await client.get("/api/jobs", headers=_bearer(rotated))).status_code == 401
+
+    async def test_malformed_refresh_token(self, client: AsyncClient):
+        resp = await client.post("/api/auth/refresh", json={"refresh_token": "not-a-token"})
+        assert resp.status_code == 401
+
+
+class TestRevocation:
+    async def test_logout_revokes_session(self, client: AsyncClient, dispatcher: User):
+        tokens = await _login(client)
+        other = await _login(client)
+
+        assert (await client.post("/api/auth/logout", headers=_bearer(tokens))).status_code == 204
+        assert (await client.get("/api/jobs", headers=_bearer(tokens))).status_code == 401
+        resp = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert resp.status_code == 401
+        # Other sessions of the same user are unaffected.
+        assert (await client.get("/api/jobs", headers=_bearer(other))).status_code == 200
+
+    async def test_deactivate_revokes_all_tokens(
+        self, client: AsyncClient, dispatcher: User, admin_headers: dict, db_session: AsyncSession,
+    ):
+        tokens = await _login(client)
+        resp = await client.post(f"/api/auth/users/{dispatcher.id}/deactivate", headers=admin_headers)
+        assert resp.status_code == 204
+
+        assert (await client.get("/api/jobs", headers=_bearer(tokens))).status_code == 401
+        resp = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert resp.status_code == 401
+
+        sessions = (await db_session.execute(select(AuthSession))).scalars().all()
+        assert sessions and all(s.revoked_at is not None for s in sessions)
+
+    async def test_revocation_applies_locally_only_on_commit(self, dispatcher: User, db_session: AsyncSession):
+        user_id = dispatcher.id
+        token_id = f"user:{user_id}"
+        issued = int((datetime.now(timezone.utc) - timedelta(minutes=1)).timestamp())
+
+        await deactivate_user(db_session, user_id)
+        assert not revocation_list.is_revoked(token_id, issued)
+        await db_session.rollback()
+        assert not revocation_list.is_revoked(token_id, issued)
+
+        await deactivate_user(db_session, user_id)
+        await db_session.commit()
+        assert revocation_list.is_revoked(token_id, issued)
+
+    async def test_deactivate_requires_admin(self, client: AsyncClient, dispatcher: User):
+        tokens = await _login(client)
+        resp = await client.post(f"/api/auth/users/{dispatcher.id}/deactivate", headers=_bearer(tokens))
+        assert resp.status_code == 403
+
+    async def test_sync_loads_revocations_from_other_workers(
+        self, client: AsyncClient, dispatcher: User, admin_headers: dict, db_session: AsyncSession,
+    ):
+        await client.post(f"/api/auth/users/{dispatcher.id}/deactivate", headers=admin_headers)
+        assert (await db_session.execute(select(RevokedToken))).scalars().all()
+
+        other_worker = RevocationList()
+        await other_worker.sync(db_session)
+        issued = int((datetime.now(timezone.utc) - timedelta(minutes=1)).timestamp())
+        assert other_worker.is_revoked(f"user:{dispatcher.id}", issued)
+        assert not other_worker.is_revoked(f"user:{uuid.uuid4()}", issued)
+
+
+class TestRevocationList:
+    async def test_tokens_issued_after_revocation_are_accepted(self):
+        revoked = RevocationList()
+        now = datetime.now(timezone.utc)
+        revoked.add("sid-1", now, now + timedelta(minutes=5))
+        assert revoked.is_revoked("sid-1", int(now.timestamp()) - 10)
+        assert not revoked.is_revoked("sid-1", int(now.timestamp()) + 10)
+
+    async def test_prune_drops_expired_entries(self):
+        revoked = RevocationList()
+        now = datetime.now(timezone.utc)
+        revoked.add("old", now - timedelta(hours=2), now - timedelta(hours=1))
+        revoked.add("live", now, now + timedelta(hours=1))
+        revoked.prune(now)
+        assert len(revoked) == 1
+        assert not revoked.is_revoked("old", None)
+        assert revoked.is_revoked("live", None)
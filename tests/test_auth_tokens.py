@@ -0,0 +1,77 @@
+"""Tests for the JWT verifier and its decoded-token cache."""
+
+import time
+
+import pytest
+from jose import JWTError, jwt
+
+from src.auth import tokens
+from src.auth.tokens import TokenVerifier
+
+
+def _claims(**overrides) -> dict:
+    return {"sub": "user-1", "role": "admin", "exp": int(time.time()) + 60, **overrides}
+
+
+@pytest.fixture()
+def verifier() -> TokenVerifier:
+    return TokenVerifier({"k1": "secret-one", "k2": "secret-two"}, "k1", "HS256", cache_size=2)
+
+
+class TestTokenVerifier:
+    def test_round_trip_sets_kid(self, verifier: TokenVerifier):
+        token = verifier.sign(_claims())
+        assert jwt.get_unverified_header(token)["kid"] == "k1"
+        assert verifier.verify(token).sub == "user-1"
+
+    def test_cache_hit_skips_decode(self, verifier: TokenVerifier, monkeypatch):
+        token = verifier.sign(_claims())
+        verifier.verify(token)
+        calls = []
+        monkeypatch.setattr(tokens.jwt, "decode", lambda *a, **kw: calls.append(a))
+        assert verifier.verify(token).role == "admin"
+        assert calls == []
+
+    def test_expired_token_not_served_from_cache(self, verifier: TokenVerifier, monkeypatch):
+        token = verifier.sign(_claims())
+        verifier.verify(token)
+        later = time.time() + 120
+        monkeypatch.setattr(tokens.time, "time", lambda: later)
+        calls = []
+        monkeypatch.setattr(tokens.jwt, "decode", lambda *a, **kw: calls.append(a) or {})
+        with pytest.raises(ValueError):
+            verifier.verify(token)
+        assert len(calls) == 1
+
+    def test_tampered_token_rejected(self, verifier: TokenVerifier):
+        token = verifier.sign(_claims())
+        verifier.verify(token)
+        with pytest.raises(JWTError):
+            verifier.verify(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+
+    def test_rotation_keeps_old_kid_until_removed(self, verifier: TokenVerifier):
+        old = verifier.sign(_claims())
+        verifier.set_keys({"k1": "secret-one", "k2": "secret-two"}, "k2")
+        new = verifier.sign(_claims())
+        assert jwt.get_unverified_header(new)["kid"] == "k2"
+        assert verifier.verify(old).sub == verifier.verify(new).sub
+
+        verifier.set_keys({"k2": "secret-two"}, "k2")
+        with pytest.raises(JWTError):
+            verifier.verify(old)
+        assert verifier.verify(new).sub == "user-1"
+
+    def test_token_without_kid_uses_active_key(self, verifier: TokenVerifier):
+        legacy = jwt.encode(_claims(), "secret-one", algorithm="HS256")
+        assert verifier.verify(legacy).sub == "user-1"
+
+    @pytest.mark.parametrize("kid", [["k1"], 1])
+    def test_non_string_kid_rejected(self, verifier: TokenVerifier, kid):
+        forged = jwt.encode(_claims(), "secret-one", algorithm="HS256", headers={"kid": kid})
+        with pytest.raises(JWTError):
+            verifier.verify(forged)
+
+    def test_cache_is_bounded(self, verifier: TokenVerifier):
+        for i in range(5):
+            verifier.verify(verifier.sign(_claims(sub=f"user-{i}")))
+        assert len(verifier._cache) == 2
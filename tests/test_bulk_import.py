@@ -0,0 +1,190 @@
+"""Tests for the admin CSV import of customers and drivers."""
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.bulk_import.service import CUSTOMERS, DRIVERS, csv_records, import_csv
+from src.config import settings
+from src.models import Base
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.user import User, UserRole
+
+pytestmark = pytest.mark.asyncio
+
+CSV_HEADERS = {"Content-Type": "text/csv"}
+
+# The COPY upsert only runs on PostgreSQL; point COURIER_TEST_DATABASE_URL at
+# a scratch database (its tables are dropped) to run those tests.
+postgres_only = pytest.mark.skipif(
+    not settings.test_database_url.startswith("postgresql"),
+    reason="needs COURIER_TEST_DATABASE_URL pointing at PostgreSQL",
+)
+
+
+@pytest_asyncio.fixture()
+async def pg_session():
+    engine = create_async_engine(settings.test_database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+async def _import(client: AsyncClient, headers: dict, kind: str, body: str) -> dict:
+    resp = await client.post(
+        f"/api/admin/import/{kind}", content=body.encode(), headers={**headers, **CSV_HEADERS},
+    )
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+class TestCsvStream:
+    async def test_quoted_fields_across_chunks(self):
+        data = 'name,notes\r\n"Smith, J","line one\r\nline ""two"""\r\nplain,é\r\n'.encode()
+        for size in (1, 3, 7, len(data)):
+            records = [record async for batch in csv_records(_chunks(data, size), 10_000) for record in batch]
+            assert records == [["name", "notes"], ["Smith, J", 'line one\r\nline "two"'], ["plain", "é"]], size
+
+    async def test_only_cr_and_lf_end_lines(self):
+        data = "name,notes\rform\x0cfeed,next\x85line\r\nsep\u2028arator,x\n".encode()
+        for size in (1, 2, len(data)):
+            records = [record async for batch in csv_records(_chunks(data, size), 10_000) for record in batch]
+            assert records == [["name", "notes"], ["form\x0cfeed", "next\x85line"], ["sep\u2028arator", "x"]], size
+
+    async def test_upload_limit(self, client: AsyncClient, admin_headers: dict, monkeypatch):
+        monkeypatch.setattr(settings, "import_max_upload_bytes", 64)
+        body = "company_name,contact_name,contact_email\n" + "A,B,a@example.com\n" * 10
+        resp = await client.post(
+            "/api/admin/import/customers", content=body.encode(), headers={**admin_headers, **CSV_HEADERS},
+        )
+        assert resp.status_code == 413
+
+
+class TestCustomerImport:
+    async def test_upserts_on_contact_email_and_reports_bad_rows(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, db_session: AsyncSession,
+    ):
+        body = (
+            "company_name,contact_name,contact_email,contact_phone\n"
+            "Acme,Road Runner,rr@acme.example,555-0100\n"
+            "Test Corp Ltd,Jane Doe,jane@testcorp.com,\n"
+            "Broken,Nobody,not-an-email,\n"
+            "Short,Row\n"
+            ",Missing Company,mc@example.com,\n"
+        )
+        result = await _import(client, admin_headers, "customers", body)
+        assert result["created"] == 1
+        assert result["updated"] == 1
+        assert result["failed"] == 3
+        assert [error["row"] for error in result["errors"]] == [4, 5, 6]
+        assert result["errors"][0]["errors"][0].startswith("contact_email")
+        assert result["errors"][1]["errors"] == ["expected 4 fields, got 2"]
+        assert result["errors"][2]["errors"][0].startswith("company_name")
+
+        await db_session.refresh(customer)
+        assert customer.company_name == "Test Corp Ltd"
+        acme = await db_session.scalar(select(Customer).where(Customer.contact_email == "rr@acme.example"))
+        assert acme.contact_phone == "555-0100"
+
+    async def test_large_import_in_chunks(
+        self, client: AsyncClient, admin_headers: dict, db_session: AsyncSession, monkeypatch,
+    ):
+        monkeypatch.setattr(settings, "import_chunk_rows", 500)
+        rows = "".join(f"Company {i},Contact {i},c{i}@example.com,\n" for i in range(2_000))
+        body = "company_name,contact_name,contact_email,contact_phone\n" + rows
+        assert (await _import(client, admin_headers, "customers", body))["created"] == 2_000
+        result = await _import(client, admin_headers, "customers", body)
+        assert (result["created"], result["updated"], result["failed"]) == (0, 2_000, 0)
+        assert await db_session.scalar(select(func.count()).select_from(Customer)) == 2_000
+
+    async def test_rejects_bad_header(self, client: AsyncClient, admin_headers: dict):
+        resp = await client.post(
+            "/api/admin/import/customers",
+            content=b"company,contact_name,contact_email\nA,B,a@example.com\n",
+            headers={**admin_headers, **CSV_HEADERS},
+        )
+        assert resp.status_code == 422
+        assert "unknown columns: company" in resp.json()["detail"]
+
+    async def test_admin_only(self, client: AsyncClient, driver_headers: dict):
+        resp = await client.post(
+            "/api/admin/import/customers", content=b"", headers={**driver_headers, **CSV_HEADERS},
+        )
+        assert resp.status_code == 403
+
+
+class TestDriverImport:
+    async def test_creates_and_updates_driver_accounts(
+        self, client: AsyncClient, admin_headers: dict, driver: Driver, db_session: AsyncSession,
+    ):
+        body = (
+            "email,full_name,vehicle_type,license_plate,is_available\n"
+            "new@drivers.example,New Driver,cargo_bike,,yes\n"
+            "driver@test.com,Driver User,van,AB12 CDE,false\n"
+            "admin@test.com,Admin,car,,\n"
+        )
+        result = await _import(client, admin_headers, "drivers", body)
+        assert (result["created"], result["updated"], result["failed"]) == (1, 1, 1)
+        assert result["errors"] == [{"row": 4, "errors": ["email: already used by a non-driver account (admin)"]}]
+
+        await db_session.refresh(driver)
+        assert (driver.vehicle_type, driver.license_plate, driver.is_available) == ("van", "AB12 CDE", False)
+
+        user = await db_session.scalar(select(User).where(User.email == "new@drivers.example"))
+        new_driver = await db_session.scalar(select(Driver).where(Driver.user_id == user.id))
+        assert new_driver.vehicle_type == "cargo_bike"
+        assert new_driver.is_available is True
+
+        # Imported accounts have no password until one is set.
+        resp = await client.post("/api/auth/token", json={"email": "new@drivers.example", "password": "!"})
+        assert resp.status_code == 401
+
+
+@postgres_only
+class TestPostgresCopy:
+    async def test_copy_upsert_converts_uuid_enum_and_bool_columns(self, pg_session: AsyncSession):
+        body = (
+            b"email,full_name,vehicle_type,license_plate,is_available\n"
+            b"a@drivers.example,Driver A,van,AB12 CDE,no\n"
+            b"b@drivers.example,Driver B,cargo_bike,,yes\n"
+        )
+        result = await import_csv(pg_session, _chunks(body, 16), DRIVERS)
+        await pg_session.commit()
+        assert (result.created, result.updated, result.failed) == (2, 0, 0)
+
+        again = await import_csv(pg_session, _chunks(body.replace(b"Driver A", b"Driver A2"), 16), DRIVERS)
+        await pg_session.commit()
+        assert (again.created, again.updated) == (0, 2)
+
+        rows = (await pg_session.execute(
+            select(User.email, User.full_name, User.role, Driver.vehicle_type, Driver.is_available)
+            .join(Driver, Driver.user_id == User.id)
+            .order_by(User.email)
+        )).all()
+        assert [tuple(row) for row in rows] == [
+            ("a@drivers.example", "Driver A2", UserRole.DRIVER, "van", False),
+            ("b@drivers.example", "Driver B", UserRole.DRIVER, "cargo_bike", True),
+        ]
+
+    async def test_copy_upsert_in_chunks(self, pg_session: AsyncSession, monkeypatch):
+        monkeypatch.setattr(settings, "import_chunk_rows", 100)
+        rows = "".join(f"Company {i},Contact {i},c{i}@example.com,\n" for i in range(250))
+        body = ("company_name,contact_name,contact_email,contact_phone\n" + rows).encode()
+        assert (await import_csv(pg_session, _chunks(body, 4096), CUSTOMERS)).created == 250
+        await pg_session.commit()
+        assert (await import_csv(pg_session, _chunks(body, 4096), CUSTOMERS)).updated == 250
+        await pg_session.commit()
+        assert await pg_session.scalar(select(func.count()).select_from(Customer)) == 250
@@ -0,0 +1,131 @@
+"""Tests for the customer self-service job listing."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.utils import create_access_token
+from src.models.customer import Customer
+from src.models.job import Job, JobStatus
+from src.models.user import User, UserRole
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _customer_user(db_session: AsyncSession, customer: Customer | None, email: str) -> dict[str, str]:
+    user = User(
+        id=uuid.uuid4(),
+        email=email,
+        hashed_password="hashed",
+        full_name="Customer User",
+        role=UserRole.CUSTOMER,
+        customer_id=customer.id if customer else None,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return {"Authorization": f"Bearer {create_access_token(str(user.id), user.role.value)}"}
+
+
+@pytest_asyncio.fixture()
+async def customer_headers(db_session: AsyncSession, customer: Customer) -> dict[str, str]:
+    return await _customer_user(db_session, customer, "buyer@testcorp.com")
+
+
+@pytest_asyncio.fixture()
+async def other_customer(db_session: AsyncSession) -> Customer:
+    cust = Customer(
+        id=uuid.uuid4(), company_name="Other Ltd", contact_name="Sam Roe", contact_email="sam@other.com",
+    )
+    db_session.add(cust)
+    await db_session.commit()
+    return cust
+
+
+async def _jobs(db_session: AsyncSession, customer: Customer, count: int, *, same_timestamp: bool = False) -> list[Job]:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    jobs = [
+        Job(
+            id=uuid.uuid4(),
+            tracking_id=f"{customer.company_name[:3].upper()}{i:09d}",
+            customer_id=customer.id,
+            pickup_address="A",
+            dropoff_address="B",
+            status=JobStatus.DELIVERED if i % 2 else JobStatus.PENDING,
+            created_at=base if same_timestamp else base + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(jobs)
+    await db_session.commit()
+    return jobs
+
+
+async def _all_pages(client: AsyncClient, headers: dict, **params) -> list[list[dict]]:
+    pages, cursor = [], None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        resp = await client.get("/api/customer/jobs", params=query, headers=headers)
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        pages.append(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+class TestCustomerJobs:
+    async def test_lists_only_own_jobs_newest_first(
+        self, client: AsyncClient, db_session: AsyncSession, customer: Customer,
+        other_customer: Customer, customer_headers: dict,
+    ):
+        mine = await _jobs(db_session, customer, 3)
+        await _jobs(db_session, other_customer, 2)
+
+        resp = await client.get("/api/customer/jobs", headers=customer_headers)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert [j["id"] for j in body["items"]] == [str(j.id) for j in reversed(mine)]
+        assert body["next_cursor"] is None
+
+    async def test_keyset_pagination_covers_every_job_once(
+        self, client: AsyncClient, db_session: AsyncSession, customer: Customer, customer_headers: dict,
+    ):
+        jobs = await _jobs(db_session, customer, 7)
+        pages = await _all_pages(client, customer_headers, limit=3)
+        assert [len(p) for p in pages] == [3, 3, 1]
+        seen = [j["id"] for page in pages for j in page]
+        assert seen == [str(j.id) for j in reversed(jobs)]
+
+    async def test_pagination_is_stable_across_created_at_ties(
+        self, client: AsyncClient, db_session: AsyncSession, customer: Customer, customer_headers: dict,
+    ):
+        jobs = await _jobs(db_session, customer, 5, same_timestamp=True)
+        pages = await _all_pages(client, customer_headers, limit=2)
+        seen = [j["id"] for page in pages for j in page]
+        assert sorted(seen) == sorted(str(j.id) for j in jobs)
+        assert len(seen) == len(set(seen))
+
+    async def test_status_filter(
+        self, client: AsyncClient, db_session: AsyncSession, customer: Customer, customer_headers: dict,
+    ):
+        await _jobs(db_session, customer, 4)
+        resp = await client.get("/api/customer/jobs", params={"status": "delivered"}, headers=customer_headers)
+        assert {j["status"] for j in resp.json()["items"]} == {"delivered"}
+        assert len(resp.json()["items"]) == 2
+
+    async def test_invalid_cursor(self, client: AsyncClient, customer_headers: dict):
+        resp = await client.get("/api/customer/jobs", params={"cursor": "!!!"}, headers=customer_headers)
+        assert resp.status_code == 400
+
+    async def test_unlinked_customer_user_forbidden(self, client: AsyncClient, db_session: AsyncSession):
+        headers = await _customer_user(db_session, None, "orphan@test.com")
+        resp = await client.get("/api/customer/jobs", headers=headers)
+        assert resp.status_code == 403
+
+    async def test_staff_roles_rejected(self, client: AsyncClient, admin_headers: dict):
+        resp = await client.get("/api/customer/jobs", headers=admin_headers)
+        assert resp.status_code == 403
@@ -0,0 +1,143 @@
+"""Tests for job time windows and the deadline-ordered dispatch queue."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from src.config import settings
+from src.geo import haversine_m
+from src.jobs.dispatch import DispatchQueue
+from src.models.customer import Customer
+from src.models.driver import Driver
+
+pytestmark = pytest.mark.asyncio
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+PICKUP = (51.5007, -0.1246)
+DROPOFF = (51.5194, -0.1270)
+
+
+def _at(minutes: int) -> str:
+    return (NOW + timedelta(minutes=minutes)).isoformat()
+
+
+async def _create(client: AsyncClient, headers: dict, customer: Customer, label: str, **extra) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={
+            "customer_id": str(customer.id),
+            "pickup_address": f"{label} pickup",
+            "dropoff_address": f"{label} dropoff",
+            **extra,
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+async def _queue(client: AsyncClient, headers: dict, **params) -> list[dict]:
+    resp = await client.get("/api/jobs/dispatch-queue", params=params, headers=headers)
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+class TestTimeWindows:
+    async def test_windows_round_trip(self, client: AsyncClient, admin_headers: dict, customer: Customer):
+        job = await _create(
+            client, admin_headers, customer, "a",
+            pickup_window_start=_at(0), pickup_window_end=_at(30), delivery_window_end=_at(90),
+        )
+        assert datetime.fromisoformat(job["pickup_window_end"]).replace(tzinfo=timezone.utc) == NOW + timedelta(minutes=30)
+        assert job["delivery_window_start"] is None
+
+    async def test_window_must_end_after_it_starts(self, client: AsyncClient, admin_headers: dict, customer: Customer):
+        resp = await client.post(
+            "/api/jobs",
+            json={
+                "customer_id": str(customer.id),
+                "pickup_address": "a",
+                "dropoff_address": "b",
+                "pickup_window_start": _at(30),
+                "pickup_window_end": _at(0),
+            },
+            headers=admin_headers,
+        )
+        assert resp.status_code == 422
+
+
+class TestDispatchQueue:
+    async def test_orders_by_latest_start(self, client: AsyncClient, admin_headers: dict, customer: Customer):
+        loose = await _create(client, admin_headers, customer, "loose", pickup_window_end=_at(120))
+        none = await _create(client, admin_headers, customer, "none")
+        tight = await _create(client, admin_headers, customer, "tight", delivery_window_end=_at(20))
+
+        queue = await _queue(client, admin_headers)
+        assert [job["id"] for job in queue] == [tight["id"], loose["id"], none["id"]]
+        assert queue[-1]["latest_start"] is None
+
+        assert [job["id"] for job in await _queue(client, admin_headers, limit=1)] == [tight["id"]]
+
+    async def test_delivery_deadline_allows_for_the_leg(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await _create(
+            client, admin_headers, customer, "leg",
+            delivery_window_end=_at(60),
+            pickup_lat=PICKUP[0], pickup_lng=PICKUP[1], dropoff_lat=DROPOFF[0], dropoff_lng=DROPOFF[1],
+        )
+        [queued] = await _queue(client, admin_headers)
+        leg = timedelta(seconds=haversine_m(*PICKUP, *DROPOFF) / settings.eta_default_speed_mps)
+        latest_start = datetime.fromisoformat(queued["latest_start"])
+        assert queued["id"] == job["id"]
+        assert abs(latest_start - (NOW + timedelta(minutes=60) - leg)) < timedelta(seconds=1)
+
+    async def test_follows_changes(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, driver: Driver,
+    ):
+        first = await _create(client, admin_headers, customer, "first", pickup_window_end=_at(10))
+        second = await _create(client, admin_headers, customer, "second", pickup_window_end=_at(20))
+        assert [job["id"] for job in await _queue(client, admin_headers)] == [first["id"], second["id"]]
+
+        resp = await client.patch(
+            f"/api/jobs/{second['id']}", json={"pickup_window_end": _at(5)}, headers=admin_headers,
+        )
+        assert resp.status_code == 200, resp.text
+        assert [job["id"] for job in await _queue(client, admin_headers)] == [second["id"], first["id"]]
+
+        resp = await client.post(
+            f"/api/jobs/{second['id']}/assign", json={"driver_id": str(driver.id)}, headers=admin_headers,
+        )
+        assert resp.status_code == 200, resp.text
+        assert [job["id"] for job in await _queue(client, admin_headers)] == [first["id"]]
+
+    async def test_requires_dispatcher(self, client: AsyncClient, driver_headers: dict):
+        resp = await client.get("/api/jobs/dispatch-queue", headers=driver_headers)
+        assert resp.status_code == 403
+
+
+class TestHeap:
+    async def test_top_n_skips_removed_entries_without_popping(self):
+        queue = DispatchQueue()
+        ids = [uuid.uuid4() for _ in range(200)]
+        for minutes, job_id in enumerate(ids):
+            queue.push(job_id, NOW + timedelta(minutes=minutes), NOW)
+        for job_id in ids[:150:2]:
+            queue.discard(job_id)
+
+        expected = [job_id for job_id in ids if job_id not in set(ids[:150:2])][:10]
+        assert [entry.job_id for entry in queue.most_urgent(10)] == expected
+        assert [entry.job_id for entry in queue.most_urgent(10)] == expected
+        assert len(queue) == 125
+
+    async def test_compacts_when_mostly_stale(self):
+        queue = DispatchQueue()
+        ids = [uuid.uuid4() for _ in range(300)]
+        for job_id in ids:
+            queue.push(job_id, None, NOW)
+        for job_id in ids[:250]:
+            queue.discard(job_id)
+        assert len(queue._heap) <= 2 * len(queue) + 64
+        assert {entry.job_id for entry in queue.most_urgent(100)} == set(ids[250:])
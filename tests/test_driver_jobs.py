@@ -0,0 +1,96 @@
+"""Tests for the driver's active job list."""
+
+import gzip
+import json
+
+import brotli
+import pytest
+from httpx import AsyncClient
+
+from src.models.customer import Customer
+from src.models.driver import Driver
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _job(client: AsyncClient, headers: dict, customer: Customer, driver: Driver | None = None) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"},
+        headers=headers,
+    )
+    job = resp.json()
+    if driver is not None:
+        resp = await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=headers)
+        job = resp.json()
+    return job
+
+
+class TestDriverJobs:
+    async def test_lists_only_active_assigned_jobs(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        await _job(client, admin_headers, customer)  # unassigned
+        assigned = await _job(client, admin_headers, customer, driver)
+        moving = await _job(client, admin_headers, customer, driver)
+        for status in ("picked_up", "in_transit"):
+            await client.patch(f"/api/jobs/{moving['id']}", json={"status": status}, headers=admin_headers)
+        failed = await _job(client, admin_headers, customer, driver)
+        for status in ("picked_up", "in_transit", "failed"):
+            await client.patch(f"/api/jobs/{failed['id']}", json={"status": status}, headers=admin_headers)
+
+        resp = await client.get("/api/driver/jobs", headers=driver_headers)
+        assert resp.status_code == 200, resp.text
+        jobs = resp.json()
+        assert [j["id"] for j in jobs] == [assigned["id"], moving["id"]]
+        assert set(jobs[0]) == {
+            "id", "tracking_id", "status", "pickup_address", "dropoff_address", "special_instructions", "updated_at",
+        }
+
+    async def test_if_none_match_returns_304_until_a_job_changes(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _job(client, admin_headers, customer, driver)
+        first = await client.get("/api/driver/jobs", headers=driver_headers)
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        resp = await client.get("/api/driver/jobs", headers={**driver_headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+
+        await client.patch(f"/api/jobs/{job['id']}", json={"status": "picked_up"}, headers=admin_headers)
+        resp = await client.get("/api/driver/jobs", headers={**driver_headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+    @pytest.mark.parametrize("encoding", ["br", "gzip"])
+    async def test_compresses_when_accepted(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver, encoding: str,
+    ):
+        # Enough jobs to clear the compression threshold.
+        for _ in range(4):
+            await _job(client, admin_headers, customer, driver)
+        headers = {**driver_headers, "Accept-Encoding": encoding}
+        async with client.stream("GET", "/api/driver/jobs", headers=headers) as resp:
+            raw = b"".join([chunk async for chunk in resp.aiter_raw()])
+        assert resp.headers["content-encoding"] == encoding
+        assert resp.headers["vary"] == "Accept-Encoding"
+        decompress = gzip.decompress if encoding == "gzip" else brotli.decompress
+        assert len(json.loads(decompress(raw))) == 4
+
+    async def test_small_bodies_are_not_compressed(
+        self, client: AsyncClient, driver_headers: dict, driver: Driver,
+    ):
+        resp = await client.get("/api/driver/jobs", headers={**driver_headers, "Accept-Encoding": "gzip"})
+        assert resp.json() == []
+        assert "content-encoding" not in resp.headers
+
+    async def test_requires_driver_role(self, client: AsyncClient, admin_headers: dict):
+        resp = await client.get("/api/driver/jobs", headers=admin_headers)
+        assert resp.status_code == 403
+
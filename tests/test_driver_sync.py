@@ -0,0 +1,152 @@
+"""Tests for the offline driver sync endpoint."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from src.config import settings
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.job import Job
+from src.models.job_status_event import JobStatusEvent
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _assigned_job(client: AsyncClient, headers: dict, customer: Customer, driver: Driver) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"},
+        headers=headers,
+    )
+    job = resp.json()
+    resp = await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=headers)
+    return resp.json()
+
+
+def _op(key: str, job_id: str, status: str, minutes_ago: int = 0, **extra) -> dict:
+    ts = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    return {"idempotency_key": key, "job_id": job_id, "status": status, "client_timestamp": ts.isoformat(), **extra}
+
+
+class TestDriverSync:
+    async def test_initial_sync_returns_active_jobs(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        resp = await client.post("/api/driver/sync", json={}, headers=driver_headers)
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert data["results"] == []
+        assert [j["id"] for j in data["jobs"]] == [job["id"]]
+        assert data["sync_token"]
+
+    async def test_batch_applied_in_order_with_pod(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver, db_session,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        ops = [
+            _op("k1", job["id"], "picked_up", minutes_ago=30),
+            _op("k2", job["id"], "in_transit", minutes_ago=20),
+            _op("k3", job["id"], "delivered", minutes_ago=5, pod={"signed_by": "Neighbour"}),
+        ]
+        resp = await client.post("/api/driver/sync", json={"operations": ops}, headers=driver_headers)
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert [r["outcome"] for r in data["results"]] == ["applied"] * 3
+        assert data["jobs"][0]["status"] == "delivered"
+
+        resp = await client.get(f"/api/jobs/{job['id']}/pod", headers=admin_headers)
+        assert resp.json()["signed_by"] == "Neighbour"
+
+        events = (await db_session.execute(
+            select(JobStatusEvent).where(JobStatusEvent.source == "sync").order_by(JobStatusEvent.occurred_at)
+        )).scalars().all()
+        assert [e.idempotency_key for e in events] == ["k1", "k2", "k3"]
+
+    async def test_replayed_keys_are_duplicates(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        ops = [_op("same-key", job["id"], "picked_up")]
+        await client.post("/api/driver/sync", json={"operations": ops}, headers=driver_headers)
+        resp = await client.post("/api/driver/sync", json={"operations": ops}, headers=driver_headers)
+        assert resp.json()["results"][0]["outcome"] == "duplicate"
+
+    async def test_invalid_transition_rejected_without_aborting_batch(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        first = await _assigned_job(client, admin_headers, customer, driver)
+        second = await _assigned_job(client, admin_headers, customer, driver)
+        ops = [
+            _op("a", first["id"], "delivered"),
+            _op("b", second["id"], "picked_up"),
+        ]
+        resp = await client.post("/api/driver/sync", json={"operations": ops}, headers=driver_headers)
+        results = resp.json()["results"]
+        assert results[0]["outcome"] == "rejected"
+        assert "Invalid status transition" in results[0]["detail"]
+        assert results[1]["outcome"] == "applied"
+
+    async def test_delta_since_token(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver, monkeypatch,
+    ):
+        monkeypatch.setattr(settings, "sync_lag_seconds", 0)
+        first = await _assigned_job(client, admin_headers, customer, driver)
+        resp = await client.post("/api/driver/sync", json={}, headers=driver_headers)
+        token = resp.json()["sync_token"]
+
+        resp = await client.post("/api/driver/sync", json={"sync_token": token}, headers=driver_headers)
+        assert resp.json()["jobs"] == []
+
+        second = await _assigned_job(client, admin_headers, customer, driver)
+        resp = await client.post("/api/driver/sync", json={"sync_token": token}, headers=driver_headers)
+        assert [j["id"] for j in resp.json()["jobs"]] == [second["id"]]
+        assert first["id"] != second["id"]
+
+    async def test_late_commit_within_lag_is_not_skipped(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver, db_session,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        resp = await client.post("/api/driver/sync", json={}, headers=driver_headers)
+        token = resp.json()["sync_token"]
+
+        # A change stamped before that sync whose transaction only committed after it.
+        stamped = datetime.now(timezone.utc) - timedelta(seconds=settings.sync_lag_seconds / 2)
+        await db_session.execute(update(Job).where(Job.id == uuid.UUID(job["id"])).values(updated_at=stamped))
+        await db_session.commit()
+
+        resp = await client.post("/api/driver/sync", json={"sync_token": token}, headers=driver_headers)
+        assert [j["id"] for j in resp.json()["jobs"]] == [job["id"]]
+
+    async def test_other_drivers_job_rejected(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict, customer: Customer,
+    ):
+        resp = await client.post(
+            "/api/jobs",
+            json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"},
+            headers=admin_headers,
+        )
+        ops = [_op("x", resp.json()["id"], "picked_up")]
+        resp = await client.post("/api/driver/sync", json={"operations": ops}, headers=driver_headers)
+        assert resp.json()["results"][0]["outcome"] == "rejected"
+
+    async def test_dispatcher_statuses_not_syncable(
+        self, client: AsyncClient, driver_headers: dict,
+    ):
+        ops = [_op("x", "00000000-0000-0000-0000-000000000000", "assigned")]
+        resp = await client.post("/api/driver/sync", json={"operations": ops}, headers=driver_headers)
+        assert resp.status_code == 422
+
+    async def test_admin_cannot_use_sync(self, client: AsyncClient, admin_headers: dict):
+        resp = await client.post("/api/driver/sync", json={}, headers=admin_headers)
+        assert resp.status_code == 403
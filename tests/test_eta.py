@@ -0,0 +1,148 @@
+"""Tests for learned travel speeds and tracking ETAs."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.eta import speeds
+from src.eta.service import job_eta
+from src.geo import haversine_m
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.job import Job, JobStatus
+from src.models.job_status_event import JobStatusEvent
+from src.tracking import service as tracking_service
+
+pytestmark = pytest.mark.asyncio
+
+PICKUP = (51.5007, -0.1246)
+DROPOFF = (51.5194, -0.1270)
+LEG_M = haversine_m(*PICKUP, *DROPOFF)
+
+
+@pytest.fixture(autouse=True)
+def _empty_speed_table():
+    speeds.speed_table.replace([])
+    yield
+    speeds.speed_table.replace([])
+
+
+async def _delivered(db: AsyncSession, customer: Customer, driver: Driver, started_at: datetime, seconds: float):
+    job = Job(
+        id=uuid.uuid4(), tracking_id=uuid.uuid4().hex[:13].upper(), status=JobStatus.DELIVERED,
+        customer_id=customer.id, driver_id=driver.id, pickup_address="A", dropoff_address="B",
+        pickup_lat=PICKUP[0], pickup_lng=PICKUP[1], dropoff_lat=DROPOFF[0], dropoff_lng=DROPOFF[1],
+    )
+    db.add(job)
+    db.add(JobStatusEvent(
+        job_id=job.id, from_status=JobStatus.PICKED_UP, to_status=JobStatus.IN_TRANSIT, occurred_at=started_at,
+    ))
+    db.add(JobStatusEvent(
+        job_id=job.id, from_status=JobStatus.IN_TRANSIT, to_status=JobStatus.DELIVERED,
+        occurred_at=started_at + timedelta(seconds=seconds),
+    ))
+    await db.flush()
+
+
+class TestSpeedTable:
+    async def test_hourly_speed_with_fallbacks(self, monkeypatch):
+        monkeypatch.setattr(settings, "eta_min_samples", 3)
+        speeds.speed_table.replace([
+            ("cargo_bike", 8, 3000.0, 1000.0, 3),   # 3 m/s at 08:00
+            ("cargo_bike", 9, 5000.0, 1000.0, 1),   # too few samples
+        ])
+        at = datetime(2026, 10, 19, 8, 30, tzinfo=timezone.utc)
+        assert speeds.speed_table.speed("cargo_bike", at) == pytest.approx(3.0)
+        # All-day speed: 8000 m over 2000 s.
+        assert speeds.speed_table.speed("cargo_bike", at.replace(hour=9)) == pytest.approx(4.0)
+        assert speeds.speed_table.speed("van", at) == settings.eta_default_speed_mps
+
+    async def test_hours_are_local(self, monkeypatch):
+        monkeypatch.setattr(settings, "eta_min_samples", 1)
+        monkeypatch.setattr(settings, "eta_timezone", "Europe/London")
+        speeds.speed_table.replace([("van", 9, 8000.0, 1000.0, 1), ("van", 10, 1000.0, 1000.0, 1)])
+        # 08:30 UTC is 09:30 BST.
+        assert speeds.speed_table.speed("van", datetime(2026, 6, 1, 8, 30, tzinfo=timezone.utc)) == 8.0
+
+
+class TestTraining:
+    async def test_train_and_load(self, db_session: AsyncSession, customer: Customer, driver: Driver, monkeypatch):
+        monkeypatch.setattr(settings, "eta_min_samples", 2)
+        started = (datetime.now(timezone.utc) - timedelta(days=1)).replace(hour=14, minute=0)
+        await _delivered(db_session, customer, driver, started, 600)
+        await _delivered(db_session, customer, driver, started + timedelta(minutes=5), 400)
+        await _delivered(db_session, customer, driver, started, 5)  # mis-tap, ignored
+        await _delivered(db_session, customer, driver, started - timedelta(days=60), 500)  # outside window
+
+        assert await speeds.train(db_session, days=30) == 2
+        await speeds.speed_table.load(db_session)
+        assert speeds.speed_table.speed(driver.vehicle_type, started) == pytest.approx(2 * LEG_M / 1000)
+
+
+class TestJobEta:
+    async def test_estimates_from_recent_position(self):
+        now = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+        job = Job(
+            status=JobStatus.IN_TRANSIT, updated_at=now - timedelta(hours=1),
+            pickup_lat=PICKUP[0], pickup_lng=PICKUP[1], dropoff_lat=DROPOFF[0], dropoff_lng=DROPOFF[1],
+        )
+        driver = Driver(vehicle_type="bike", last_lat=PICKUP[0], last_lng=PICKUP[1], last_position_at=now)
+        eta = job_eta(job, driver, now)
+        expected = now + timedelta(seconds=LEG_M / settings.eta_default_speed_mps)
+        assert abs((eta - expected).total_seconds()) < 1
+
+        # Without a recent fix the leg is assumed to have started at the last status change.
+        driver.last_position_at = now - timedelta(hours=2)
+        assert job_eta(job, driver, now) == now
+
+    async def test_none_when_not_in_flight(self):
+        job = Job(status=JobStatus.PENDING, dropoff_lat=DROPOFF[0], dropoff_lng=DROPOFF[1])
+        assert job_eta(job, Driver(vehicle_type="van"), datetime.now(timezone.utc)) is None
+
+
+class TestTrackingEta:
+    async def test_eta_follows_position_updates(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        resp = await client.post(
+            "/api/jobs",
+            json={
+                "customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B",
+                "pickup_lat": PICKUP[0], "pickup_lng": PICKUP[1],
+                "dropoff_lat": DROPOFF[0], "dropoff_lng": DROPOFF[1],
+            },
+            headers=admin_headers,
+        )
+        job = resp.json()
+        tracking_url = f"/api/tracking/{job['tracking_id']}"
+        assert (await client.get(tracking_url)).json()["eta"] is None
+
+        await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=admin_headers)
+        for status in ("picked_up", "in_transit"):
+            await client.patch(f"/api/jobs/{job['id']}", json={"status": status}, headers=admin_headers)
+
+        async def _report(lat: float, lng: float) -> None:
+            fix = {"lat": lat, "lng": lng, "recorded_at": datetime.now(timezone.utc).isoformat()}
+            resp = await client.post("/api/driver/positions", json={"fixes": [fix]}, headers=driver_headers)
+            assert resp.status_code == 200
+
+        await _report(*PICKUP)
+        far = await client.get(tracking_url)
+        assert far.json()["eta"] is not None
+
+        halfway = ((PICKUP[0] + DROPOFF[0]) / 2, (PICKUP[1] + DROPOFF[1]) / 2)
+        await _report(*halfway)
+        near = await client.get(tracking_url)
+        assert near.headers["etag"] != far.headers["etag"]
+        assert datetime.fromisoformat(near.json()["eta"]) < datetime.fromisoformat(far.json()["eta"])
+
+        # Computed again through the batch query, not served from the cache.
+        tracking_service.tracking_responses.clear()
+        batch = await client.post("/api/tracking/batch", json={"tracking_ids": [job["tracking_id"]]})
+        batch_eta = datetime.fromisoformat(batch.json()["results"][job["tracking_id"]]["eta"])
+        assert abs((batch_eta - datetime.fromisoformat(near.json()["eta"])).total_seconds()) <= 1
@@ -0,0 +1,168 @@
+"""Tests for geofence-triggered status transitions."""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from src.config import settings
+from src.drivers import geofence
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.job_status_event import JobStatusEvent
+
+pytestmark = pytest.mark.asyncio
+
+PICKUP = (51.5007, -0.1246)
+DROPOFF = (51.5194, -0.1270)
+FAR_AWAY = (51.4700, -0.0200)
+
+
+async def _assigned_job(client: AsyncClient, headers: dict, customer: Customer, driver: Driver) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={
+            "customer_id": str(customer.id),
+            "pickup_address": "Westminster",
+            "dropoff_address": "Bloomsbury",
+            "pickup_lat": PICKUP[0], "pickup_lng": PICKUP[1],
+            "dropoff_lat": DROPOFF[0], "dropoff_lng": DROPOFF[1],
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    resp = await client.post(f"/api/jobs/{resp.json()['id']}/assign", json={"driver_id": str(driver.id)}, headers=headers)
+    return resp.json()
+
+
+def _fix(point: tuple[float, float], seconds: int = 0, **extra) -> dict:
+    recorded_at = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return {"lat": point[0], "lng": point[1], "recorded_at": recorded_at.isoformat(), **extra}
+
+
+async def _status(client: AsyncClient, headers: dict, job: dict) -> str:
+    return (await client.get(f"/api/jobs/{job['id']}", headers=headers)).json()["status"]
+
+
+class TestGeofenceTransitions:
+    async def test_arriving_at_pickup_marks_picked_up(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver, db_session,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        resp = await client.post(
+            "/api/driver/positions", json={"fixes": [_fix(FAR_AWAY, 1), _fix(PICKUP, 2)]}, headers=driver_headers,
+        )
+        assert resp.status_code == 200, resp.text
+        [event] = resp.json()["events"]
+        assert event["job_id"] == job["id"]
+        assert event["fence"] == "pickup"
+        assert event["status"] == "picked_up"
+        assert event["applied"] is True
+        assert await _status(client, admin_headers, job) == "picked_up"
+
+        result = await db_session.execute(
+            select(JobStatusEvent.source).where(JobStatusEvent.to_status == "picked_up")
+        )
+        assert result.scalar_one() == geofence.GEOFENCE_SOURCE
+
+    async def test_full_route_in_one_batch_proposes_delivery(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        # Out of order on purpose: fixes are evaluated by recorded_at.
+        fixes = [_fix(DROPOFF, 3), _fix(PICKUP, 1), _fix(DROPOFF, 4), _fix(FAR_AWAY, 2)]
+        resp = await client.post("/api/driver/positions", json={"fixes": fixes}, headers=driver_headers)
+        events = [(e["status"], e["applied"]) for e in resp.json()["events"]]
+        assert events == [("picked_up", True), ("in_transit", True), ("delivered", False)]
+        assert await _status(client, admin_headers, job) == "in_transit"
+
+    async def test_jitter_near_pickup_does_not_leave(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        # ~110 m north: outside the entry radius but inside the exit radius.
+        nearby = (PICKUP[0] + 0.001, PICKUP[1])
+        fixes = [_fix(PICKUP, 1), _fix(nearby, 2), _fix(PICKUP, 3)]
+        resp = await client.post("/api/driver/positions", json={"fixes": fixes}, headers=driver_headers)
+        assert [e["status"] for e in resp.json()["events"]] == ["picked_up"]
+        assert await _status(client, admin_headers, job) == "picked_up"
+
+    async def test_inaccurate_and_stale_fixes_are_ignored(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        fixes = [
+            _fix(PICKUP, 1, accuracy_m=settings.geofence_max_accuracy_m + 1),
+            _fix(PICKUP, -3600),  # before the job was assigned
+        ]
+        resp = await client.post("/api/driver/positions", json={"fixes": fixes}, headers=driver_headers)
+        assert resp.json()["events"] == []
+        assert await _status(client, admin_headers, job) == "assigned"
+
+    async def test_requires_a_driver(self, client: AsyncClient, admin_headers: dict):
+        resp = await client.post("/api/driver/positions", json={"fixes": [_fix(PICKUP)]}, headers=admin_headers)
+        assert resp.status_code == 403
+
+
+class TestGeofenceIndex:
+    async def test_fences_are_cached_until_a_job_is_assigned(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver, monkeypatch,
+    ):
+        loads = []
+        original = geofence._load_fences
+
+        async def _counting(db, driver_id):
+            loads.append(driver_id)
+            return await original(db, driver_id)
+
+        monkeypatch.setattr(geofence, "_load_fences", _counting)
+        await _assigned_job(client, admin_headers, customer, driver)
+        for _ in range(3):
+            await client.post("/api/driver/positions", json={"fixes": [_fix(FAR_AWAY)]}, headers=driver_headers)
+        assert len(loads) == 1
+
+        second = await _assigned_job(client, admin_headers, customer, driver)
+        resp = await client.post("/api/driver/positions", json={"fixes": [_fix(PICKUP, 1)]}, headers=driver_headers)
+        assert len(loads) == 2
+        assert second["id"] in {e["job_id"] for e in resp.json()["events"]}
+
+    async def test_manual_change_drops_cached_fences(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict,
+        customer: Customer, driver: Driver,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        await client.post("/api/driver/positions", json={"fixes": [_fix(FAR_AWAY)]}, headers=driver_headers)
+        assert len(geofence.geofence_index) == 1
+        await client.patch(f"/api/jobs/{job['id']}", json={"status": "picked_up"}, headers=admin_headers)
+        assert len(geofence.geofence_index) == 0
+
+    async def test_distance_matches_haversine(self):
+        fence = geofence.Fence.around(*PICKUP)
+        lat, lng = PICKUP[0] + 0.0004, PICKUP[1] + 0.0009
+        phi1, phi2 = math.radians(PICKUP[0]), math.radians(lat)
+        a = (
+            math.sin((phi2 - phi1) / 2) ** 2
+            + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng - PICKUP[1]) / 2) ** 2
+        )
+        haversine_m = 2 * 6_371_000.0 * math.asin(math.sqrt(a))
+        approx_m = math.sqrt(fence.distance_sq(lat, lng) / geofence.radius_sq(1.0))
+        assert approx_m == pytest.approx(haversine_m, rel=1e-3)
+
+
+class TestJobCoordinates:
+    async def test_coordinates_must_come_in_pairs(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        resp = await client.post(
+            "/api/jobs",
+            json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B", "pickup_lat": 51.5},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 422
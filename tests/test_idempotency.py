@@ -0,0 +1,103 @@
+"""Tests for Idempotency-Key handling on job endpoints."""
+
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from src.idempotency import IdempotencyStore, StoredResponse, idempotency_store
+from src.models.customer import Customer
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture(autouse=True)
+def _clear_store():
+    idempotency_store.clear()
+    yield
+    idempotency_store.clear()
+
+
+def _job_body(customer: Customer) -> dict:
+    return {"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"}
+
+
+class TestIdempotentJobCreation:
+    async def test_retry_replays_original_response(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        headers = {**admin_headers, "Idempotency-Key": "create-1"}
+        first = await client.post("/api/jobs", json=_job_body(customer), headers=headers)
+        second = await client.post("/api/jobs", json=_job_body(customer), headers=headers)
+
+        assert first.status_code == second.status_code == 201
+        assert second.json() == first.json()
+        assert second.headers["idempotent-replayed"] == "true"
+
+        resp = await client.get("/api/jobs", headers=admin_headers)
+        assert len(resp.json()) == 1
+
+    async def test_concurrent_duplicates_create_one_job(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        headers = {**admin_headers, "Idempotency-Key": "create-concurrent"}
+        responses = await asyncio.gather(*(
+            client.post("/api/jobs", json=_job_body(customer), headers=headers) for _ in range(5)
+        ))
+        assert {r.json()["tracking_id"] for r in responses} == {responses[0].json()["tracking_id"]}
+
+        resp = await client.get("/api/jobs", headers=admin_headers)
+        assert len(resp.json()) == 1
+
+    async def test_key_reuse_with_different_body_rejected(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        headers = {**admin_headers, "Idempotency-Key": "create-2"}
+        await client.post("/api/jobs", json=_job_body(customer), headers=headers)
+        resp = await client.post(
+            "/api/jobs", json={**_job_body(customer), "pickup_address": "Elsewhere"}, headers=headers,
+        )
+        assert resp.status_code == 422
+
+    async def test_errors_are_not_recorded(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        headers = {**admin_headers, "Idempotency-Key": "create-3"}
+        body = {**_job_body(customer), "customer_id": str(uuid.uuid4())}
+        assert (await client.post("/api/jobs", json=body, headers=headers)).status_code == 404
+        assert (await client.post("/api/jobs", json=body, headers=headers)).status_code == 404
+        assert len(idempotency_store) == 0
+
+    async def test_without_key_every_request_runs(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        await client.post("/api/jobs", json=_job_body(customer), headers=admin_headers)
+        await client.post("/api/jobs", json=_job_body(customer), headers=admin_headers)
+        resp = await client.get("/api/jobs", headers=admin_headers)
+        assert len(resp.json()) == 2
+
+
+class TestIdempotencyStore:
+    async def test_bounded_size_evicts_oldest_completed(self):
+        store = IdempotencyStore(max_entries=2, ttl_seconds=60)
+        for key in ("a", "b", "c"):
+            assert await store.begin(key, "fp") is None
+            store.complete(key, StoredResponse(200, key.encode(), None))
+        assert len(store) == 2
+        assert await store.begin("a", "fp") is None
+
+    async def test_expired_entries_are_reclaimed(self):
+        store = IdempotencyStore(max_entries=10, ttl_seconds=0)
+        await store.begin("a", "fp")
+        store.complete("a", StoredResponse(200, b"x", None))
+        assert await store.begin("a", "fp") is None
+
+    async def test_waiter_takes_over_after_owner_abandons(self):
+        store = IdempotencyStore(max_entries=10, ttl_seconds=60)
+        await store.begin("a", "fp")
+        waiter = asyncio.create_task(store.begin("a", "fp"))
+        await asyncio.sleep(0)
+        store.abandon("a")
+        assert await waiter is None
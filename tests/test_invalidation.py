@@ -0,0 +1,120 @@
+"""Tests for the cache invalidation bus and the tracking response cache."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.invalidation import Invalidation, InvalidationBus, invalidation_bus
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.tracking import service as tracking_service
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.invalidated: list[str] = []
+        self.cleared = 0
+
+    def invalidate(self, entity_id: str, version: int) -> None:
+        self.invalidated.append(entity_id)
+
+    def clear(self) -> None:
+        self.cleared += 1
+
+
+@pytest.fixture()
+def recorder(monkeypatch):
+    recorder = _Recorder()
+    bus = InvalidationBus()
+    bus.subscribe("job", recorder)
+    monkeypatch.setattr(invalidation_bus, "_subscribers", bus._subscribers)
+    return recorder
+
+
+async def _job(client: AsyncClient, headers: dict, customer: Customer) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"},
+        headers=headers,
+    )
+    return resp.json()
+
+
+class TestInvalidationBus:
+    async def test_payload_round_trip(self):
+        invalidation = Invalidation("job", "5f0c3f8e-4b39-4c7e-9d6a-2f3b5f0a1c2d", 1760000000000000)
+        assert Invalidation.decode(invalidation.encode()) == invalidation
+
+    async def test_dispatched_after_commit(self, db_session: AsyncSession, recorder: _Recorder):
+        await invalidation_bus.publish(db_session, "job", "abc")
+        assert recorder.invalidated == []
+        await db_session.commit()
+        assert recorder.invalidated == ["abc"]
+
+    async def test_discarded_on_rollback(self, db_session: AsyncSession, recorder: _Recorder):
+        await db_session.execute(select(1))
+        await invalidation_bus.publish(db_session, "job", "abc")
+        await db_session.rollback()
+        await db_session.commit()
+        assert recorder.invalidated == []
+
+    async def test_job_writes_publish(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, driver: Driver, recorder: _Recorder,
+    ):
+        job = await _job(client, admin_headers, customer)
+        await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=admin_headers)
+        await client.patch(f"/api/jobs/{job['id']}", json={"pickup_address": "C"}, headers=admin_headers)
+        assert recorder.invalidated.count(job["id"]) >= 2
+
+    async def test_failed_write_does_not_publish(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, recorder: _Recorder,
+    ):
+        job = await _job(client, admin_headers, customer)
+        assert recorder.invalidated == [job["id"]]  # the creation
+        resp = await client.patch(f"/api/jobs/{job['id']}", json={"status": "delivered"}, headers=admin_headers)
+        assert resp.status_code == 409
+        assert recorder.invalidated == [job["id"]]
+
+    async def test_reset_clears_subscribers(self, recorder: _Recorder):
+        invalidation_bus.reset()
+        assert recorder.cleared == 1
+
+
+class TestTrackingResponseCache:
+    async def test_cached_until_the_job_changes(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, driver: Driver, monkeypatch,
+    ):
+        job = await _job(client, admin_headers, customer)
+        assert (await client.get(f"/api/tracking/{job['tracking_id']}")).json()["status"] == "pending"
+
+        calls = []
+        original = tracking_service.find_job
+
+        async def _counting(db, tracking_id):
+            calls.append(tracking_id)
+            return await original(db, tracking_id)
+
+        monkeypatch.setattr(tracking_service, "find_job", _counting)
+        assert (await client.get(f"/api/tracking/{job['tracking_id']}")).json()["status"] == "pending"
+        assert calls == []
+
+        await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=admin_headers)
+        assert (await client.get(f"/api/tracking/{job['tracking_id']}")).json()["status"] == "assigned"
+        assert len(calls) == 1
+
+    async def test_lookup_racing_an_invalidation_is_not_stored(self):
+        cache = tracking_service.TrackingResponseCache(max_entries=10, ttl_seconds=60)
+        generation = cache.generation
+        cache.invalidate("job-1", 1)
+        cache.put("TRACK", "job-1", "etag", b"{}", generation=generation)
+        assert cache.get("TRACK") is None
+
+    async def test_bounded(self):
+        cache = tracking_service.TrackingResponseCache(max_entries=2, ttl_seconds=60)
+        for i in range(3):
+            cache.put(f"T{i}", f"job-{i}", "etag", b"{}", generation=cache.generation)
+        assert len(cache) == 2
+        assert cache.get("T0") is None
@@ -289,3 +289,100 @@ class TestJobQueries:
     ):
         resp = await client.get(f"/api/jobs/{uuid.uuid4()}", headers=admin_headers)
         assert resp.status_code == 404
+
+
+# ── Search ────────────────────────────────────────────────────────────────
+
+
+class TestJobSearch:
+    async def _create(self, client: AsyncClient, headers: dict, customer_id: uuid.UUID, **fields) -> dict:
+        body = {
+            "customer_id": str(customer_id),
+            "pickup_address": "1 Default Rd",
+            "dropoff_address": "2 Default Rd",
+            **fields,
+        }
+        resp = await client.post("/api/jobs", json=body, headers=headers)
+        assert resp.status_code == 201
+        return resp.json()
+
+    async def test_search_by_partial_address(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        match = await self._create(client, admin_headers, customer.id, pickup_address="221B Baker Street")
+        await self._create(client, admin_headers, customer.id)
+        resp = await client.get("/api/jobs?q=baker", headers=admin_headers)
+        assert [j["id"] for j in resp.json()] == [match["id"]]
+
+    async def test_search_by_tracking_id_fragment(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await self._create(client, admin_headers, customer.id)
+        fragment = job["tracking_id"][3:8].lower()
+        resp = await client.get(f"/api/jobs?q={fragment}", headers=admin_headers)
+        assert job["id"] in [j["id"] for j in resp.json()]
+
+    async def test_short_terms_only_match_tracking_id_prefix(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await self._create(client, admin_headers, customer.id, pickup_address="Unit 7-B, Dock Rd")
+        resp = await client.get("/api/jobs", params={"q": job["tracking_id"][:2].lower()}, headers=admin_headers)
+        assert job["id"] in [j["id"] for j in resp.json()]
+        resp = await client.get("/api/jobs", params={"q": "7-"}, headers=admin_headers)
+        assert resp.json() == []
+
+    async def test_search_by_customer_name(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await self._create(client, admin_headers, customer.id)
+        resp = await client.get("/api/jobs?q=test%20corp", headers=admin_headers)
+        assert [j["id"] for j in resp.json()] == [job["id"]]
+        resp = await client.get("/api/jobs?q=nobody", headers=admin_headers)
+        assert resp.json() == []
+
+    async def test_search_combines_with_status_filter(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        await self._create(client, admin_headers, customer.id, description="Fragile vase")
+        resp = await client.get("/api/jobs?q=vase&status=pending", headers=admin_headers)
+        assert len(resp.json()) == 1
+        resp = await client.get("/api/jobs?q=vase&status=assigned", headers=admin_headers)
+        assert resp.json() == []
+
+    async def test_like_wildcards_are_literal(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        await self._create(client, admin_headers, customer.id)
+        resp = await client.get("/api/jobs?q=%25", headers=admin_headers)
+        assert resp.json() == []
+
+
+class TestJobFieldProjection:
+    async def test_list_returns_only_requested_fields(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await _create_job(client, admin_headers, customer.id)
+        resp = await client.get("/api/jobs?fields=status, tracking_id,pickup_address", headers=admin_headers)
+        assert resp.status_code == 200
+        assert resp.json() == [
+            {"tracking_id": job["tracking_id"], "status": "pending", "pickup_address": job["pickup_address"]}
+        ]
+
+    async def test_get_returns_only_requested_fields(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await _create_job(client, admin_headers, customer.id)
+        resp = await client.get(f"/api/jobs/{job['id']}?fields=id,updated_at", headers=admin_headers)
+        assert resp.status_code == 200
+        assert resp.json() == {"id": job["id"], "updated_at": job["updated_at"]}
+        resp = await client.get(f"/api/jobs/{uuid.uuid4()}?fields=id", headers=admin_headers)
+        assert resp.status_code == 404
+
+    async def test_unknown_or_empty_fields_rejected(
+        self, client: AsyncClient, admin_headers: dict,
+    ):
+        resp = await client.get("/api/jobs?fields=status,password", headers=admin_headers)
+        assert resp.status_code == 422
+        assert "password" in resp.json()["detail"]
+        resp = await client.get("/api/jobs?fields=,", headers=admin_headers)
+        assert resp.status_code == 422
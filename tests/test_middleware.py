@@ -0,0 +1,114 @@
+"""Tests for the compression and Cache-Control middleware."""
+
+import gzip
+import json
+
+import brotli
+import pytest
+import zstandard
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from src.middleware import CacheControlMiddleware, CompressionMiddleware, choose_encoding
+from src.responses import cache_control
+
+pytestmark = pytest.mark.asyncio
+
+BIG = {"rows": [{"id": i, "address": f"{i} Long Street, London"} for i in range(100)]}
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CacheControlMiddleware)
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/big", dependencies=[cache_control("public, max-age=60")])
+    async def big():
+        return BIG
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(50):
+                yield f"line {i}\n".encode()
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/binary")
+    async def binary():
+        return Response(b"\x89PNG" * 200, media_type="image/png")
+
+    @app.get("/tagged")
+    async def tagged():
+        return PlainTextResponse("x" * 500, headers={"ETag": '"abc"'})
+
+    @app.get("/missing", dependencies=[cache_control("public, max-age=60")])
+    async def missing():
+        return Response(status_code=404)
+
+    return app
+
+
+async def _raw(path: str, accept_encoding: str) -> tuple[dict, bytes]:
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as client:
+        async with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as resp:
+            body = b"".join([chunk async for chunk in resp.aiter_raw()])
+            return resp.headers, body
+
+
+class TestCompression:
+    @pytest.mark.parametrize(("encoding", "decompress"), [
+        ("gzip", gzip.decompress),
+        ("br", brotli.decompress),
+        ("zstd", lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)),
+    ])
+    async def test_encodings(self, encoding, decompress):
+        headers, body = await _raw("/big", encoding)
+        assert headers["content-encoding"] == encoding
+        assert headers["vary"] == "Accept-Encoding"
+        assert int(headers["content-length"]) == len(body)
+        assert json.loads(decompress(body)) == BIG
+
+    async def test_prefers_brotli_and_respects_q_zero(self):
+        assert choose_encoding("gzip, br, zstd", ["br", "zstd", "gzip"]) == "br"
+        assert choose_encoding("gzip, br;q=0", ["br", "zstd", "gzip"]) == "gzip"
+        assert choose_encoding("identity", ["br", "zstd", "gzip"]) is None
+
+    async def test_small_responses_are_left_alone(self):
+        headers, body = await _raw("/small", "gzip")
+        assert "content-encoding" not in headers
+        assert headers["vary"] == "Accept-Encoding"
+        assert json.loads(body) == {"ok": True}
+
+    async def test_streaming_response(self):
+        headers, body = await _raw("/stream", "gzip")
+        assert headers["content-encoding"] == "gzip"
+        assert "content-length" not in headers
+        assert gzip.decompress(body).decode().splitlines()[-1] == "line 49"
+
+    async def test_binary_types_are_not_compressed(self):
+        headers, body = await _raw("/binary", "gzip")
+        assert "content-encoding" not in headers
+        assert body.startswith(b"\x89PNG")
+
+    async def test_strong_etag_is_weakened(self):
+        headers, _ = await _raw("/tagged", "gzip")
+        assert headers["etag"] == 'W/"abc"'
+
+
+class TestCacheControl:
+    async def test_route_policy_applied(self):
+        headers, _ = await _raw("/big", "identity")
+        assert headers["cache-control"] == "public, max-age=60"
+
+    async def test_no_policy_for_errors(self):
+        headers, _ = await _raw("/missing", "identity")
+        assert "cache-control" not in headers
+
+    async def test_api_job_routes_are_not_stored(self, client: AsyncClient, admin_headers: dict):
+        resp = await client.get("/api/jobs", headers=admin_headers)
+        assert resp.headers["cache-control"] == "no-store"
@@ -0,0 +1,224 @@
+"""Tests for proof-of-delivery submission."""
+
+import io
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from PIL import Image
+
+from src.auth.utils import create_access_token
+from src.main import app
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.user import User
+from src.storage.blob import LocalBlobStore, get_blob_store
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+def blob_store(tmp_path) -> LocalBlobStore:
+    store = LocalBlobStore(tmp_path / "blobs", "/media")
+    app.dependency_overrides[get_blob_store] = lambda: store
+    return store
+
+
+async def _in_transit_job(client: AsyncClient, headers: dict, customer: Customer, driver: Driver) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"},
+        headers=headers,
+    )
+    job = resp.json()
+    await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=headers)
+    await client.patch(f"/api/jobs/{job['id']}", json={"status": "picked_up"}, headers=headers)
+    await client.patch(f"/api/jobs/{job['id']}", json={"status": "in_transit"}, headers=headers)
+    return job
+
+
+def _jpeg(size: tuple[int, int]) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, color=(200, 30, 30)).save(buf, "JPEG")
+    return buf.getvalue()
+
+
+class TestPODSubmission:
+    async def test_submit_pod_marks_delivered(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        customer: Customer,
+        driver: Driver,
+        blob_store: LocalBlobStore,
+    ):
+        job = await _in_transit_job(client, admin_headers, customer, driver)
+        resp = await client.post(
+            f"/api/jobs/{job['id']}/pod",
+            data={"signed_by": "R. Cipient", "notes": "Left with concierge"},
+            files={"signature": ("sig.png", b"\x89PNG fake", "image/png")},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 201, resp.text
+        pod = resp.json()
+        assert pod["signed_by"] == "R. Cipient"
+        assert pod["signature_url"].startswith("/media/pods/")
+        assert pod["photo_url"] is None
+
+        key = pod["signature_url"].removeprefix("/media/")
+        assert (blob_store.root / key).read_bytes() == b"\x89PNG fake"
+
+        resp = await client.get(f"/api/jobs/{job['id']}", headers=admin_headers)
+        assert resp.json()["status"] == "delivered"
+
+        resp = await client.get(f"/api/jobs/{job['id']}/pod", headers=admin_headers)
+        assert resp.status_code == 200
+        assert resp.json()["id"] == pod["id"]
+
+    async def test_photo_is_downscaled_with_thumbnail(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        customer: Customer,
+        driver: Driver,
+        blob_store: LocalBlobStore,
+    ):
+        job = await _in_transit_job(client, admin_headers, customer, driver)
+        resp = await client.post(
+            f"/api/jobs/{job['id']}/pod",
+            data={"signed_by": "R. Cipient"},
+            files={"photo": ("door.jpg", _jpeg((3200, 2400)), "image/jpeg")},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 201, resp.text
+        pod = resp.json()
+
+        with Image.open(blob_store.root / pod["photo_url"].removeprefix("/media/")) as img:
+            assert max(img.size) == 1600
+        with Image.open(blob_store.root / pod["photo_thumbnail_url"].removeprefix("/media/")) as img:
+            assert max(img.size) == 320
+
+    async def test_pod_requires_in_transit(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        customer: Customer,
+        blob_store: LocalBlobStore,
+    ):
+        resp = await client.post(
+            "/api/jobs",
+            json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"},
+            headers=admin_headers,
+        )
+        resp = await client.post(
+            f"/api/jobs/{resp.json()['id']}/pod",
+            data={"signed_by": "R. Cipient"},
+            files={"signature": ("sig.png", b"png", "image/png")},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 409
+        assert not any(p.is_file() for p in blob_store.root.rglob("*"))
+
+    async def test_rejects_unsupported_content_type(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        customer: Customer,
+        driver: Driver,
+        blob_store: LocalBlobStore,
+    ):
+        job = await _in_transit_job(client, admin_headers, customer, driver)
+        resp = await client.post(
+            f"/api/jobs/{job['id']}/pod",
+            data={"signed_by": "R. Cipient"},
+            files={"photo": ("notes.txt", b"hello", "text/plain")},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 415
+        resp = await client.get(f"/api/jobs/{job['id']}", headers=admin_headers)
+        assert resp.json()["status"] == "in_transit"
+
+    async def test_assigned_driver_can_submit_but_others_cannot(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        customer: Customer,
+        driver: Driver,
+        driver_user: User,
+        db_session,
+        blob_store: LocalBlobStore,
+    ):
+        job = await _in_transit_job(client, admin_headers, customer, driver)
+
+        other = User(
+            id=uuid.uuid4(), email="other@test.com", hashed_password="x",
+            full_name="Other Driver", role=driver_user.role,
+        )
+        db_session.add(other)
+        await db_session.commit()
+        other_headers = {"Authorization": f"Bearer {create_access_token(str(other.id), 'driver')}"}
+        resp = await client.post(
+            f"/api/jobs/{job['id']}/pod", data={"signed_by": "X"}, headers=other_headers,
+        )
+        assert resp.status_code == 403
+
+        driver_headers = {"Authorization": f"Bearer {create_access_token(str(driver_user.id), 'driver')}"}
+        resp = await client.post(
+            f"/api/jobs/{job['id']}/pod", data={"signed_by": "X"}, headers=driver_headers,
+        )
+        assert resp.status_code == 201
+
+
+class TestPODFileDownload:
+    async def test_stored_file_is_served_to_staff_only(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        driver_headers: dict,
+        customer: Customer,
+        driver: Driver,
+        blob_store: LocalBlobStore,
+    ):
+        job = await _in_transit_job(client, admin_headers, customer, driver)
+        resp = await client.post(
+            f"/api/jobs/{job['id']}/pod",
+            data={"signed_by": "R. Cipient"},
+            files={"signature": ("sig.png", b"\x89PNG fake", "image/png")},
+            headers=admin_headers,
+        )
+        url = resp.json()["signature_url"]
+
+        resp = await client.get(url, headers=admin_headers)
+        assert resp.status_code == 200
+        assert resp.content == b"\x89PNG fake"
+        assert resp.headers["content-type"] == "image/png"
+
+        resp = await client.get(url, headers=driver_headers)
+        assert resp.status_code == 403
+
+    async def test_unreferenced_or_missing_keys_are_404(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        customer: Customer,
+        driver: Driver,
+        blob_store: LocalBlobStore,
+    ):
+        stray = blob_store.root / "pods" / "stray.png"
+        stray.parent.mkdir(parents=True)
+        stray.write_bytes(b"not a pod")
+        resp = await client.get("/media/pods/stray.png", headers=admin_headers)
+        assert resp.status_code == 404
+
+        job = await _in_transit_job(client, admin_headers, customer, driver)
+        resp = await client.post(
+            f"/api/jobs/{job['id']}/pod",
+            data={"signed_by": "R. Cipient"},
+            files={"signature": ("sig.png", b"png", "image/png")},
+            headers=admin_headers,
+        )
+        url = resp.json()["signature_url"]
+        (blob_store.root / url.removeprefix("/media/")).unlink()
+        resp = await client.get(url, headers=admin_headers)
+        assert resp.status_code == 404
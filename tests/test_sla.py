@@ -0,0 +1,136 @@
+"""Tests for the SLA monitor, thresholds and breach log."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.sla import SlaBreach
+from src.sla.monitor import SlaMonitor, sla_monitor
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+async def session_factory(db_engine):
+    return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def _after(minutes: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(minutes=minutes)
+
+
+async def _create_job(client: AsyncClient, headers: dict, customer: Customer) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={"customer_id": str(customer.id), "pickup_address": "a", "dropoff_address": "b"},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+async def _breaches(session_factory) -> list[SlaBreach]:
+    async with session_factory() as db:
+        return list((await db.execute(select(SlaBreach))).scalars().all())
+
+
+class TestMonitor:
+    async def test_breach_recorded_once_when_threshold_passes(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, session_factory,
+    ):
+        job = await _create_job(client, admin_headers, customer)
+        assert await sla_monitor.tick(session_factory, now=_after(29)) == 0
+        assert await sla_monitor.tick(session_factory, now=_after(31)) == 1
+        assert await sla_monitor.tick(session_factory, now=_after(32)) == 0
+
+        [breach] = await _breaches(session_factory)
+        assert str(breach.job_id) == job["id"]
+        assert breach.status.value == "pending"
+        assert breach.threshold_seconds == 30 * 60
+        assert sla_monitor.breaches_total["pending"] >= 1
+
+    async def test_transition_restarts_the_clock(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, driver: Driver, session_factory,
+    ):
+        job = await _create_job(client, admin_headers, customer)
+        await sla_monitor.tick(session_factory, now=_after(0))
+        resp = await client.post(
+            f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=admin_headers,
+        )
+        assert resp.status_code == 200, resp.text
+
+        assert await sla_monitor.tick(session_factory, now=_after(45)) == 0
+        assert await sla_monitor.tick(session_factory, now=_after(61)) == 1
+        [breach] = await _breaches(session_factory)
+        assert breach.status.value == "assigned"
+
+    async def test_customer_override_retimes_jobs(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, session_factory,
+    ):
+        await _create_job(client, admin_headers, customer)
+        await sla_monitor.tick(session_factory, now=_after(0))
+        resp = await client.put(
+            f"/api/sla/customers/{customer.id}/thresholds",
+            json={"thresholds": {"pending": 60}},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["effective"]["pending"] == 60
+        assert resp.json()["effective"]["in_transit"] == 2 * 60 * 60
+
+        assert await sla_monitor.tick(session_factory, now=_after(2)) == 1
+        [breach] = await _breaches(session_factory)
+        assert breach.threshold_seconds == 60
+
+    async def test_workers_record_each_breach_once(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, session_factory,
+    ):
+        await _create_job(client, admin_headers, customer)
+        other_worker = SlaMonitor()
+        now = _after(31)
+        assert await sla_monitor.tick(session_factory, now=now) == 1
+        assert await other_worker.tick(session_factory, now=now) == 0
+        async with session_factory() as db:
+            assert await db.scalar(select(func.count()).select_from(SlaBreach)) == 1
+
+
+class TestSlaApi:
+    async def test_rejects_terminal_and_non_positive_thresholds(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        url = f"/api/sla/customers/{customer.id}/thresholds"
+        resp = await client.put(url, json={"thresholds": {"delivered": 60}}, headers=admin_headers)
+        assert resp.status_code == 422
+        resp = await client.put(url, json={"thresholds": {"assigned": 0}}, headers=admin_headers)
+        assert resp.status_code == 422
+
+    async def test_unknown_customer(self, client: AsyncClient, admin_headers: dict):
+        resp = await client.get(
+            "/api/sla/customers/00000000-0000-0000-0000-000000000000/thresholds", headers=admin_headers,
+        )
+        assert resp.status_code == 404
+
+    async def test_lists_breaches_and_stats(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, session_factory,
+    ):
+        job = await _create_job(client, admin_headers, customer)
+        await sla_monitor.tick(session_factory, now=_after(31))
+
+        resp = await client.get("/api/sla/breaches", params={"customer_id": str(customer.id)}, headers=admin_headers)
+        assert resp.status_code == 200, resp.text
+        [breach] = resp.json()
+        assert breach["tracking_id"] == job["tracking_id"]
+
+        resp = await client.get("/api/sla/monitor", headers=admin_headers)
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["tracked_jobs"] == 0
+
+    async def test_requires_dispatcher(self, client: AsyncClient, driver_headers: dict):
+        resp = await client.get("/api/sla/breaches", headers=driver_headers)
+        assert resp.status_code == 403
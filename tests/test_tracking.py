@@ -5,8 +5,12 @@ import uuid
 import pytest
 from httpx import AsyncClient
 
+from src.config import settings
 from src.models.customer import Customer
 from src.models.driver import Driver
+from src.ratelimit import InMemoryRateLimitBackend
+from src.tracking import ids
+from src.tracking import service as tracking_service
 
 pytestmark = pytest.mark.asyncio
 
@@ -69,3 +73,168 @@ class TestTrackingEndpoint:
         job = await _create_and_get_job(client, admin_headers, customer.id)
         resp = await client.get(f"/api/tracking/{job['tracking_id']}")
         assert resp.status_code == 200
+
+    async def test_etag_and_cache_control(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, driver: Driver,
+    ):
+        job = await _create_and_get_job(client, admin_headers, customer.id)
+        first = await client.get(f"/api/tracking/{job['tracking_id']}")
+        assert first.headers["cache-control"] == "public, max-age=15"
+        etag = first.headers["etag"]
+
+        resp = await client.get(f"/api/tracking/{job['tracking_id']}", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["cache-control"] == "public, max-age=15"
+
+        await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=admin_headers)
+        resp = await client.get(f"/api/tracking/{job['tracking_id']}", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "assigned"
+        assert resp.headers["etag"] != etag
+
+    async def test_not_found_is_not_cached(self, client: AsyncClient):
+        resp = await client.get("/api/tracking/DOESNOTEXIST")
+        assert resp.status_code == 404
+        assert "cache-control" not in resp.headers
+
+
+class TestTrackingIds:
+    async def test_new_ids_carry_a_valid_check_character(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await _create_and_get_job(client, admin_headers, customer.id)
+        tracking_id = job["tracking_id"]
+        assert len(tracking_id) == 13
+        assert ids.check_character(tracking_id[:-1]) == tracking_id[-1]
+
+    async def test_check_character_catches_single_character_typos(self):
+        tracking_id = ids.generate_tracking_id()
+        for position in range(len(tracking_id)):
+            for char in ids.ALPHABET:
+                if char == tracking_id[position]:
+                    continue
+                typo = tracking_id[:position] + char + tracking_id[position + 1:]
+                assert not ids.is_well_formed(typo, accept_legacy=False)
+
+    async def test_lookup_is_case_insensitive(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await _create_and_get_job(client, admin_headers, customer.id)
+        resp = await client.get(f"/api/tracking/{job['tracking_id'].lower()}")
+        assert resp.status_code == 200
+
+    async def test_malformed_ids_skip_the_database(self, client: AsyncClient, monkeypatch):
+        async def _fail(*_args, **_kwargs):
+            raise AssertionError("database should not be queried")
+
+        monkeypatch.setattr(tracking_service, "get_job_by_tracking_id", _fail)
+        payload = "ABCDEFGHJKLM"
+        bad_check = payload + ("0" if ids.check_character(payload) != "0" else "1")
+        for tracking_id in (bad_check, "SHORT", "has-dashes-123"):
+            resp = await client.get(f"/api/tracking/{tracking_id}")
+            assert resp.status_code == 404
+
+    async def test_unknown_ids_are_cached(self, client: AsyncClient, monkeypatch):
+        tracking_id = ids.generate_tracking_id()
+        assert (await client.get(f"/api/tracking/{tracking_id}")).status_code == 404
+        assert tracking_id in tracking_service.unknown_tracking_ids
+
+        async def _fail(*_args, **_kwargs):
+            raise AssertionError("database should not be queried")
+
+        monkeypatch.setattr(tracking_service, "get_job_by_tracking_id", _fail)
+        assert (await client.get(f"/api/tracking/{tracking_id}")).status_code == 404
+
+    async def test_legacy_ids_can_be_disabled(self):
+        assert ids.is_well_formed("ABCDEFGHJKLM", accept_legacy=True)
+        assert not ids.is_well_formed("ABCDEFGHJKLM", accept_legacy=False)
+
+
+class TestTrackingBatch:
+    async def test_results_keyed_by_id_with_unknown_listed(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        first = await _create_and_get_job(client, admin_headers, customer.id)
+        second = await _create_and_get_job(client, admin_headers, customer.id)
+        missing = ids.generate_tracking_id()
+        resp = await client.post(
+            "/api/tracking/batch",
+            json={"tracking_ids": [first["tracking_id"], second["tracking_id"].lower(), missing, "short"]},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["cache-control"] == "no-store"
+        data = resp.json()
+        assert set(data["results"]) == {first["tracking_id"], second["tracking_id"].lower()}
+        assert data["results"][first["tracking_id"]]["status"] == "pending"
+        assert data["results"][second["tracking_id"].lower()]["tracking_id"] == second["tracking_id"]
+        assert data["results"][second["tracking_id"].lower()]["pickup_address"] == "10 Sender Rd"
+        assert sorted(data["unknown"]) == sorted([missing, "short"])
+        assert missing in tracking_service.unknown_tracking_ids
+
+    async def test_matches_single_lookup_and_fills_cache(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer,
+    ):
+        job = await _create_and_get_job(client, admin_headers, customer.id)
+        resp = await client.post("/api/tracking/batch", json={"tracking_ids": [job["tracking_id"]]})
+        assert tracking_service.tracking_responses.get(job["tracking_id"]) is not None
+        single = await client.get(f"/api/tracking/{job['tracking_id']}")
+        assert resp.json()["results"][job["tracking_id"]] == single.json()
+
+    async def test_cached_ids_skip_the_database(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, monkeypatch,
+    ):
+        job = await _create_and_get_job(client, admin_headers, customer.id)
+        assert (await client.get(f"/api/tracking/{job['tracking_id']}")).status_code == 200
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("database should not be queried")
+
+        monkeypatch.setattr(tracking_service, "_tracking_id_in", _fail)
+        resp = await client.post("/api/tracking/batch", json={"tracking_ids": [job["tracking_id"]] * 3})
+        assert resp.status_code == 200
+        assert list(resp.json()["results"]) == [job["tracking_id"]]
+
+    async def test_batch_size_is_bounded(self, client: AsyncClient):
+        assert (await client.post("/api/tracking/batch", json={"tracking_ids": []})).status_code == 422
+        too_many = [ids.generate_tracking_id() for _ in range(1001)]
+        assert (await client.post("/api/tracking/batch", json={"tracking_ids": too_many})).status_code == 422
+
+    async def test_has_its_own_rate_limit(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(settings, "tracking_batch_rate_limit_burst", 1)
+        body = {"tracking_ids": [ids.generate_tracking_id()]}
+        assert (await client.post("/api/tracking/batch", json=body)).status_code == 200
+        assert (await client.post("/api/tracking/batch", json=body)).status_code == 429
+        assert (await client.get(f"/api/tracking/{ids.generate_tracking_id()}")).status_code == 404
+
+    async def test_rate_limit_is_charged_per_id(self, client: AsyncClient):
+        full = {"tracking_ids": [ids.generate_tracking_id() for _ in range(1000)]}
+        assert (await client.post("/api/tracking/batch", json=full)).status_code == 200
+        resp = await client.post("/api/tracking/batch", json={"tracking_ids": [ids.generate_tracking_id()]})
+        assert resp.status_code == 429
+        assert int(resp.headers["retry-after"]) >= 1
+
+
+class TestTrackingRateLimit:
+    async def test_burst_then_429(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(settings, "tracking_rate_limit_burst", 3)
+        monkeypatch.setattr(settings, "tracking_rate_limit_per_minute", 6)
+        statuses = [(await client.get(f"/api/tracking/{ids.generate_tracking_id()}")).status_code for _ in range(4)]
+        assert statuses == [404, 404, 404, 429]
+        resp = await client.get(f"/api/tracking/{ids.generate_tracking_id()}")
+        assert resp.status_code == 429
+        assert resp.headers["retry-after"] == "10"
+
+    async def test_buckets_are_per_client(self):
+        backend = InMemoryRateLimitBackend()
+        assert (await backend.take("tracking:1.1.1.1", rate=1, burst=1)).allowed
+        assert not (await backend.take("tracking:1.1.1.1", rate=1, burst=1)).allowed
+        assert (await backend.take("tracking:2.2.2.2", rate=1, burst=1)).allowed
+
+    async def test_tokens_refill(self):
+        now = [0.0]
+        backend = InMemoryRateLimitBackend(clock=lambda: now[0])
+        assert (await backend.take("k", rate=2, burst=1)).allowed
+        decision = await backend.take("k", rate=2, burst=1)
+        assert not decision.allowed and decision.retry_after == pytest.approx(0.5)
+        now[0] = 0.5
+        assert (await backend.take("k", rate=2, burst=1)).allowed
@@ -0,0 +1,118 @@
+"""Tests for driver trail storage, roll-up and downsampled replay."""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models.driver import Driver
+from src.models.driver_trail import DriverPosition, DriverTrailChunk
+from src.trails import codec
+from src.trails.rollup import roll_up
+
+pytestmark = pytest.mark.asyncio
+
+START = datetime(2026, 10, 18, 9, 0, tzinfo=timezone.utc)
+
+
+def _route(count: int) -> list[dict]:
+    """East along a street for half the fixes, then north: one corner."""
+    fixes = []
+    for i in range(count):
+        leg = min(i, count // 2)
+        north = max(0, i - count // 2)
+        fixes.append({
+            "lat": 51.5 + north * 0.0002,
+            "lng": -0.12 + leg * 0.0003,
+            "recorded_at": (START + timedelta(seconds=30 * i)).isoformat(),
+        })
+    return fixes
+
+
+async def _upload(client: AsyncClient, headers: dict, fixes: list[dict]) -> None:
+    resp = await client.post("/api/driver/positions", json={"fixes": fixes}, headers=headers)
+    assert resp.status_code == 200, resp.text
+
+
+def _trail_url(driver: Driver, **params) -> str:
+    query = "&".join(f"{key}={value}" for key, value in params.items())
+    start = START.isoformat().replace("+", "%2B")
+    end = (START + timedelta(hours=3)).isoformat().replace("+", "%2B")
+    return f"/api/drivers/{driver.id}/trail?start={start}&end={end}&{query}"
+
+
+class TestCodec:
+    async def test_round_trip(self):
+        points = [(51.50071, -0.12463, 0), (51.50075, -0.12401, 30), (-33.86785, 151.20732, 3599)]
+        assert codec.decode(codec.encode(points)) == points
+
+    async def test_compact(self):
+        points = [(51.5 + i * 1e-4, -0.12 + i * 1e-4, i * 5) for i in range(1000)]
+        assert len(codec.encode(points)) < 8 * len(points)
+
+    async def test_simplify_keeps_corners(self):
+        line = [(51.5, -0.12 + i * 1e-4) for i in range(50)] + [(51.5 + i * 1e-4, -0.12 + 49e-4) for i in range(1, 50)]
+        kept = codec.simplify(line, tolerance_m=1.0)
+        assert kept == [0, 49, len(line) - 1]
+        assert codec.simplify(line, tolerance_m=0) == list(range(len(line)))
+
+    async def test_zoom_tolerance(self):
+        assert codec.tolerance_for_zoom(0, 0) == pytest.approx(156543.03, rel=1e-4)
+        assert codec.tolerance_for_zoom(16, 60) == pytest.approx(156543.03 * math.cos(math.radians(60)) / 2**16)
+
+
+class TestTrailReplay:
+    async def test_raw_and_downsampled(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict, driver: Driver,
+    ):
+        await _upload(client, driver_headers, _route(200))
+        resp = await client.get(_trail_url(driver), headers=admin_headers)
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert data["raw_points"] == 200
+        assert len(data["points"]) == 200
+
+        resp = await client.get(_trail_url(driver, zoom=14), headers=admin_headers)
+        data = resp.json()
+        assert data["raw_points"] == 200
+        assert len(data["points"]) == 3
+
+    async def test_same_trail_after_roll_up(
+        self, client: AsyncClient, admin_headers: dict, driver_headers: dict, driver: Driver,
+        db_engine, db_session: AsyncSession,
+    ):
+        fixes = _route(300)  # 2.5 hours: three hourly chunks
+        await _upload(client, driver_headers, fixes[:200])
+        before = (await client.get(_trail_url(driver), headers=admin_headers)).json()["points"]
+
+        session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+        assert await roll_up(session_factory, older_than_hours=0, batch_size=70) == 200
+        assert (await db_session.scalar(select(func.count()).select_from(DriverPosition))) == 0
+        assert (await db_session.scalar(select(func.count()).select_from(DriverTrailChunk))) == 2
+
+        after = (await client.get(_trail_url(driver), headers=admin_headers)).json()["points"]
+        assert [p["recorded_at"] for p in after] == [p["recorded_at"] for p in before]
+        for old, new in zip(before, after):
+            assert new["lat"] == pytest.approx(old["lat"], abs=1e-5)
+            assert new["lng"] == pytest.approx(old["lng"], abs=1e-5)
+
+        # Late uploads for an hour already rolled up are merged into its chunk.
+        await _upload(client, driver_headers, fixes[200:])
+        assert await roll_up(session_factory, older_than_hours=0) == 100
+        chunks = (await db_session.execute(select(DriverTrailChunk.point_count))).scalars().all()
+        assert sorted(chunks) == [60, 120, 120]
+        resp = await client.get(_trail_url(driver), headers=admin_headers)
+        assert resp.json()["raw_points"] == 300
+
+    async def test_range_is_bounded(self, client: AsyncClient, admin_headers: dict, driver: Driver):
+        start = START.isoformat().replace("+", "%2B")
+        end = (START + timedelta(days=30)).isoformat().replace("+", "%2B")
+        resp = await client.get(f"/api/drivers/{driver.id}/trail?start={start}&end={end}", headers=admin_headers)
+        assert resp.status_code == 422
+
+    async def test_dispatch_only(self, client: AsyncClient, driver_headers: dict, driver: Driver):
+        resp = await client.get(_trail_url(driver), headers=driver_headers)
+        assert resp.status_code == 403
@@ -0,0 +1,139 @@
+"""Tests for webhook subscriptions and the outbox delivery worker."""
+
+import json
+
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.models.customer import Customer
+from src.models.driver import Driver
+from src.models.webhook import OutboxEvent, WebhookDeadLetter, WebhookDelivery
+from src.webhooks.signing import SIGNATURE_HEADER, TIMESTAMP_HEADER, verify
+from src.webhooks.worker import WebhookWorker
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _subscribe(client: AsyncClient, headers: dict, customer: Customer) -> dict:
+    resp = await client.post(
+        f"/api/customers/{customer.id}/webhooks",
+        json={"url": "https://hooks.example.com/courier"},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+async def _assigned_job(client: AsyncClient, headers: dict, customer: Customer, driver: Driver) -> dict:
+    resp = await client.post(
+        "/api/jobs",
+        json={"customer_id": str(customer.id), "pickup_address": "A", "dropoff_address": "B"},
+        headers=headers,
+    )
+    job = resp.json()
+    await client.post(f"/api/jobs/{job['id']}/assign", json={"driver_id": str(driver.id)}, headers=headers)
+    return job
+
+
+def _worker(db_engine, handler) -> WebhookWorker:
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    return WebhookWorker(session_factory, httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+class TestSubscriptions:
+    async def test_create_list_delete(self, client: AsyncClient, admin_headers: dict, customer: Customer):
+        created = await _subscribe(client, admin_headers, customer)
+        assert len(created["secret"]) == 64
+
+        resp = await client.get(f"/api/customers/{customer.id}/webhooks", headers=admin_headers)
+        assert [s["id"] for s in resp.json()] == [created["id"]]
+        assert "secret" not in resp.json()[0]
+
+        resp = await client.delete(f"/api/customers/{customer.id}/webhooks/{created['id']}", headers=admin_headers)
+        assert resp.status_code == 204
+        resp = await client.get(f"/api/customers/{customer.id}/webhooks", headers=admin_headers)
+        assert resp.json() == []
+
+
+class TestOutboxDelivery:
+    async def test_status_changes_written_to_outbox(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, driver: Driver, db_session,
+    ):
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        events = (await db_session.execute(select(OutboxEvent))).scalars().all()
+        assert [(e.payload["previous_status"], e.payload["status"]) for e in events] == [("pending", "assigned")]
+        assert events[0].payload["tracking_id"] == job["tracking_id"]
+
+    async def test_events_batched_and_signed_per_endpoint(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, driver: Driver, db_engine,
+    ):
+        subscription = await _subscribe(client, admin_headers, customer)
+        job = await _assigned_job(client, admin_headers, customer, driver)
+        await client.patch(f"/api/jobs/{job['id']}", json={"status": "picked_up"}, headers=admin_headers)
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(204)
+
+        worker = _worker(db_engine, handler)
+        assert await worker.run_once() == 2
+        assert await worker.run_once() == 0
+        await worker.client.aclose()
+
+        assert len(requests) == 1
+        request = requests[0]
+        body = json.loads(request.content)
+        assert [e["data"]["status"] for e in body["events"]] == ["assigned", "picked_up"]
+        assert verify(
+            subscription["secret"],
+            int(request.headers[TIMESTAMP_HEADER]),
+            request.content,
+            request.headers[SIGNATURE_HEADER],
+        )
+
+    async def test_failures_back_off_then_dead_letter(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        customer: Customer,
+        driver: Driver,
+        db_engine,
+        db_session,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(settings, "webhook_max_attempts", 2)
+        monkeypatch.setattr(settings, "webhook_backoff_base_seconds", 0)
+        await _subscribe(client, admin_headers, customer)
+        await _assigned_job(client, admin_headers, customer, driver)
+
+        worker = _worker(db_engine, lambda request: httpx.Response(503))
+        assert await worker.run_once() == 1
+        delivery = (await db_session.execute(select(WebhookDelivery))).scalar_one()
+        assert delivery.attempts == 1
+        assert delivery.last_error == "HTTP 503"
+
+        assert await worker.run_once() == 1
+        await worker.client.aclose()
+        assert (await db_session.execute(select(func.count(WebhookDelivery.id)))).scalar_one() == 0
+        dead = (await db_session.execute(select(WebhookDeadLetter))).scalar_one()
+        assert dead.attempts == 2
+        assert dead.payload["data"]["status"] == "assigned"
+
+        resp = await client.get(f"/api/customers/{customer.id}/webhooks/dead-letters", headers=admin_headers)
+        assert [d["id"] for d in resp.json()] == [str(dead.id)]
+
+    async def test_events_without_subscribers_are_dispatched_silently(
+        self, client: AsyncClient, admin_headers: dict, customer: Customer, driver: Driver, db_engine, db_session,
+    ):
+        await _assigned_job(client, admin_headers, customer, driver)
+        worker = _worker(db_engine, lambda request: httpx.Response(500))
+        assert await worker.run_once() == 0
+        await worker.client.aclose()
+        event = (await db_session.execute(select(OutboxEvent))).scalar_one()
+        assert event.dispatched_at is not None